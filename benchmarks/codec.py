@@ -0,0 +1,239 @@
+"""
+Codec micro-benchmarks: `encode_data`, `decode_data` and `detect_data_type` for every `VariantType`,
+over small and large payloads of several shapes.
+
+Each case reports the time per operation (best of `repeat` runs), the throughput over the encoded size,
+and the memory allocated by one operation as seen by tracemalloc: the peak, and the blocks still alive
+afterward (the result itself). The output is JSON, and can be stored as a baseline to compare against:
+
+    python -m benchmarks.codec
+    python -m benchmarks.codec --update-baseline  # writes benchmarks/codec_baseline.json
+    python -m benchmarks.codec --threshold 1.5  # exits with 1 when a case is 1.5x slower or bigger than the baseline
+
+`benchmarks/test_codec_benchmark.py` runs the same comparison with pytest. Timings depend on the machine:
+the comparison is skipped when the baseline was recorded on another OS or CPU architecture, or with other versions
+of Python, numpy or pandas. Regenerate the baseline where the comparison runs.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+import numpy
+import pandas
+
+from model_runner_client.grpc.generated.commons_pb2 import VariantType
+from model_runner_client.utils.datatype_transformer import decode_data, detect_data_type, encode_data
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "codec_baseline.json")
+THRESHOLD = 2.0
+TIME_FLOOR_NS = 2_000  # differences below that are noise, whatever the ratio
+ALLOCATION_FLOOR_BYTES = 4_096
+
+
+@dataclass
+class CaseResult:
+    name: str
+    variant_type: str
+    encoded_bytes: int
+    encode_ns: float
+    decode_ns: float
+    detect_ns: float
+    encode_mb_s: float
+    decode_mb_s: float
+    encode_peak_bytes: int
+    encode_blocks: int
+    decode_peak_bytes: int
+    decode_blocks: int
+
+
+def cases() -> dict[str, tuple[VariantType, Any]]:
+    """Payloads by case name. ARROW has no codec (encode_data rejects it), it is not benchmarked."""
+    rng = numpy.random.default_rng(0)
+    frame = lambda rows: pandas.DataFrame(rng.normal(size=(rows, 10)), columns=[f"feature_{index}" for index in range(10)])
+    return {
+        "none": (VariantType.NONE, None),
+        "double": (VariantType.DOUBLE, 3.14159),
+        "int": (VariantType.INT, 1 << 40),
+        "string_16": (VariantType.STRING, "x" * 16),
+        "string_64k": (VariantType.STRING, "x" * 65536),
+        "parquet_100x10": (VariantType.PARQUET, frame(100)),
+        "parquet_10000x10": (VariantType.PARQUET, frame(10000)),
+        "json_dict": (VariantType.JSON, {"falcon_location": 21.17, "time": 230.96, "dove_location": 19.16, "falcon_id": 1}),
+        "json_list_10k": (VariantType.JSON, rng.normal(size=10000).tolist()),
+        "json_nested": (VariantType.JSON, {f"key_{index}": {"values": list(range(20)), "name": f"name_{index}"} for index in range(200)}),
+        "ndarray_1k_f32": (VariantType.NDARRAY, rng.normal(size=1000).astype(numpy.float32)),
+        "ndarray_1000x100_f64": (VariantType.NDARRAY, rng.normal(size=(1000, 100))),
+        "ndarray_1m_f64": (VariantType.NDARRAY, rng.normal(size=1_000_000)),
+        "bytes_1k": (VariantType.BYTES, bytes(1024)),
+        "bytes_1m": (VariantType.BYTES, bytes(1 << 20)),
+    }
+
+
+def time_per_op(operation: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """Best time (ns) per call over `repeat` runs of at least `min_time` seconds each."""
+    loops = 1
+    while True:  # calibrate the number of calls per run
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            operation()
+        elapsed = time.perf_counter_ns() - started
+        if elapsed >= min_time * 1e9:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time * 1e9 / elapsed) + 1))
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            operation()
+        best = min(best, (time.perf_counter_ns() - started) / loops)
+    return best
+
+
+def allocations(operation: Callable[[], Any]) -> tuple[int, int]:
+    """(peak bytes, blocks alive afterward) allocated by one call."""
+    operation()  # warm caches (imports, interned objects)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start_size, _ = tracemalloc.get_traced_memory()
+        result = operation()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    del result
+    return peak - start_size, blocks
+
+
+def run_case(name: str, variant_type: VariantType, payload: Any, min_time: float, repeat: int) -> CaseResult:
+    encoded = encode_data(variant_type, payload)
+    encode = lambda: encode_data(variant_type, payload)
+    decode = lambda: decode_data(encoded, variant_type)
+
+    encode_ns = time_per_op(encode, min_time, repeat)
+    decode_ns = time_per_op(decode, min_time, repeat)
+    detect_ns = time_per_op(lambda: detect_data_type(payload), min_time, repeat)
+    encode_peak, encode_blocks = allocations(encode)
+    decode_peak, decode_blocks = allocations(decode)
+
+    throughput = lambda ns: round(len(encoded) / ns * 1000, 1)  # bytes per ns -> MB/s
+    return CaseResult(
+        name=name,
+        variant_type=VariantType.Name(variant_type),
+        encoded_bytes=len(encoded),
+        encode_ns=round(encode_ns, 1),
+        decode_ns=round(decode_ns, 1),
+        detect_ns=round(detect_ns, 1),
+        encode_mb_s=throughput(encode_ns),
+        decode_mb_s=throughput(decode_ns),
+        encode_peak_bytes=encode_peak,
+        encode_blocks=encode_blocks,
+        decode_peak_bytes=decode_peak,
+        decode_blocks=decode_blocks,
+    )
+
+
+def run(names: list[str] | None = None, min_time: float = 0.05, repeat: int = 3) -> dict[str, CaseResult]:
+    return {
+        name: run_case(name, variant_type, payload, min_time, repeat)
+        for name, (variant_type, payload) in cases().items()
+        if not names or name in names
+    }
+
+
+def regressions(results: dict[str, CaseResult], baseline: dict[str, dict], threshold: float = THRESHOLD) -> list[str]:
+    """Describe the measures exceeding `threshold` times their baseline (cases missing from the baseline are ignored)."""
+    found = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for measure in ("encode_ns", "decode_ns", "detect_ns"):
+            current, previous = getattr(result, measure), reference[measure]
+            if current > previous * threshold and current - previous > TIME_FLOOR_NS:
+                found.append(f"{name}.{measure}: {current:.0f}ns vs {previous:.0f}ns baseline")
+        for measure in ("encode_peak_bytes", "decode_peak_bytes"):
+            current, previous = getattr(result, measure), reference[measure]
+            if current > previous * threshold and current - previous > ALLOCATION_FLOOR_BYTES:
+                found.append(f"{name}.{measure}: {current} vs {previous} baseline")
+    return found
+
+
+def environment() -> dict[str, str]:
+    """What the timings depend on, stored with the baseline. Not the kernel or distribution release: they change
+    with every image update, and would disable the comparison silently."""
+    return {
+        "python": platform.python_version(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "numpy": numpy.__version__,
+        "pandas": pandas.__version__,
+    }
+
+
+def environment_mismatches(path: str = BASELINE_PATH) -> list[str]:
+    """Describe how the environment differs from the one the baseline was recorded in (empty when comparable)."""
+    with open(path) as file:
+        recorded = json.load(file)
+    return [
+        f"{key}: {current} vs {recorded.get(key)} baseline"
+        for key, current in environment().items()
+        if recorded.get(key) != current
+    ]
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict[str, dict]:
+    with open(path) as file:
+        return json.load(file)["cases"]
+
+
+def save_baseline(results: dict[str, CaseResult], path: str = BASELINE_PATH):
+    with open(path, "w") as file:
+        json.dump(
+            {
+                **environment(),
+                "cases": {name: asdict(result) for name, result in results.items()},
+            },
+            file,
+            indent=2,
+        )
+        file.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Variant codecs.")
+    parser.add_argument("--cases", nargs="*", help=f"subset of: {', '.join(cases())}")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per timing run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, help="compare with the baseline, fail above that ratio")
+    arguments = parser.parse_args()
+
+    results = run(arguments.cases, arguments.min_time, arguments.repeat)
+    print(json.dumps({name: asdict(result) for name, result in results.items()}, indent=2))
+
+    if arguments.update_baseline:
+        save_baseline(results, arguments.baseline)
+    elif arguments.threshold:
+        mismatches = environment_mismatches(arguments.baseline)
+        if mismatches:
+            print(f"Baseline recorded in another environment, not compared ({'; '.join(mismatches)})", file=sys.stderr)
+            sys.exit(0)
+        found = regressions(results, load_baseline(arguments.baseline), arguments.threshold)
+        for regression in found:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
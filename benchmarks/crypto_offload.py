@@ -0,0 +1,99 @@
+"""
+Compare auth crypto executed on the event loop vs offloaded to a `CryptoExecutor`.
+
+Simulates a fan-out where every call needs an RSA signature (gateway mode) or a wallet
+delegation verification (secure mode), and reports throughput plus the worst event loop lag.
+
+    python -m benchmarks.crypto_offload --calls 2000 --workers 4
+"""
+import argparse
+import asyncio
+import base64
+import json
+import time
+
+import base58
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from model_runner_client.security.crypto_executor import CryptoExecutor
+from model_runner_client.security.gateway_auth_interceptor import _build_auth_metadata
+from model_runner_client.security.wallet_gelegation import verify_wallet_delegation
+
+
+def build_verification() -> dict:
+    wallet_key = ed25519.Ed25519PrivateKey.generate()
+    tls_pub = b"tls-public-key"
+    message = json.dumps({"cert_pub": base64.b64encode(tls_pub).decode(), "model_id": "model", "hotkey": "hotkey"}).encode()
+    wallet_pub_b58 = base58.b58encode(wallet_key.public_key().public_bytes_raw()).decode()
+    return dict(
+        message_b64=base64.b64encode(message).decode(),
+        signature_b64=base64.b64encode(wallet_key.sign(message)).decode(),
+        wallet_pub_b58=wallet_pub_b58,
+        expected_wallet_pub_b58=wallet_pub_b58,
+        tls_pub=tls_pub,
+        expected_hotkey="hotkey",
+        expected_model_id="model",
+    )
+
+
+async def measure(calls: int, operation) -> dict:
+    loop = asyncio.get_running_loop()
+    max_lag = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal max_lag
+        while running:
+            start = loop.time()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, loop.time() - start - 0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    start_time = time.perf_counter()
+    await asyncio.gather(*(operation() for _ in range(calls)))
+    elapsed = time.perf_counter() - start_time
+    running = False
+    await ticker_task
+
+    return {"calls_per_s": round(calls / elapsed), "elapsed_s": round(elapsed, 3), "max_loop_lag_ms": round(max_lag * 1000, 2)}
+
+
+async def main(calls: int, workers: int):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pubkey_b64 = "unused"
+    verification = build_verification()
+    executor = CryptoExecutor(max_workers=workers)
+
+    async def sign_in_loop():
+        _build_auth_metadata(private_key, pubkey_b64, "model", int(time.time()))
+
+    async def sign_offloaded():
+        await executor.run(_build_auth_metadata, private_key, pubkey_b64, "model", int(time.time()))
+
+    async def verify_in_loop():
+        verify_wallet_delegation(**verification)
+
+    async def verify_offloaded():
+        await executor.verify_wallet_delegation(**verification)
+
+    results = {
+        "rsa_sign": {
+            "in_loop": await measure(calls, sign_in_loop),
+            "offloaded": await measure(calls, sign_offloaded),
+        },
+        "wallet_verify": {
+            "in_loop": await measure(calls, verify_in_loop),
+            "offloaded": await measure(calls, verify_offloaded),
+        },
+    }
+    executor.shutdown(wait=True)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.calls, arguments.workers))
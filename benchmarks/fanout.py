@@ -0,0 +1,169 @@
+"""
+End-to-end fan-out benchmark: a fake orchestrator and N fake model nodes on localhost, driven
+through `DynamicSubclassModelConcurrentRunner.call`.
+
+For each model count, reports the initialization time, the cycle latency (p50/p99), the call throughput,
+the client CPU time and peak memory. The output is JSON, to be diffed between versions.
+
+    python -m benchmarks.fanout --models 10 100 500 --cycles 50 --latency-ms 5 --latency-jitter 0.5
+    python -m benchmarks.fanout --models 1000 --processes 4 --failure-rate 0.01 --output fanout.json
+
+With `--processes 0` (default) the model servers share the benchmark's event loop, so the CPU time
+includes theirs; use `--processes N` to measure the client alone.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import resource
+import statistics
+import sys
+import time
+
+from model_runner_client.grpc.generated.commons_pb2 import Argument, Variant, VariantType
+from model_runner_client.model_concurrent_runners import DynamicSubclassModelConcurrentRunner, ModelPredictResult
+from model_runner_client.testing import FakeModelBehavior, FakeModelServer, FakeOrchestrator
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def start_servers(count: int, behavior: FakeModelBehavior, processes: int, seed: int) -> tuple[list[int], list]:
+    """Returns the ports of the model servers, and what to stop afterward (servers or processes)."""
+    if processes <= 0:
+        servers = [FakeModelServer(behavior, seed=seed + index) for index in range(count)]
+        return [await server.start() for server in servers], servers
+
+    ports, children = [], []
+    per_process = [count // processes + (1 if index < count % processes else 0) for index in range(processes)]
+    for index, process_count in enumerate(per_process):
+        if not process_count:
+            continue
+        child = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "model_runner_client.testing.fake_model_server",
+            "--count", str(process_count),
+            "--latency-ms", str(behavior.latency_ms),
+            "--latency-jitter", str(behavior.latency_jitter),
+            "--failure-rate", str(behavior.failure_rate),
+            "--timeout-rate", str(behavior.timeout_rate),
+            "--response-bytes", str(behavior.response_bytes),
+            "--seed", str(seed + index * count),
+            stdout=asyncio.subprocess.PIPE,
+        )
+        children.append(child)
+        ports.extend(int(port) for port in (await child.stdout.readline()).split())
+    return ports, children
+
+
+async def stop_servers(servers: list):
+    for server in servers:
+        if isinstance(server, FakeModelServer):
+            await server.stop()
+        else:
+            server.terminate()
+            await server.wait()
+
+
+async def run(model_count: int, arguments: argparse.Namespace) -> dict:
+    behavior = FakeModelBehavior(
+        latency_ms=arguments.latency_ms,
+        latency_jitter=arguments.latency_jitter,
+        failure_rate=arguments.failure_rate,
+        timeout_rate=arguments.timeout_rate,
+        response_bytes=arguments.response_bytes,
+    )
+    ports, servers = await start_servers(model_count, behavior, arguments.processes, arguments.seed)
+
+    orchestrator = FakeOrchestrator(init_page_size=arguments.init_page_size)
+    orchestrator_port = await orchestrator.start()
+    for index, port in enumerate(ports):
+        orchestrator.add_model(f"model_{index}", "127.0.0.1", port)
+
+    runner = DynamicSubclassModelConcurrentRunner(
+        arguments.timeout,
+        "benchmark",
+        "127.0.0.1",
+        orchestrator_port,
+        base_classname="benchmark.Model",
+        report_failure=False,
+    )
+    payload = [Argument(position=1, data=Variant(type=VariantType.STRING, value=b"x" * arguments.payload_bytes))]
+
+    try:
+        start = time.perf_counter()
+        await runner.init()
+        init_s = time.perf_counter() - start
+        connected = len(runner.model_cluster.models_run)
+
+        statuses = {status.name: 0 for status in ModelPredictResult.Status}
+        cycle_latencies = []
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        for _ in range(arguments.cycles):
+            cycle_start = time.perf_counter()
+            results = await runner.call("predict", (payload, []))
+            cycle_latencies.append(time.perf_counter() - cycle_start)
+            for result in results.values():
+                statuses[result.status.name] += 1
+        elapsed = time.perf_counter() - start
+        cpu_s = time.process_time() - cpu_start
+    finally:
+        await runner.close()
+        await orchestrator.stop()
+        await stop_servers(servers)
+
+    calls = sum(statuses.values())
+    return {
+        "models": model_count,
+        "connected": connected,
+        "init_s": round(init_s, 3),
+        "calls": calls,
+        "calls_per_s": round(calls / elapsed) if elapsed else None,
+        "cycle_p50_ms": round(percentile(cycle_latencies, 0.5) * 1000, 2),
+        "cycle_p99_ms": round(percentile(cycle_latencies, 0.99) * 1000, 2),
+        "cycle_mean_ms": round(statistics.fmean(cycle_latencies) * 1000, 2),
+        "cpu_ms_per_cycle": round(cpu_s / arguments.cycles * 1000, 2),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "statuses": statuses,
+    }
+
+
+async def main(arguments: argparse.Namespace):
+    results = [await run(model_count, arguments) for model_count in arguments.models]
+    report = {
+        "benchmark": "fanout",
+        "python": platform.python_version(),
+        "config": {key: value for key, value in vars(arguments).items() if key != "output"},
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=1.0, help="client call timeout (s)")
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="sigma of the lognormal latency distribution")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--payload-bytes", type=int, default=64)
+    parser.add_argument("--response-bytes", type=int, default=16)
+    parser.add_argument("--init-page-size", type=int, default=None)
+    parser.add_argument("--processes", type=int, default=0, help="run the model servers in that many subprocesses")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--log-level", default="WARNING")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=arguments.log_level)
+    asyncio.run(main(arguments))
@@ -0,0 +1,41 @@
+"""
+Codec regression checks against `codec_baseline.json`, not part of the default test run:
+
+    python -m pytest benchmarks
+    CODEC_BENCHMARK_THRESHOLD=1.5 python -m pytest benchmarks
+
+The checks are skipped when the baseline was recorded in another environment (OS, CPU architecture, Python, numpy
+or pandas version): regenerate it on the machine running the checks with `python -m benchmarks.codec --update-baseline`.
+"""
+import os
+
+import pytest
+
+from benchmarks.codec import BASELINE_PATH, THRESHOLD, cases, environment_mismatches, load_baseline, regressions, run_case
+from model_runner_client.grpc.generated.commons_pb2 import VariantType
+
+CASES = cases()
+
+
+@pytest.fixture(scope="module")
+def baseline() -> dict[str, dict]:
+    if not os.path.exists(BASELINE_PATH):
+        pytest.skip("No baseline, create it with: python -m benchmarks.codec --update-baseline")
+    mismatches = environment_mismatches()
+    if mismatches:
+        pytest.skip(f"Baseline recorded in another environment ({'; '.join(mismatches)}), regenerate it with: python -m benchmarks.codec --update-baseline")
+    return load_baseline()
+
+
+def test_every_variant_type_is_covered():
+    covered = {variant_type for variant_type, _ in CASES.values()}
+    assert set(VariantType.values()) - covered == {VariantType.ARROW}  # no ARROW codec yet
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_no_regression(name: str, baseline: dict[str, dict]):
+    threshold = float(os.environ.get("CODEC_BENCHMARK_THRESHOLD", THRESHOLD))
+    variant_type, payload = CASES[name]
+    result = run_case(name, variant_type, payload, min_time=0.02, repeat=3)
+
+    assert regressions({name: result}, baseline, threshold) == []
@@ -39,10 +39,10 @@ async def main():
         while True:
             payload = {'falcon_location': 21.179864629354732, 'time': 230.96231205799998, 'dove_location': 19.164986723324326, 'falcon_id': 1}
             payload_encoded = encode_data(VariantType.JSON, payload)
-            await concurrent_runner.call(method_name='tick',
-                                         args=[
-                                             Argument(position=1, data=Variant(type=VariantType.JSON, value=payload_encoded))
-                                         ])
+            # the tick result is not used: predict is sent to each model right after that model's own tick,
+            # instead of after the slowest model's tick (the cycle still includes each model's tick latency)
+            concurrent_runner.notify(method_name='tick',
+                                     arguments=([Argument(position=1, data=Variant(type=VariantType.JSON, value=payload_encoded))], []))
 
             result = await concurrent_runner.call(method_name='predict')
 
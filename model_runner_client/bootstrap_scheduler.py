@@ -0,0 +1,181 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger("model_runner_client.bootstrap_scheduler")
+
+
+class BootstrapProgress:
+    """
+    Tracks how many of the models announced by an `init` event are ready.
+
+    `wait_for(fraction)` resolves once that fraction of the models is connected, or once every model has
+    settled (ready or failed), so a first prediction cycle can start before the slowest models are up.
+    """
+
+    def __init__(self):
+        self._states: dict[str, bool | None] | None = None  # None until an init event is processed
+        self._waiters: list[tuple[float, asyncio.Future]] = []
+
+    @property
+    def started(self) -> bool:
+        return self._states is not None
+
+    @property
+    def total(self) -> int:
+        return len(self._states) if self._states else 0
+
+    @property
+    def ready(self) -> int:
+        return sum(1 for state in self._states.values() if state) if self._states else 0
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for state in self._states.values() if state is False) if self._states else 0
+
+    @property
+    def fraction(self) -> float:
+        return self.ready / self.total if self.total else 1.0
+
+    @property
+    def settled(self) -> bool:
+        return self.started and all(state is not None for state in self._states.values())
+
+    def reset(self, model_ids: set[str]):
+        self._states = {model_id: None for model_id in model_ids}
+        self._wake_up()
+
+    def extend(self, model_ids: set[str]):
+        """Track more models of the same `init` snapshot (paged snapshot)."""
+        if self._states is None:
+            self._states = {}
+        for model_id in model_ids:
+            self._states.setdefault(model_id, None)
+        self._wake_up()
+
+    def mark_ready(self, model_id: str):
+        self._mark(model_id, True)
+
+    def mark_failed(self, model_id: str):
+        self._mark(model_id, False)
+
+    def _mark(self, model_id: str, state: bool):
+        if self._states is None or model_id not in self._states:
+            return
+        self._states[model_id] = state
+        self._wake_up()
+
+    def _is_reached(self, fraction: float) -> bool:
+        return self.started and (self.fraction >= fraction or self.settled)
+
+    def _wake_up(self):
+        if not self._waiters:
+            return
+
+        pending = []
+        for fraction, future in self._waiters:
+            if future.done():
+                continue
+            if self._is_reached(fraction):
+                future.set_result(None)
+            else:
+                pending.append((fraction, future))
+        self._waiters = pending
+
+    async def wait_for(self, fraction: float = 1.0):
+        if self._is_reached(fraction):
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((fraction, future))
+        await future
+
+    def __repr__(self):
+        return f"BootstrapProgress(ready={self.ready}, failed={self.failed}, total={self.total})"
+
+
+class BootstrapScheduler:
+    """
+    Admission control for model runner initializations (TLS probe, channel_ready, Setup).
+
+    - At most `max_concurrency` connection attempts run at the same time (50 by default).
+    - At most `ramp_up_rate` connection attempts start per second (None for no limit), spreading the handshakes.
+    - A slot covers one attempt: `ModelRunner.init` releases it during its retry backoff.
+    - Models that were healthy before are admitted first.
+    """
+
+    MAX_CONCURRENCY = 50
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY, ramp_up_rate: float | None = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if ramp_up_rate is not None and ramp_up_rate <= 0:
+            raise ValueError("ramp_up_rate must be positive")
+
+        self.max_concurrency = max_concurrency
+        self.ramp_up_rate = ramp_up_rate
+        self.healthy_model_ids: set[str] = set()
+
+        self.active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._next_start_time = 0.0
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def mark_healthy(self, model_id: str):
+        self.healthy_model_ids.add(model_id)
+
+    def forget(self, model_id: str):
+        self.healthy_model_ids.discard(model_id)
+
+    @asynccontextmanager
+    async def slot(self, model_id: str):
+        priority = 0 if model_id in self.healthy_model_ids else 1
+        await self._acquire(priority)
+        try:
+            await self._ramp_up()
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int):
+        if self.active < self.max_concurrency and not self._waiters:
+            self.active += 1
+            return
+
+        waiter = (priority, next(self._sequence), asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiters, waiter)
+        try:
+            await waiter[2]
+        except asyncio.CancelledError:
+            if waiter[2].cancelled():
+                if waiter in self._waiters:  # else already skipped by `_release`
+                    self._waiters.remove(waiter)
+                    heapq.heapify(self._waiters)
+            else:
+                # the slot was handed over right before the cancellation
+                self._release()
+            raise
+
+    def _release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():  # skip the waiters cancelled but not resumed yet
+                future.set_result(None)  # hand the slot over, `active` is unchanged
+                return
+        self.active -= 1
+
+    async def _ramp_up(self):
+        if self.ramp_up_rate is None:
+            return
+
+        now = asyncio.get_running_loop().time()
+        start_time = max(now, self._next_start_time)
+        self._next_start_time = start_time + 1 / self.ramp_up_rate
+        if start_time > now:
+            await asyncio.sleep(start_time - now)
@@ -0,0 +1,151 @@
+"""
+Call lifecycle hooks, to plug tracing or metrics into `ModelConcurrentRunner` without subclassing it.
+
+    class Metrics(CallHooks):
+        def on_result(self, event: CallEvent):
+            latency_histogram.labels(event.method_name).observe(event.exec_time_us)
+
+    concurrent_runner.add_call_hooks(Metrics())
+
+Only the overridden methods are called. Without any hook registered, a call costs one attribute check.
+"""
+import logging
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from .model_concurrent_runners.model_concurrent_runner import ModelPredictResult
+    from .model_runners import ModelRunner
+
+logger = logging.getLogger("model_runner_client.call_hooks")
+
+
+class CallEvent:
+    """
+    One call to one model. Events are recycled once the call completes: read them in the hook, do not keep them.
+    `status` and `exec_time_us` are set once the call completes, `status` is None when the call raised.
+    """
+    __slots__ = ("model", "method_name", "status", "exec_time_us", "result")
+
+    def __init__(self):
+        self.model: "ModelRunner | None" = None
+        self.method_name = ""
+        self.status: "ModelPredictResult.Status | None" = None
+        self.exec_time_us = 0
+        self.result: Any = None
+
+
+class ModelEvent:
+    __slots__ = ("model",)
+
+    def __init__(self, model: "ModelRunner"):
+        self.model = model
+
+
+class CallHooks:
+    """Base class of the hooks, every method is a no-op. Hooks run on the event loop: keep them short."""
+
+    def on_dispatch(self, event: CallEvent):
+        """A call is about to be sent."""
+
+    def on_result(self, event: CallEvent):
+        """A call succeeded (SUCCESS), or was answered from a result cache (CACHED)."""
+
+    def on_timeout(self, event: CallEvent):
+        """A call timed out, or failed at the gRPC level."""
+
+    def on_failure(self, event: CallEvent):
+        """The model answered with an error."""
+
+    def on_skip(self, event: CallEvent):
+        """The model was not called (unhealthy)."""
+
+    def on_reconnect(self, event: ModelEvent):
+        """A model is about to be reconnected, `event.model` is the runner being replaced."""
+
+    def on_model_added(self, event: ModelEvent):
+        """A model runner is ready and serves the calls."""
+
+    def on_model_removed(self, event: ModelEvent):
+        """A model runner stopped serving the calls."""
+
+
+_EVENTS = ("on_dispatch", "on_result", "on_timeout", "on_failure", "on_skip", "on_reconnect", "on_model_added", "on_model_removed")
+
+
+class CallHookDispatcher:
+    """
+    Calls the registered `CallHooks`. The handlers of each event are resolved when hooks are added or removed,
+    and the `CallEvent`s come from a preallocated pool, so dispatching does not allocate.
+    """
+    POOL_SIZE = 256
+
+    def __init__(self):
+        self.hooks: list[CallHooks] = []
+        self.active = False
+        self._handlers: dict[str, tuple[Callable, ...]] = {name: () for name in _EVENTS}
+        self._by_status: dict[Any, tuple[Callable, ...]] = {}
+        self._pool: list[CallEvent] = []
+
+    def add(self, hooks: CallHooks):
+        self.hooks.append(hooks)
+        self._resolve()
+
+    def remove(self, hooks: CallHooks):
+        self.hooks.remove(hooks)
+        self._resolve()
+
+    def _resolve(self):
+        from .model_concurrent_runners.model_concurrent_runner import ModelPredictResult
+
+        for name in _EVENTS:
+            base = getattr(CallHooks, name)
+            self._handlers[name] = tuple(getattr(hooks, name) for hooks in self.hooks if getattr(type(hooks), name, base) is not base)
+
+        Status = ModelPredictResult.Status
+        self._by_status = {
+            Status.SUCCESS: self._handlers["on_result"],
+            Status.CACHED: self._handlers["on_result"],
+            Status.TIMEOUT: self._handlers["on_timeout"],
+            Status.FAILED: self._handlers["on_failure"],
+            Status.SKIPPED: self._handlers["on_skip"],
+            None: self._handlers["on_failure"],
+        }
+        self.active = any(self._handlers.values())
+        if self.active and not self._pool:
+            self._pool = [CallEvent() for _ in range(self.POOL_SIZE)]
+
+    def dispatch(self, model: "ModelRunner", method_name: str) -> CallEvent:
+        event = self._pool.pop() if self._pool else CallEvent()
+        event.model = model
+        event.method_name = method_name
+        self._emit(self._handlers["on_dispatch"], event)
+        return event
+
+    def complete(self, event: CallEvent, result: "ModelPredictResult | None"):
+        if result is not None:
+            event.status = result.status
+            event.exec_time_us = result.exec_time_us
+            event.result = result.result
+        self._emit(self._by_status.get(event.status, ()), event)
+
+        event.model = event.status = event.result = None
+        event.exec_time_us = 0
+        if len(self._pool) < self.POOL_SIZE:
+            self._pool.append(event)
+
+    def reconnect(self, model: "ModelRunner"):
+        self._emit(self._handlers["on_reconnect"], ModelEvent(model))
+
+    def model_added(self, model: "ModelRunner"):
+        self._emit(self._handlers["on_model_added"], ModelEvent(model))
+
+    def model_removed(self, model: "ModelRunner"):
+        self._emit(self._handlers["on_model_removed"], ModelEvent(model))
+
+    @staticmethod
+    def _emit(handlers: tuple[Callable, ...], event: CallEvent | ModelEvent):
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.error(f"Call hook {handler.__qualname__} failed", exc_info=True)
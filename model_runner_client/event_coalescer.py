@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, Collection
+
+logger = logging.getLogger("model_runner_client.event_coalescer")
+
+
+@dataclass
+class CoalescerStats:
+    received: int = 0  # model updates received from the orchestrator
+    applied: int = 0  # model updates forwarded to the cluster
+    coalesced: int = 0  # model updates dropped because a newer one arrived within the window
+    cancelled_inits: int = 0  # pending initializations aborted because an update superseded them
+
+    @property
+    def avoided(self) -> int:
+        return self.coalesced + self.cancelled_inits
+
+
+class EventCoalescer:
+    """
+    Collapse bursts of orchestrator updates per model into their net final state.
+
+    An update carries the full state of a model, so when several updates of the same model arrive within
+    `window` seconds (e.g. RECOVERING -> RUNNING during a restart), only the last one is forwarded:
+    the intermediate states would only open and tear down connections.
+
+    A RUNNING update superseding a STOPPED/RECOVERING one is marked with `RESTARTED`: the model process
+    restarted even if its IP/port did not change, so it needs a fresh runner (connection and Setup).
+    Updates in `immediate_states` (STOPPED by default) are forwarded right away, a stopped model is not called
+    during the window.
+
+    The window starts with the first buffered update and is not extended by the next ones,
+    so an update is never delayed by more than `window`. A `window` of 0 only coalesces within one event.
+    """
+    WINDOW = 0.2
+    IMMEDIATE_STATES = frozenset({"STOPPED"})
+    STOP_STATES = frozenset({"STOPPED", "RECOVERING"})
+    RESTARTED = "restarted"  # key set on an update that superseded a stop
+
+    def __init__(self, dispatch: Callable[[list[dict]], None], window: float = WINDOW, immediate_states: Collection[str] = IMMEDIATE_STATES):
+        """
+        :param dispatch: Called with the coalesced updates, one per model.
+        :param window: How long (in seconds) updates are buffered before being forwarded.
+        :param immediate_states: States forwarded without waiting for the window.
+        """
+        self.dispatch = dispatch
+        self.window = window
+        self.immediate_states = immediate_states
+        self.stats = CoalescerStats()
+
+        self._buffer: dict[str, dict] = {}
+        self._stopped_model_ids: set[str] = set()  # stops forwarded right away during the current window
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def push(self, data: list[dict]):
+        immediate_updates = []
+        for model_update in data:
+            model_id = model_update.get("model_id")
+            self.stats.received += 1
+            previous = self._buffer.get(model_id)
+            restarted = model_id in self._stopped_model_ids
+            if previous is not None:
+                self.stats.coalesced += 1
+                logger.debug(f"Model {model_id}: update {previous.get('state')} superseded by {model_update.get('state')}")
+                restarted = restarted or previous.get("state") in self.STOP_STATES or previous.get(self.RESTARTED, False)
+            if restarted:
+                model_update = {**model_update, self.RESTARTED: True}
+
+            if model_update.get("state") in self.immediate_states:
+                self._buffer.pop(model_id, None)
+                immediate_updates.append(model_update)
+                if model_update.get("state") in self.STOP_STATES:
+                    # the model actor may still supersede the stop with the next update, which must then restart the model
+                    self._stopped_model_ids.add(model_id)
+            else:
+                self._buffer[model_id] = model_update
+
+        if immediate_updates:
+            self.stats.applied += len(immediate_updates)
+            self.dispatch(immediate_updates)
+
+        if self.window <= 0:
+            self.flush()
+        elif (self._buffer or self._stopped_model_ids) and self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self.flush)
+
+    def flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        model_updates, self._buffer = list(self._buffer.values()), {}
+        self._stopped_model_ids.clear()
+        if not model_updates:
+            return
+
+        self.stats.applied += len(model_updates)
+        logger.debug(f"Forwarding {len(model_updates)} model updates ({self.stats})")
+        self.dispatch(model_updates)
+
+    def discard(self):
+        """Drop the buffered updates, e.g. when a full `init` snapshot supersedes them."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        self.stats.coalesced += len(self._buffer)
+        self._buffer.clear()
+        self._stopped_model_ids.clear()
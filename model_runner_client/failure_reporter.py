@@ -0,0 +1,85 @@
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger("model_runner_client.failure_reporter")
+
+
+class FailureReportBatcher:
+    """
+    Merge the `report_failure` messages sent to the orchestrator.
+
+    Reports received within `window` seconds are sent as one message (the protocol's `data` is a list),
+    and repeated reports of the same model in a batch are deduplicated: the first one, closest to the root
+    cause, is kept. In a mass timeout (e.g. a network partition) this turns hundreds of frames into a few.
+    """
+    WINDOW = 0.05
+    MAX_BATCH_SIZE = 500
+
+    def __init__(self, send_message: Callable[[str], Awaitable[None]], window: float = WINDOW, max_batch_size: int = MAX_BATCH_SIZE):
+        """
+        :param send_message: Sends a serialized message, typically `WebsocketClient.send_message`.
+        :param window: How long (in seconds) reports are buffered before being sent.
+        :param max_batch_size: A batch reaching this size is sent right away.
+        """
+        self.send_message = send_message
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self._reports: dict[str, dict] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+        self.reported = 0
+        self.deduplicated = 0
+        self.messages_sent = 0
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    def report(self, model_id: str, failure_code: str, failure_reason: str | None = None, ip: str | None = None):
+        self.reported += 1
+        if model_id in self._reports:
+            self.deduplicated += 1
+            logger.debug(f"Model {model_id}: failure {failure_code} already reported in this batch")
+            return
+
+        self._reports[model_id] = {
+            "model_id": model_id,
+            "failure_code": failure_code,
+            "failure_reason": failure_reason,
+            "ip": ip
+        }
+
+        if len(self._reports) >= self.max_batch_size or self.window <= 0:
+            self._schedule_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self._schedule_flush)
+
+    def _schedule_flush(self):
+        task = asyncio.create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        reports, self._reports = list(self._reports.values()), {}
+        if not reports:
+            return
+
+        self.messages_sent += 1
+        logger.debug(f"Reporting {len(reports)} failures in one message")
+        try:
+            await self.send_message(json.dumps({"event": "report_failure", "data": reports}))
+        except Exception as e:
+            logger.error(f"Failed to report {len(reports)} failures: {e}", exc_info=True)
+
+    async def close(self):
+        """Send the buffered reports and wait for the batches being sent."""
+        await self.flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
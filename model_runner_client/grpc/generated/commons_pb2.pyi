@@ -13,6 +13,8 @@ class VariantType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     PARQUET: _ClassVar[VariantType]
     ARROW: _ClassVar[VariantType]
     JSON: _ClassVar[VariantType]
+    NDARRAY: _ClassVar[VariantType]
+    BYTES: _ClassVar[VariantType]
 NONE: VariantType
 DOUBLE: VariantType
 INT: VariantType
@@ -20,6 +22,8 @@ STRING: VariantType
 PARQUET: VariantType
 ARROW: VariantType
 JSON: VariantType
+NDARRAY: VariantType
+BYTES: VariantType
 
 class Variant(_message.Message):
     __slots__ = ('type', 'value')
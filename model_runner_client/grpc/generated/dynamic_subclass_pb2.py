@@ -8,7 +8,7 @@ _runtime_version.ValidateProtobufRuntimeVersion(_runtime_version.Domain.PUBLIC,
 _sym_db = _symbol_database.Default()
 from . import commons_pb2 as commons__pb2
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16dynamic_subclass.proto\x12\x10dynamic_subclass\x1a\rcommons.proto\x1a\x1bgoogle/protobuf/empty.proto"\x81\x01\n\x0cSetupRequest\x12\x11\n\tclassName\x18\x01 \x01(\t\x12,\n\x11instanceArguments\x18\x02 \x03(\x0b2\x11.commons.Argument\x120\n\x13instanceKwArguments\x18\x03 \x03(\x0b2\x13.commons.KwArgument"0\n\rSetupResponse\x12\x1f\n\x06status\x18\x01 \x01(\x0b2\x0f.commons.Status"}\n\x0bCallRequest\x12\x12\n\nmethodName\x18\x01 \x01(\t\x12*\n\x0fmethodArguments\x18\x02 \x03(\x0b2\x11.commons.Argument\x12.\n\x11methodKwArguments\x18\x03 \x03(\x0b2\x13.commons.KwArgument"Y\n\x0cCallResponse\x12\x1f\n\x06status\x18\x01 \x01(\x0b2\x0f.commons.Status\x12(\n\x0emethodResponse\x18\x02 \x01(\x0b2\x10.commons.Variant"/\n\x0cRestResponse\x12\x1f\n\x06status\x18\x01 \x01(\x0b2\x0f.commons.Status2\xe9\x01\n\x16DynamicSubclassService\x12H\n\x05Setup\x12\x1e.dynamic_subclass.SetupRequest\x1a\x1f.dynamic_subclass.SetupResponse\x12E\n\x04Call\x12\x1d.dynamic_subclass.CallRequest\x1a\x1e.dynamic_subclass.CallResponse\x12>\n\x04Rest\x12\x16.google.protobuf.Empty\x1a\x1e.dynamic_subclass.RestResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16dynamic_subclass.proto\x12\x10dynamic_subclass\x1a\rcommons.proto\x1a\x1bgoogle/protobuf/empty.proto"\x81\x01\n\x0cSetupRequest\x12\x11\n\tclassName\x18\x01 \x01(\t\x12,\n\x11instanceArguments\x18\x02 \x03(\x0b2\x11.commons.Argument\x120\n\x13instanceKwArguments\x18\x03 \x03(\x0b2\x13.commons.KwArgument"0\n\rSetupResponse\x12\x1f\n\x06status\x18\x01 \x01(\x0b2\x0f.commons.Status"}\n\x0bCallRequest\x12\x12\n\nmethodName\x18\x01 \x01(\t\x12*\n\x0fmethodArguments\x18\x02 \x03(\x0b2\x11.commons.Argument\x12.\n\x11methodKwArguments\x18\x03 \x03(\x0b2\x13.commons.KwArgument"Y\n\x0cCallResponse\x12\x1f\n\x06status\x18\x01 \x01(\x0b2\x0f.commons.Status\x12(\n\x0emethodResponse\x18\x02 \x01(\x0b2\x10.commons.Variant"@\n\x10BatchCallRequest\x12,\n\x05calls\x18\x01 \x03(\x0b2\x1d.dynamic_subclass.CallRequest"F\n\x11BatchCallResponse\x121\n\tresponses\x18\x01 \x03(\x0b2\x1e.dynamic_subclass.CallResponse"/\n\x0cRestResponse\x12\x1f\n\x06status\x18\x01 \x01(\x0b2\x0f.commons.Status2\xbf\x02\n\x16DynamicSubclassService\x12H\n\x05Setup\x12\x1e.dynamic_subclass.SetupRequest\x1a\x1f.dynamic_subclass.SetupResponse\x12E\n\x04Call\x12\x1d.dynamic_subclass.CallRequest\x1a\x1e.dynamic_subclass.CallResponse\x12T\n\tBatchCall\x12".dynamic_subclass.BatchCallRequest\x1a#.dynamic_subclass.BatchCallResponse\x12>\n\x04Rest\x12\x16.google.protobuf.Empty\x1a\x1e.dynamic_subclass.RestResponseb\x06proto3')
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dynamic_subclass_pb2', _globals)
@@ -22,7 +22,11 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals['_CALLREQUEST']._serialized_end = 395
     _globals['_CALLRESPONSE']._serialized_start = 397
     _globals['_CALLRESPONSE']._serialized_end = 486
-    _globals['_RESTRESPONSE']._serialized_start = 488
-    _globals['_RESTRESPONSE']._serialized_end = 535
-    _globals['_DYNAMICSUBCLASSSERVICE']._serialized_start = 538
-    _globals['_DYNAMICSUBCLASSSERVICE']._serialized_end = 771
\ No newline at end of file
+    _globals['_BATCHCALLREQUEST']._serialized_start = 488
+    _globals['_BATCHCALLREQUEST']._serialized_end = 552
+    _globals['_BATCHCALLRESPONSE']._serialized_start = 554
+    _globals['_BATCHCALLRESPONSE']._serialized_end = 624
+    _globals['_RESTRESPONSE']._serialized_start = 626
+    _globals['_RESTRESPONSE']._serialized_end = 673
+    _globals['_DYNAMICSUBCLASSSERVICE']._serialized_start = 676
+    _globals['_DYNAMICSUBCLASSSERVICE']._serialized_end = 995
\ No newline at end of file
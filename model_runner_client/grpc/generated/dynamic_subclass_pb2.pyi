@@ -48,6 +48,22 @@ class CallResponse(_message.Message):
     def __init__(self, status: _Optional[_Union[_commons_pb2.Status, _Mapping]]=..., methodResponse: _Optional[_Union[_commons_pb2.Variant, _Mapping]]=...) -> None:
         ...
 
+class BatchCallRequest(_message.Message):
+    __slots__ = ('calls',)
+    CALLS_FIELD_NUMBER: _ClassVar[int]
+    calls: _containers.RepeatedCompositeFieldContainer[CallRequest]
+
+    def __init__(self, calls: _Optional[_Iterable[_Union[CallRequest, _Mapping]]]=...) -> None:
+        ...
+
+class BatchCallResponse(_message.Message):
+    __slots__ = ('responses',)
+    RESPONSES_FIELD_NUMBER: _ClassVar[int]
+    responses: _containers.RepeatedCompositeFieldContainer[CallResponse]
+
+    def __init__(self, responses: _Optional[_Iterable[_Union[CallResponse, _Mapping]]]=...) -> None:
+        ...
+
 class RestResponse(_message.Message):
     __slots__ = ('status',)
     STATUS_FIELD_NUMBER: _ClassVar[int]
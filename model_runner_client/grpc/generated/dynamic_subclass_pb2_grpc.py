@@ -25,6 +25,7 @@ class DynamicSubclassServiceStub(object):
         """
         self.Setup = channel.unary_unary('/dynamic_subclass.DynamicSubclassService/Setup', request_serializer=dynamic__subclass__pb2.SetupRequest.SerializeToString, response_deserializer=dynamic__subclass__pb2.SetupResponse.FromString, _registered_method=True)
         self.Call = channel.unary_unary('/dynamic_subclass.DynamicSubclassService/Call', request_serializer=dynamic__subclass__pb2.CallRequest.SerializeToString, response_deserializer=dynamic__subclass__pb2.CallResponse.FromString, _registered_method=True)
+        self.BatchCall = channel.unary_unary('/dynamic_subclass.DynamicSubclassService/BatchCall', request_serializer=dynamic__subclass__pb2.BatchCallRequest.SerializeToString, response_deserializer=dynamic__subclass__pb2.BatchCallResponse.FromString, _registered_method=True)
         self.Rest = channel.unary_unary('/dynamic_subclass.DynamicSubclassService/Rest', request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString, response_deserializer=dynamic__subclass__pb2.RestResponse.FromString, _registered_method=True)
 
 class DynamicSubclassServiceServicer(object):
@@ -42,6 +43,13 @@ class DynamicSubclassServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCall(self, request, context):
+        """Calls executed in order, one response per call, in the same order.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Rest(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -49,7 +57,7 @@ class DynamicSubclassServiceServicer(object):
         raise NotImplementedError('Method not implemented!')
 
 def add_DynamicSubclassServiceServicer_to_server(servicer, server):
-    rpc_method_handlers = {'Setup': grpc.unary_unary_rpc_method_handler(servicer.Setup, request_deserializer=dynamic__subclass__pb2.SetupRequest.FromString, response_serializer=dynamic__subclass__pb2.SetupResponse.SerializeToString), 'Call': grpc.unary_unary_rpc_method_handler(servicer.Call, request_deserializer=dynamic__subclass__pb2.CallRequest.FromString, response_serializer=dynamic__subclass__pb2.CallResponse.SerializeToString), 'Rest': grpc.unary_unary_rpc_method_handler(servicer.Rest, request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString, response_serializer=dynamic__subclass__pb2.RestResponse.SerializeToString)}
+    rpc_method_handlers = {'Setup': grpc.unary_unary_rpc_method_handler(servicer.Setup, request_deserializer=dynamic__subclass__pb2.SetupRequest.FromString, response_serializer=dynamic__subclass__pb2.SetupResponse.SerializeToString), 'Call': grpc.unary_unary_rpc_method_handler(servicer.Call, request_deserializer=dynamic__subclass__pb2.CallRequest.FromString, response_serializer=dynamic__subclass__pb2.CallResponse.SerializeToString), 'BatchCall': grpc.unary_unary_rpc_method_handler(servicer.BatchCall, request_deserializer=dynamic__subclass__pb2.BatchCallRequest.FromString, response_serializer=dynamic__subclass__pb2.BatchCallResponse.SerializeToString), 'Rest': grpc.unary_unary_rpc_method_handler(servicer.Rest, request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString, response_serializer=dynamic__subclass__pb2.RestResponse.SerializeToString)}
     generic_handler = grpc.method_handlers_generic_handler('dynamic_subclass.DynamicSubclassService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
     server.add_registered_method_handlers('dynamic_subclass.DynamicSubclassService', rpc_method_handlers)
@@ -65,6 +73,10 @@ class DynamicSubclassService(object):
     def Call(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dynamic_subclass.DynamicSubclassService/Call', dynamic__subclass__pb2.CallRequest.SerializeToString, dynamic__subclass__pb2.CallResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
 
+    @staticmethod
+    def BatchCall(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/dynamic_subclass.DynamicSubclassService/BatchCall', dynamic__subclass__pb2.BatchCallRequest.SerializeToString, dynamic__subclass__pb2.BatchCallResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
     @staticmethod
     def Rest(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dynamic_subclass.DynamicSubclassService/Rest', google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString, dynamic__subclass__pb2.RestResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
\ No newline at end of file
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger("model_runner_client.model_actors")
+
+Job = Callable[[], Awaitable[None]]
+
+
+class ModelActors:
+    """
+    One serialized work queue (actor) per model_id.
+
+    - Work for different models runs concurrently, so a slow model connection never delays the others.
+    - Work for the same model runs one job at a time, in submission order.
+    - Orchestrator updates carry the full model state, so only the latest job waiting for a model is kept:
+      a newer submission supersedes the pending one (the running job is not affected).
+
+    `submit` never blocks, which keeps the websocket reader free.
+    """
+
+    def __init__(self):
+        self._pending: dict[str, Job] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._idle_waiters: list[asyncio.Future] = []
+
+        self.submitted = 0
+        self.superseded = 0
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def is_busy(self, model_id: str) -> bool:
+        return model_id in self._workers
+
+    def submit(self, model_id: str, job: Job):
+        self.submitted += 1
+        if model_id in self._pending:
+            self.superseded += 1
+            logger.debug(f"Model {model_id}: pending work superseded")
+        self._pending[model_id] = job
+
+        if model_id not in self._workers:
+            self._workers[model_id] = asyncio.create_task(self._run(model_id), name=f"model-actor:{model_id}")
+
+    async def _run(self, model_id: str):
+        try:
+            while (job := self._pending.pop(model_id, None)) is not None:
+                try:
+                    await job()
+                except Exception:
+                    logger.error(f"Model {model_id}: error while processing update", exc_info=True)
+        finally:
+            del self._workers[model_id]
+            if not self._workers:
+                self._wake_up_idle_waiters()
+
+    def _wake_up_idle_waiters(self):
+        waiters, self._idle_waiters = self._idle_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def join(self):
+        """Wait until every actor has processed its work."""
+        if not self._workers:
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._idle_waiters.append(waiter)
+        await waiter
+
+    async def close(self):
+        self._pending.clear()
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
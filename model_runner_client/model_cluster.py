@@ -1,6 +1,12 @@
-import json
+import functools
 import logging
 
+from .bootstrap_scheduler import BootstrapProgress, BootstrapScheduler
+from .call_hooks import CallHookDispatcher
+from .event_coalescer import EventCoalescer
+from .failure_reporter import FailureReportBatcher
+from .model_actors import ModelActors
+from .model_registry import ModelRegistry
 from .model_runners import ModelRunner
 from .websocket_client import WebsocketClient
 
@@ -9,42 +15,100 @@ import asyncio
 
 
 class ModelCluster:
-    def __init__(self, crunch_id: str, ws_host: str, ws_port: int, model_factory: callable, report_failure=True):
+    def __init__(
+        self,
+        crunch_id: str,
+        ws_host: str,
+        ws_port: int,
+        model_factory: callable,
+        report_failure=True,
+        bootstrap_scheduler: BootstrapScheduler | None = None,
+        make_before_break: bool = False,
+        update_coalesce_window: float = EventCoalescer.WINDOW,
+        binary_encoding: bool = False,
+        call_hooks: CallHookDispatcher | None = None,
+    ):
         """
         ModelCluster constructor.
 
         :param crunch_id: The Crunch ID that this cluster is responsible for.
         :param ws_host: The WebSocket server's host.
         :param ws_port: The WebSocket server's port.
+        :param bootstrap_scheduler: Bounds and prioritizes concurrent model runner initializations.
+        :param make_before_break: Initialize replacement runners (IP change, reconnect) in the background while
+            the current runner keeps serving, then swap them once the replacement is ready.
+        :param update_coalesce_window: Updates of the same model received within this window (in seconds)
+            are collapsed into the last one, see `EventCoalescer`.
+        :param binary_encoding: Ask the orchestrator for msgpack encoded events (requires `msgpack`).
+        :param call_hooks: Notified when models are added, removed or reconnected.
         """
         self.crunch_id = crunch_id
-        self.models_run: dict[str, ModelRunner] = {}
+        self.call_hooks = call_hooks or CallHookDispatcher()
+        self.models_run = ModelRegistry()  # indexed, see `ModelRegistry.select`
         self.pending_model_runs: dict[str, ModelRunner] = {}  # Track model runners being initialized
         logger.debug(f"Initializing ModelCluster with Crunch ID: {crunch_id}")
-        self.ws_client = WebsocketClient(ws_host, ws_port, crunch_id, event_handler=self.handle_event)
+        self.ws_client = WebsocketClient(ws_host, ws_port, crunch_id, event_handler=self.handle_event, binary_encoding=binary_encoding)
         self.model_factory = model_factory
         self.report_failure = report_failure
+        self.bootstrap_scheduler = bootstrap_scheduler or BootstrapScheduler()
+        self.bootstrap_progress = BootstrapProgress()
+        self.make_before_break = make_before_break
+        self.model_actors = ModelActors()  # orchestrator events are applied per model, off the websocket reader
+        self.event_coalescer = EventCoalescer(self.dispatch_model_updates, update_coalesce_window)
+        self.init_snapshot_model_ids: set[str] = set()  # models of the `init` snapshot being received
+        self.failure_reporter = FailureReportBatcher(lambda message: self.ws_client.send_message(message))
 
-    async def init(self):
+    async def init(self, ready_fraction: float = 1.0):
+        """
+        Connect to the orchestrator and process the `init` event.
+
+        :param ready_fraction: Return as soon as this fraction of the announced models is ready,
+            the remaining ones keep connecting in the background.
+        """
         await self.ws_client.connect()
         await self.ws_client.init()
 
-        logger.debug("WebSocket client initialized.")
+        if ready_fraction >= 1:
+            await self.model_actors.join()
+        else:
+            tasks = [
+                asyncio.create_task(self.model_actors.join()),
+                asyncio.create_task(self.bootstrap_progress.wait_for(ready_fraction)),
+            ]
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                task.cancel()
+
+        logger.debug(f"WebSocket client initialized. {self.bootstrap_progress}")
 
     async def sync(self):
         await self.ws_client.listen()
 
-    async def handle_event(self, event_type: str, data: list[dict]):
+    async def close(self):
+        """
+        Stop processing orchestrator events, report the pending failures and close every model runner.
+        """
+        self.event_coalescer.discard()
+        await self.model_actors.close()
+        await self.failure_reporter.close()
+
+        model_runners = {*self.models_run.values(), *self.pending_model_runs.values()}
+        await asyncio.gather(*(self.remove_model_runner(model_runner) for model_runner in model_runners))
+        await self.ws_client.disconnect()
+
+    async def handle_event(self, event_type: str, data: list[dict], page: int = 0, pages: int = 1):
         """
         Handle WebSocket events (`init` and `update`) and update the cluster's state.
 
         :param event_type: The type of the event (`init` or `update`).
         :param data: The event data.
+        :param page: Index of this page, when the `init` snapshot is split in `pages` messages.
+        :param pages: Number of pages of the `init` snapshot.
         """
         try:
             if event_type == "init":
-                logger.debug(f"Processing event type: {event_type}")
-                await self.handle_init_event(data)
+                logger.debug(f"Processing event type: {event_type} (page {page + 1}/{pages})")
+                await self.handle_init_event(data, page, pages)
             elif event_type == "update":
                 logger.debug(f"Processing event type: {event_type}")
                 await self.handle_update_event(data)
@@ -54,39 +118,101 @@ class ModelCluster:
             logger.error(f"Error processing event {event_type}: {e}", exc_info=True)
             raise e
 
-    async def handle_init_event(self, data: list[dict]):
+    async def handle_init_event(self, data: list[dict], page: int = 0, pages: int = 1):
         """
         Process the `init` event to initialize models run.
+        The work is queued on the model actors, see `model_actors.join()` to wait for it.
+        A paged snapshot is applied page by page, models absent from the snapshot are removed after the last page.
         
-        :param data: List of models with their initial states.
+        :param data: List of models with their initial states (of this page).
+        :param page: Index of this page.
+        :param pages: Number of pages of the snapshot.
         """
         logger.debug("Handling 'init' event.")
-        await self.update_model_runs(data)
+        running_model_ids = {model['model_id'] for model in data if model.get('state') == "RUNNING"}
+        if page == 0:
+            self.bootstrap_progress.reset(running_model_ids)
+            self.event_coalescer.discard()  # the snapshot is more recent than any buffered update
+            self.init_snapshot_model_ids = set()
+        else:
+            self.bootstrap_progress.extend(running_model_ids)
+        self.init_snapshot_model_ids.update(model['model_id'] for model in data)
+        self.dispatch_model_updates(data)
 
-        # Remove models in `self.models_run` that are not present in `data`
-        data_model_ids = {model['model_id'] for model in data}
-        models_to_remove = self.models_run.keys() - data_model_ids
-        tasks = [self.remove_model_runner(self.models_run[model_id]) for model_id in models_to_remove]
-        await asyncio.gather(*tasks)
-        logger.debug(f"Models with IDs {models_to_remove} removed as they are not in the 'init' event data.")
+        if page + 1 < pages:
+            return
+
+        # Remove models (running or pending) that are not present in the snapshot
+        models_to_remove = (self.models_run.keys() | self.pending_model_runs.keys()) - self.init_snapshot_model_ids
+        for model_id in models_to_remove:
+            self.model_actors.submit(model_id, functools.partial(self.remove_model, model_id))
+        logger.debug(f"Models with IDs {models_to_remove} will be removed as they are not in the 'init' event data.")
 
     async def handle_update_event(self, data: list[dict]):
         """
         Process the `update` event to update model states.
+        The work is queued on the model actors, see `model_actors.join()` to wait for it.
         
         :param data: List of models with their updated states.
         """
         logger.debug("Handling 'update' event.")
-        await self.update_model_runs(data)
+        self.event_coalescer.push(data)
+
+    def dispatch_model_updates(self, data: list[dict]):
+        """
+        Queue each model update on its model actor: updates of different models are applied concurrently,
+        updates of the same model in order, and a newer update supersedes a pending one.
+        An initialization the update makes obsolete is aborted, so the actor gets to the update without waiting for it.
+        """
+        for model_update in data:
+            self.abort_superseded_init(model_update)
+            self.model_actors.submit(model_update.get("model_id"), functools.partial(self.update_model_runs, [model_update]))
+
+    def abort_superseded_init(self, model_update: dict) -> bool:
+        """
+        Close the pending model runner if `update_model_runs` would remove or replace it anyway
+        (same rules: STOPPED/RECOVERING of its deployment, RUNNING on another deployment, IP/port or restarted).
+        """
+        model_runner = self.pending_model_runs.get(model_update.get("model_id"))
+        if not model_runner or model_runner.closed:
+            return False
+
+        same_deployment = model_update.get("deployment_id") == model_runner.deployment_id
+        state = model_update.get("state")
+        if state == "RUNNING":
+            superseded = (
+                not same_deployment
+                or (model_runner.ip, model_runner.port) != (model_update.get("ip"), model_update.get("port"))
+                or model_update.get(EventCoalescer.RESTARTED, False)
+            )
+        else:
+            superseded = same_deployment and state in ("STOPPED", "RECOVERING")
+        if not superseded:
+            return False
+
+        logger.debug(f"Model {model_runner.model_id}: pending initialization superseded by {state} update, aborting")
+        self.event_coalescer.stats.cancelled_inits += 1
+        asyncio.create_task(model_runner.close())
+        return True
+
+    async def remove_model(self, model_id: str):
+        """
+        Remove every runner (running or pending) of a model.
+        """
+        model_runners = {self.pending_model_runs.get(model_id), self.models_run.get(model_id)} - {None}
+        await asyncio.gather(*(self.remove_model_runner(model_runner) for model_runner in model_runners))
 
     async def update_model_runs(self, data):
         """
         Update cluster state based on model state changes.
 
         State handling (only for matching deployment_id):
-          - STOPPED/RECOVERING: remove model (running or pending)
+          - STOPPED/RECOVERING: remove model (running and pending)
           - RUNNING + same IP/port: update infos (if running)
-          - RUNNING + new IP/port or new model: (re)connect
+          - RUNNING + new IP/port, new model or restarted (see `EventCoalescer.RESTARTED`): (re)connect
+
+        A pending model runner takes precedence over the running one, it is the most recent target
+        (both exist only in make-before-break mode, while the replacement is initializing).
         """
         tasks = []
         for model_update in data:
@@ -97,40 +223,49 @@ class ModelCluster:
             state = model_update.get("state")
             ip = model_update.get("ip")
             port = model_update.get("port")
+            restarted = model_update.get(EventCoalescer.RESTARTED, False)
             logger.debug(f"Updating model with ID: {model_id}")
 
-            # Find the model in the current state (running or pending)
-            model_runner = self.models_run.get(model_id) or self.pending_model_runs.get(model_id)
+            # Find the model in the current state (pending or running)
+            model_runners = [
+                model_runner
+                for model_runner in (self.pending_model_runs.get(model_id), self.models_run.get(model_id))
+                if model_runner
+            ]
+            model_runner = model_runners[0] if model_runners else None
             if model_runner and deployment_id != model_runner.deployment_id:
                 logger.debug(f"Model with ID {model_id} exists but with different deployment ID {deployment_id}<>{model_runner.deployment_id}. Ignoring.")
                 model_runner = None
+            model_runners = [model_runner for model_runner in model_runners if model_runner.deployment_id == deployment_id]
 
             if state == "STOPPED":
-                if model_runner:
-                    tasks.append(self.remove_model_runner(model_runner))
+                if model_runners:
+                    tasks.extend(self.remove_model_runner(model_runner) for model_runner in model_runners)
                     logger.debug(f"Model with ID {model_id} removed due to 'stopped' state.")
                 else:
                     logger.debug(f"Model with ID {model_id} and deployment ID {deployment_id} is not found. No action required for 'STOPPED'.")
 
             elif state == "RECOVERING":
-                if model_runner:
-                    tasks.append(self.remove_model_runner(model_runner))
+                if model_runners:
+                    tasks.extend(self.remove_model_runner(model_runner) for model_runner in model_runners)
                     logger.debug(f"Model with ID {model_id} removed due to 'recovering' state. It will be back if recovery succeeds.")
                 else:
                     logger.debug(f"Model with ID {model_id} and deployment ID {deployment_id} is not found. No action required for 'RECOVERING'.")
 
             elif state == "RUNNING":
-                if model_runner and model_runner.ip == ip and model_runner.port == port:
+                if model_runner and model_runner.ip == ip and model_runner.port == port and not restarted:
                     # Same IP/port, just update infos if it's a running model
-                    if model_id in self.models_run:
+                    if self.models_run.get(model_id) is model_runner:
                         logger.debug(f"Model with ID {model_id} is already running in the cluster. Updating infos")
-                        model_runner.infos = infos
-                        model_runner.model_name = model_name
+                        self.models_run.update_infos(model_id, infos, model_name)
+                        self.bootstrap_progress.mark_ready(model_id)
                     else:
                         logger.debug(f"Model with ID {model_id} is pending with same IP/port. No action required.")
                 else:
                     # New model or IP/port changed
-                    if model_runner:
+                    if model_runner and restarted:
+                        logger.debug(f"Model with ID {model_id} restarted (stopped and running again within the coalesce window). Reconnecting.")
+                    elif model_runner:
                         logger.debug(f"Model with ID {model_id} has new IP/port ({model_runner.ip}:{model_runner.port} -> {ip}:{port}). Reconnecting.")
                     else:
                         logger.debug(f"New model with ID {model_id} is running, we add it to the cluster state.")
@@ -156,24 +291,52 @@ class ModelCluster:
         """
         logger.debug(f"Adding model {model_runner.model_id} (deployment: {model_runner.deployment_id})")
 
-        # Remove any existing model (running or pending) with the same model_id
-        current_model = self.models_run.get(model_runner.model_id) or self.pending_model_runs.get(model_runner.model_id)
-        if current_model:
-            logger.info(f"Model {current_model.model_id}: replacing existing (deployment: {current_model.deployment_id})")
-            await self.remove_model_runner(current_model)
+        # Remove any existing model (running or pending) with the same model_id,
+        # in make-before-break mode the running one keeps serving until the new one is ready
+        current_models = [self.pending_model_runs.get(model_runner.model_id)]
+        if not self.make_before_break:
+            current_models.append(self.models_run.get(model_runner.model_id))
+        for current_model in current_models:
+            if current_model:
+                logger.info(f"Model {current_model.model_id}: replacing existing (deployment: {current_model.deployment_id})")
+                await self.remove_model_runner(current_model)
 
         # Track this model runner as pending during initialization
         self.pending_model_runs[model_runner.model_id] = model_runner
         try:
-            is_initialized, error = await model_runner.init()
+            # the slot is taken per connection attempt, an unreachable model does not hold it during its backoff
+            is_initialized, error = await model_runner.init(admission=functools.partial(self.bootstrap_scheduler.slot, model_runner.model_id))
         finally:
             # Remove from pending regardless of outcome
             if self.pending_model_runs.get(model_runner.model_id) is model_runner:
                 del self.pending_model_runs[model_runner.model_id]
 
+        previous_model = self.models_run.get(model_runner.model_id)
         if is_initialized:
+            if model_runner.closed:
+                # superseded or stopped while finishing its setup
+                await model_runner.close()
+                return
+
+            # Atomic swap, the previous runner (make-before-break) is closed afterward
             self.models_run[model_runner.model_id] = model_runner
+            self.bootstrap_scheduler.mark_healthy(model_runner.model_id)
+            self.bootstrap_progress.mark_ready(model_runner.model_id)
+            replaced = previous_model is not None and previous_model is not model_runner
+            if self.call_hooks.active:
+                if replaced:
+                    # the previous runner is out of `models_run` already, `remove_model_runner` will not report it
+                    self.call_hooks.model_removed(previous_model)
+                self.call_hooks.model_added(model_runner)
+            if replaced:
+                logger.info(f"Model {model_runner.model_id}: replacement ready, closing previous runner")
+                await self.remove_model_runner(previous_model)
         else:
+            if error != ModelRunner.ErrorType.ABORTED:
+                self.bootstrap_progress.mark_failed(model_runner.model_id)
+                if previous_model:
+                    # the replacement failed, the previous runner is not trusted anymore
+                    await self.remove_model_runner(previous_model)
             if error == ModelRunner.ErrorType.BAD_IMPLEMENTATION:
                 await self.process_failure(model_runner, 'BAD_IMPLEMENTATION')
             elif error == ModelRunner.ErrorType.ABORTED:
@@ -184,22 +347,14 @@ class ModelCluster:
                 await self.process_failure(model_runner, 'MULTIPLE_FAILED')
 
     async def process_failure(self, model_runner: ModelRunner, failure_code: str, failure_reason: str = None):
+        self.bootstrap_scheduler.forget(model_runner.model_id)
+
         if not self.report_failure:
             logger.warning(f"Process failure is disabled: model_id={model_runner.model_id}, failure_code={failure_code}, failure_reason={failure_reason}")
             return
 
-        error_msg = {
-            "event": "report_failure",
-            "data": [
-                {
-                    "model_id": model_runner.model_id,
-                    "failure_code": failure_code,
-                    "failure_reason": failure_reason,
-                    "ip": model_runner.ip
-                }
-            ]
-        }
-        await self.ws_client.send_message(json.dumps(error_msg))
+        # batched with the other failures of the same moment, see `FailureReportBatcher`
+        self.failure_reporter.report(model_runner.model_id, failure_code, failure_reason, model_runner.ip)
         await self.remove_model_runner(model_runner)
 
     async def remove_model_runner(self, model_runner: ModelRunner):
@@ -210,14 +365,30 @@ class ModelCluster:
         await model_runner.close()
         if self.models_run.get(model_runner.model_id) is model_runner:
             del self.models_run[model_runner.model_id]
+            if self.call_hooks.active:
+                self.call_hooks.model_removed(model_runner)
         if self.pending_model_runs.get(model_runner.model_id) is model_runner:
             del self.pending_model_runs[model_runner.model_id]
         logger.info(f"Model {model_runner.model_id} removed (deployment: {model_runner.deployment_id})")
 
     async def reconnect_model_runner(self, model_runner: ModelRunner):
         try:
-            logger.info(f"Model {model_runner.model_id}: reconnecting")
-            await self.remove_model_runner(model_runner)
+            if self.make_before_break:
+                if model_runner.model_id in self.pending_model_runs:
+                    logger.debug(f"Model {model_runner.model_id}: replacement already in progress")
+                    return
+                if self.models_run.get(model_runner.model_id) is not model_runner:
+                    logger.debug(f"Model {model_runner.model_id}: runner already replaced or removed")
+                    return
+                logger.info(f"Model {model_runner.model_id}: reconnecting (make-before-break)")
+            else:
+                logger.info(f"Model {model_runner.model_id}: reconnecting")
+
+            if self.call_hooks.active:
+                self.call_hooks.reconnect(model_runner)
+            if not self.make_before_break:
+                await self.remove_model_runner(model_runner)
+
             model_runner = self.model_factory(
                 deployment_id=model_runner.deployment_id,
                 model_id=model_runner.model_id,
@@ -1,2 +1,4 @@
 from .dynamic_subclass_model_concurrent_runner import DynamicSubclassModelConcurrentRunner
-from .model_concurrent_runner import ModelConcurrentRunner, ModelPredictResult
\ No newline at end of file
+from .model_concurrent_runner import ModelConcurrentRunner, ModelPredictResult, ModelPredictResults
+from .result_cache import CachePolicy, ResultCache
+from .call_pipeline import CallPipeline
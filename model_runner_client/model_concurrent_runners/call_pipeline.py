@@ -0,0 +1,178 @@
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator
+
+from .model_concurrent_runner import ModelPredictResult, ModelPredictResults
+from .result_cache import ResultCache
+from ..model_runners import ArgumentsType, CallOrder, ModelRunner
+
+if TYPE_CHECKING:
+    from .dynamic_subclass_model_concurrent_runner import DynamicSubclassModelConcurrentRunner
+
+logger = logging.getLogger("model_runner_client.call_pipeline")
+
+
+@dataclass
+class PipelineStats:
+    cycles: int = 0
+    calls: int = 0
+    skipped: int = 0  # calls not sent because the model already had `window` calls in flight
+    max_in_flight: int = 0  # highest number of calls in flight to a single model
+
+
+class CallPipeline:
+    """
+    Overlapping cycles: a new cycle is sent to the models without waiting for the previous ones to complete.
+
+    Each model has at most `window` calls in flight. A model that still has `window` calls in flight when a cycle
+    is submitted is skipped for that cycle (SKIPPED status), so a slow model cannot accumulate an unbounded backlog.
+    With a window of 1, a model still busy with its previous cycle is skipped.
+
+    The calls of a model reach it in cycle order: each call carries the model's next `CallOrder` sequence number
+    (`x-call-sequence` metadata) and is only started once the previous one was, on a single channel, without batching.
+    Like `call`, a cycle is one `CallRecorder` cycle, and methods with a `CachePolicy` get their CACHED results.
+
+        pipeline = concurrent_runner.pipeline(window=3)
+        cycle = pipeline.submit("predict", arguments)  # does not wait
+        ...
+        async for results in pipeline.results():  # completed cycles, in cycle order
+            handle(results.cycle, results)
+    """
+
+    def __init__(self, concurrent_runner: "DynamicSubclassModelConcurrentRunner", window: int = 2):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.concurrent_runner = concurrent_runner
+        self.window = window
+        self.stats = PipelineStats()
+        self.next_cycle = 0
+        self.in_flight: Counter[ModelRunner] = Counter()
+        self._cycles: dict[int, asyncio.Task] = {}
+
+    def submit(
+        self,
+        method_name: str,
+        arguments: ArgumentsType = ([], []),
+        timeout: int | None = None,
+        model_runs: list[ModelRunner] | None = None,
+    ) -> int:
+        """
+        Send a cycle to the models, without waiting for it. Same arguments as `DynamicSubclassModelConcurrentRunner.call`.
+
+        :return: The cycle number, to fetch its results with `result(cycle)` or `results()`.
+        """
+        cycle = self.next_cycle
+        self.next_cycle += 1
+
+        concurrent_runner = self.concurrent_runner
+        model_runs, snapshot_version = concurrent_runner._select_models(model_runs)
+        if concurrent_runner.call_recorder:
+            concurrent_runner.call_recorder.next_cycle()
+
+        completed: dict[ModelRunner, ModelPredictResult] = {}  # CACHED and SKIPPED results
+        keys: dict[ModelRunner, bytes] = {}
+        result_cache = concurrent_runner.result_caches.get(method_name)
+        if result_cache is not None:
+            completed, keys, arguments = concurrent_runner._lookup_cached(result_cache, method_name, arguments, model_runs)
+            model_runs = list(keys)
+
+        calls: dict[ModelRunner, asyncio.Task] = {}
+        skipped = 0
+        for model in model_runs:
+            if self.in_flight[model] >= self.window:
+                completed[model] = ModelPredictResult.of_skipped(model)
+                skipped += 1
+                continue
+
+            self.in_flight[model] += 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self.in_flight[model])
+            # reserved here, in cycle order, the call task may start later
+            order = model.reserve_call_order()
+            calls[model] = asyncio.create_task(
+                self._call(model, method_name, arguments, timeout, order),
+                name=f"pipeline:{model.model_id}",
+            )
+
+        self.stats.cycles += 1
+        self.stats.calls += len(calls)
+        self.stats.skipped += skipped
+        self._cycles[cycle] = asyncio.create_task(
+            self._gather(cycle, calls, completed, snapshot_version, result_cache, keys),
+            name=f"pipeline-cycle:{cycle}",
+        )
+        return cycle
+
+    async def _call(self, model: ModelRunner, method_name: str, arguments: ArgumentsType, timeout: int | None, order: CallOrder) -> ModelPredictResult:
+        try:
+            return await self.concurrent_runner._execute_model_method_with_timeout(model, 'call', timeout, method_name, arguments, order=order)
+        finally:
+            order.release()  # not sent (unhealthy, cancelled...), the next call must not wait for it
+            self.in_flight[model] -= 1
+            if not self.in_flight[model]:
+                del self.in_flight[model]
+
+    async def _gather(
+        self,
+        cycle: int,
+        calls: dict[ModelRunner, asyncio.Task],
+        completed: dict[ModelRunner, ModelPredictResult],
+        snapshot_version: int | None,
+        result_cache: ResultCache | None,
+        keys: dict[ModelRunner, bytes],
+    ) -> ModelPredictResults:
+        if calls:
+            try:
+                await asyncio.wait(calls.values())
+            except asyncio.CancelledError:
+                for call in calls.values():
+                    call.cancel()
+                await asyncio.wait(calls.values())
+                raise
+
+        results = dict(completed)
+        for model, call in calls.items():
+            result = None
+            if call.cancelled():
+                logger.warning(f"Model {model.model_id}: pipelined call of cycle {cycle} was cancelled")
+            elif call.exception() is not None:
+                logger.warning(f"Model {model.model_id}: pipelined call of cycle {cycle} raised {call.exception()!r}")
+            else:
+                result = call.result()
+            # a call without result is reported as failed instead of missing from the cycle
+            results[model] = result or ModelPredictResult.of_failed(model, 0)
+
+        if result_cache is not None:
+            self.concurrent_runner._store_cached(result_cache, keys, {model: results[model] for model in calls})
+        return ModelPredictResults(results, snapshot_version, cycle)
+
+    @property
+    def pending(self) -> list[int]:
+        """Submitted cycles whose results were not fetched yet."""
+        return sorted(self._cycles)
+
+    async def result(self, cycle: int) -> ModelPredictResults:
+        """Wait for the results of a cycle. Results are only kept until fetched."""
+        if cycle not in self._cycles:
+            raise KeyError(f"Cycle {cycle} was not submitted or was already fetched")
+
+        try:
+            return await asyncio.shield(self._cycles[cycle])
+        finally:
+            if self._cycles.get(cycle) is not None and self._cycles[cycle].done():
+                del self._cycles[cycle]
+
+    async def results(self) -> AsyncIterator[ModelPredictResults]:
+        """Yield the results of the submitted cycles in cycle order, until none is pending."""
+        while self._cycles:
+            yield await self.result(min(self._cycles))
+
+    async def close(self):
+        """Cancel the cycles in flight."""
+        cycles = list(self._cycles.values())
+        self._cycles.clear()
+        for cycle in cycles:
+            cycle.cancel()
+        await asyncio.gather(*cycles, return_exceptions=True)
@@ -1,16 +1,37 @@
-from typing import Any, Callable, cast
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Sequence, cast
 from warnings import warn
 
 from ..grpc.generated.commons_pb2 import Argument, KwArgument
-from ..model_concurrent_runners.model_concurrent_runner import ModelConcurrentRunner, ModelPredictResult
+from ..grpc.generated.dynamic_subclass_pb2 import CallRequest
+from ..model_concurrent_runners.model_concurrent_runner import ModelConcurrentRunner, ModelPredictResult, ModelPredictResults
+from ..model_concurrent_runners.call_pipeline import CallPipeline
+from ..model_concurrent_runners.result_cache import CachePolicy, ResultCache, arguments_key
 from ..model_runners import ArgumentsType, DynamicSubclassModelRunner
+from ..model_runners.call_batcher import CallBatcher
 from ..model_runners.model_runner import ModelRunner
+from ..utils.call_recorder import CallRecorder
+
+
+logger = logging.getLogger("model_runner_client.dynamic_subclass_model_concurrent_runner")
 
 
 class _Sentinel:
     pass
 
 
+@dataclass
+class NotificationStats:
+    sent: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    skipped: int = 0
+    dropped: int = 0  # not sent because too many notifications were already pending for the model
+
+
 class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
     """
     A concurrent runner responsible for managing and invoking dynamic subclass model runners.
@@ -27,6 +48,11 @@ class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
         base_classname: str,
         instance_args: list[Argument] = None,
         instance_kwargs: list[KwArgument] = None,
+        call_recorder: CallRecorder | None = None,
+        cached_methods: dict[str, CachePolicy] | None = None,
+        max_pending_notifications: int = 8,
+        batch_window: float | None = None,
+        max_batch_size: int = CallBatcher.MAX_BATCH_SIZE,
         **kwargs
     ):
         """
@@ -40,6 +66,16 @@ class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
             base_classname: The base classname used to identify and implement the first matching class.
             instance_args (list[Argument]): Positional arguments passed to the implementation of the identified class.
             instance_kwargs (list[KwArgument]): Keyword arguments passed to the implementation of the identified class.
+            call_recorder (CallRecorder): Records every call, one cycle per `call()`, for offline replay
+                (see `model_runner_client.testing.replay_server`).
+            cached_methods (dict[str, CachePolicy]): Methods whose results only depend on their arguments. Their successful
+                results are memoized per model (see `ResultCache`): a model already called with the same arguments is not
+                called again and gets a CACHED result. Entries are dropped when the model runner is replaced.
+            max_pending_notifications (int): Notifications (see `notify`) queued for a model that has not processed
+                the previous ones yet. Beyond that, new notifications to that model are dropped.
+            batch_window (float): When set, concurrent calls to a model issued within that many seconds (up to
+                `max_batch_size`) are sent as one `BatchCall` request (see `CallBatcher`). Model nodes without
+                `BatchCall` get them one by one.
         """
 
         super().__init__(timeout, crunch_id, host, port, **kwargs)
@@ -50,6 +86,20 @@ class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
         self.base_classname = base_classname
         self.instance_args = instance_args
         self.instance_kwargs = instance_kwargs
+        self.call_recorder = call_recorder
+        self.result_caches = {method_name: ResultCache(policy) for method_name, policy in (cached_methods or {}).items()}
+        self.max_pending_notifications = max_pending_notifications
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.notification_stats = NotificationStats()
+        self._notifications: dict[ModelRunner, tuple[asyncio.Task, int]] = {}  # last notification and queue depth by model
+
+    async def close(self):
+        for notification, _ in list(self._notifications.values()):
+            notification.cancel()
+        await super().close()
+        if self.call_recorder:
+            await asyncio.get_running_loop().run_in_executor(None, self.call_recorder.flush)
 
     def create_model_runner(
         self,
@@ -61,6 +111,13 @@ class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
             self.instance_kwargs,
             secure_credentials=self.secure_credentials,
             gateway_credentials=self.gateway_credentials,
+            channel_pool_size=self.channel_pool_size,
+            channel_routing=self.channel_routing,
+            health_channel_registry=self.health_channel_registry,
+            crypto_executor=self.crypto_executor,
+            call_recorder=self.call_recorder,
+            batch_window=self.batch_window,
+            max_batch_size=self.max_batch_size,
             **kwargs
         )
 
@@ -72,7 +129,7 @@ class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
         kwargs: list[KwArgument] = cast(Any, _Sentinel),
         timeout: int | None = None,
         model_runs: list[ModelRunner] | None = None,
-    ) -> dict[ModelRunner, ModelPredictResult]:
+    ) -> ModelPredictResults:
         """
         Executes a specific method concurrently on all connected model runners.
 
@@ -85,9 +142,9 @@ class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
                 will execute on all available model runners.
 
         Returns:
-            dict[ModelRunner, ModelPredictResult]: A dictionary where each key is a `ModelRunner` instance
+            ModelPredictResults: A dictionary where each key is a `ModelRunner` instance
             representing a connected model, and each value is a `ModelPredictResult` object containing the result,
-            error status, or timeout information for that model.
+            error status, or timeout information for that model. Its `snapshot_version` identifies the set of models called.
         """
 
         if args is not _Sentinel or kwargs is not _Sentinel:
@@ -101,6 +158,13 @@ class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
 
             arguments = (args, kwargs)
 
+        if self.call_recorder:
+            self.call_recorder.next_cycle()
+
+        result_cache = self.result_caches.get(method_name)
+        if result_cache is not None:
+            return await self._call_cached(result_cache, method_name, arguments, timeout, model_runs)
+
         return await self._execute_concurrent_method(
             'call',
             timeout,
@@ -108,3 +172,189 @@ class DynamicSubclassModelConcurrentRunner(ModelConcurrentRunner):
             method_name,
             arguments,
         )
+
+    async def _call_cached(
+        self,
+        result_cache: ResultCache,
+        method_name: str,
+        arguments: ArgumentsType,
+        timeout: int | None,
+        model_runs: list[ModelRunner] | None,
+    ) -> ModelPredictResults:
+        model_runs, snapshot_version = self._select_models(model_runs)
+        results, keys, arguments = self._lookup_cached(result_cache, method_name, arguments, model_runs)
+
+        if keys:
+            called = await self._execute_concurrent_method('call', timeout, list(keys), method_name, arguments)
+            self._store_cached(result_cache, keys, called)
+            results.update(called)
+
+        return ModelPredictResults(results, snapshot_version)
+
+    def _lookup_cached(
+        self,
+        result_cache: ResultCache,
+        method_name: str,
+        arguments: ArgumentsType,
+        model_runs: Sequence[ModelRunner],
+    ) -> tuple[dict[ModelRunner, ModelPredictResult], dict[ModelRunner, bytes], ArgumentsType]:
+        """
+        The CACHED results of `model_runs`, the cache keys of the models to call, and the arguments to call them with.
+        """
+        def key_of(args_and_kwargs) -> bytes:
+            args, kwargs = args_and_kwargs
+            return arguments_key(CallRequest(methodName=method_name, methodArguments=args, methodKwArguments=kwargs))
+
+        # static arguments are serialized once for every model, per-model arguments are built once per model
+        shared_key = None if callable(arguments) else key_of(arguments)
+        resolved_arguments: dict[ModelRunner, tuple] = {}
+        results: dict[ModelRunner, ModelPredictResult] = {}
+        keys: dict[ModelRunner, bytes] = {}
+        for model in model_runs:
+            if shared_key is None:
+                resolved_arguments[model] = arguments(model)
+                key = key_of(resolved_arguments[model])
+            else:
+                key = shared_key
+            found, result = result_cache.get(model, key)
+            if found:
+                results[model] = ModelPredictResult.of_cached(model, result)
+                if self.call_hooks.active:
+                    self.call_hooks.complete(self.call_hooks.dispatch(model, method_name), results[model])
+            else:
+                keys[model] = key
+
+        if resolved_arguments:
+            arguments = resolved_arguments.__getitem__  # the missed models get the arguments their key was built from
+        return results, keys, arguments
+
+    @staticmethod
+    def _store_cached(result_cache: ResultCache, keys: dict[ModelRunner, bytes], called: dict[ModelRunner, ModelPredictResult]):
+        for model, predict_result in called.items():
+            if predict_result.status == ModelPredictResult.Status.SUCCESS:
+                result_cache.put(model, keys[model], predict_result.result)
+
+    def pipeline(self, window: int = 2) -> CallPipeline:
+        """
+        Creates a `CallPipeline`, to send the next cycles without waiting for the slowest models,
+        with up to `window` calls in flight per model.
+        """
+        return CallPipeline(self, window)
+
+    def notify(
+        self,
+        method_name: str,
+        arguments: ArgumentsType = ([], []),
+        timeout: int | None = None,
+        model_runs: list[ModelRunner] | None = None,
+    ):
+        """
+        Sends a method call to all connected model runners without waiting for it, for methods whose result is not
+        used (e.g. "tick"). The responses are not decoded.
+
+        Failures and timeouts are accounted in the background, as for `call`, and summed up in `notification_stats`.
+        Calls to a model are sent in order: a later `notify` or `call` reaches a model after its pending notifications.
+        A `call` waiting on them still times out after its own timeout (TIMEOUT status).
+
+        Args:
+            method_name (str): The name of the method to call on each model runner.
+            arguments (tuple[list[Argument], list[KwArgument]]): The arguments, or a function of the model runner returning them.
+            model_runs (list[ModelRunner] | None): The model runners to notify. If None, all available model runners.
+        """
+        model_runs, _ = self._select_models(model_runs)
+        for model in model_runs:
+            previous, depth = self._notifications.get(model, (None, 0))
+            if depth >= self.max_pending_notifications:
+                self.notification_stats.dropped += 1
+                continue
+
+            notification = asyncio.create_task(
+                self._notify_model(model, previous, method_name, arguments, timeout),
+                name=f"notify:{model.model_id}",
+            )
+            self._notifications[model] = (notification, depth + 1)
+            notification.add_done_callback(lambda task, model=model: self._notification_done(model, task))
+            self.notification_stats.sent += 1
+
+    async def _notify_model(
+        self,
+        model: ModelRunner,
+        previous: asyncio.Task | None,
+        method_name: str,
+        arguments: ArgumentsType,
+        timeout: int | None,
+    ):
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        try:
+            # the base implementation, this notification must not wait for itself
+            result = await super()._execute_model_method_with_timeout(
+                model, 'call', timeout, method_name, arguments, decode_response=False
+            )
+        except Exception as e:
+            logger.warning(f"Model {model.model_id}: notification {method_name} failed: {e}")
+            self.notification_stats.failed += 1
+            return
+
+        if result.status == ModelPredictResult.Status.SUCCESS:
+            self.notification_stats.succeeded += 1
+        elif result.status == ModelPredictResult.Status.TIMEOUT:
+            self.notification_stats.timed_out += 1
+        elif result.status == ModelPredictResult.Status.SKIPPED:
+            self.notification_stats.skipped += 1
+        else:
+            self.notification_stats.failed += 1
+
+    def _notification_done(self, model: ModelRunner, notification: asyncio.Task):
+        last, depth = self._notifications.get(model, (None, 0))
+        if last is notification:
+            del self._notifications[model]
+        elif last is not None:
+            self._notifications[model] = (last, depth - 1)
+
+    def _execute_model_method_with_timeout(
+        self,
+        model: ModelRunner,
+        method_name: str,
+        timeout: int | None = None,
+        *args: tuple[Any],
+        **kwargs: dict[str, Any],
+    ) -> Awaitable[ModelPredictResult]:
+        pending = self._notifications.get(model)
+        if pending is None:
+            return super()._execute_model_method_with_timeout(model, method_name, timeout, *args, **kwargs)
+        return self._execute_after(pending[0], model, method_name, timeout, *args, **kwargs)
+
+    async def _execute_after(
+        self,
+        notification: asyncio.Task,
+        model: ModelRunner,
+        method_name: str,
+        timeout: int | None = None,
+        *args: tuple[Any],
+        **kwargs: dict[str, Any],
+    ) -> ModelPredictResult:
+        # keep the calls to a model ordered, the wait counts against the call's own timeout
+        timeout = timeout or self.timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        await asyncio.wait([notification], timeout=timeout)
+        remaining = deadline - loop.time()
+        if not notification.done() or remaining <= 0:
+            logger.debug(f"Model {model.model_id}: pending notifications outlasted the {timeout}s timeout")
+            result = ModelPredictResult.of_timeout(model, int(timeout * 1_000_000))
+            if self.call_hooks.active:
+                self.call_hooks.complete(self.call_hooks.dispatch(model, self._call_label(method_name, args)), result)
+            return result
+        return await super()._execute_model_method_with_timeout(model, method_name, remaining, *args, **kwargs)
+
+    def _call_label(self, method_name: str, args: tuple[Any]) -> str:
+        # `call` is generic, the hooks get the remote method name
+        return args[0] if method_name == 'call' and args else method_name
+
+    def invalidate_cache(self, method_name: str | None = None, model_id: str | None = None):
+        """Drop the memoized results of one method (or all), for one model (or all)."""
+        result_caches = [self.result_caches[method_name]] if method_name is not None else self.result_caches.values()
+        for result_cache in result_caches:
+            result_cache.invalidate(model_id)
@@ -3,17 +3,24 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Awaitable, Sequence
 
 from grpc import StatusCode
 from grpc.aio import AioRpcError
 from grpc_health.v1 import health_pb2, health_pb2_grpc
 
+from ..bootstrap_scheduler import BootstrapScheduler
+from ..call_hooks import CallHookDispatcher, CallHooks
+from ..event_coalescer import EventCoalescer
 from ..model_cluster import ModelCluster
 from ..model_runners import ModelRunner
+from ..model_runners.channel_pool import ChannelPool
+from ..model_runners.health_channel_registry import HealthChannelRegistry
 from ..security.credentials import SecureCredentials
+from ..security.crypto_executor import CryptoExecutor
 from ..security.gateway_credentials import GatewayCredentials
 from ..security.wallet_gelegation import AuthError
+from ..utils.loop_monitor import LoopMonitor
 
 logger = logging.getLogger("model_runner_client")
 
@@ -24,6 +31,8 @@ class ModelPredictResult:
         SUCCESS = "SUCCESS"
         FAILED = "FAILED"
         TIMEOUT = "TIMEOUT"
+        SKIPPED = "SKIPPED"
+        CACHED = "CACHED"  # served from a result cache, the model was not called
 
     model_runner: ModelRunner
     result: Any
@@ -42,6 +51,28 @@ class ModelPredictResult:
     def of_timeout(model_runner: ModelRunner, exec_time: int) -> 'ModelPredictResult':
         return ModelPredictResult(model_runner, None, ModelPredictResult.Status.TIMEOUT, exec_time)
 
+    @staticmethod
+    def of_skipped(model_runner: ModelRunner) -> 'ModelPredictResult':
+        return ModelPredictResult(model_runner, None, ModelPredictResult.Status.SKIPPED, 0)
+
+    @staticmethod
+    def of_cached(model_runner: ModelRunner, result: Any) -> 'ModelPredictResult':
+        return ModelPredictResult(model_runner, result, ModelPredictResult.Status.CACHED, 0)
+
+
+class ModelPredictResults(dict[ModelRunner, ModelPredictResult]):
+    """
+    The results of a concurrent call, keyed by model runner.
+    `snapshot_version` is the version of the cluster membership (see `ModelRegistry.snapshot`) the call ran against,
+    None when the models were given explicitly (`model_runs`) as anything else than a `ModelSnapshot`.
+    `cycle` is the cycle number of a pipelined call (see `CallPipeline`), None otherwise.
+    """
+
+    def __init__(self, results: dict[ModelRunner, ModelPredictResult], snapshot_version: int | None = None, cycle: int | None = None):
+        super().__init__(results)
+        self.snapshot_version = snapshot_version
+        self.cycle = cycle
+
 
 class ModelConcurrentRunner(ABC):
     """
@@ -68,6 +99,36 @@ class ModelConcurrentRunner(ABC):
 
     The `report_failure` parameter is set to True by default. If set to False, the system will not report and stop the model node
     Very useful for debugging purposes (example, when you are testing the call interface or TLS certificate is not valid).
+
+    The `channel_pool_size` parameter opens that many connections per model, and `channel_routing` selects how calls
+    are spread over them (see `ChannelPool`). Useful when large payloads are interleaved with small, latency-sensitive calls.
+
+    The `share_health_channels` parameter makes models hosted on the same node share one health check connection
+    (see `HealthChannelRegistry`), roughly halving the number of sockets when many models live behind one IP.
+
+    The `bootstrap_max_concurrency` and `bootstrap_ramp_up_rate` parameters bound how many model connections are
+    initialized at the same time and how many start per second, avoiding handshake storms with thousands of models.
+    The concurrency is capped at 50 connection attempts by default (no limit before), a slot is held per attempt only.
+
+    With `make_before_break`, a model being reconnected keeps its current runner until the new one is ready.
+    While the replacement initializes, the current runner is skipped (SKIPPED status) only if its health check failed.
+
+    With `offload_crypto`, the auth signing and verification done by the interceptors run in a thread pool
+    (see `CryptoExecutor`) instead of the event loop, so a fan-out to many models is not serialized behind them.
+
+    The `update_coalesce_window` parameter collapses bursts of orchestrator updates of the same model (restarts,
+    rolling deployments) into their final state, see `EventCoalescer` and `model_cluster.event_coalescer.stats`.
+
+    With `binary_websocket_encoding`, the orchestrator is asked for msgpack encoded events (needs `msgpack` installed),
+    otherwise JSON is used, parsed with `orjson` when installed. The websocket negotiates permessage-deflate in both cases.
+
+    With `monitor_event_loop`, a `LoopMonitor` measures the event loop lag, counts the live tasks by category
+    (call, reconnect, failure-report, health-check...) and reports the callbacks blocking the loop, see `loop_monitor.stats`.
+    The calls and health checks only run in their own named tasks while the monitor is enabled.
+    `loop_monitor_log_interval` also logs a summary every that many seconds.
+
+    The `call_hooks` parameter (or `add_call_hooks`) plugs `CallHooks` into the call lifecycle (dispatch, result, timeout,
+    failure, skip) and the cluster membership (model added, removed, reconnected), e.g. for tracing or metrics.
     """
     MAX_CONSECUTIVE_FAILURES = 3
     MAX_CONSECUTIVE_TIMEOUTS = 3
@@ -83,16 +144,36 @@ class ModelConcurrentRunner(ABC):
         secure_credentials: SecureCredentials | None = None,
         gateway_credentials: GatewayCredentials | None = None,
         report_failure: bool = True,
+        channel_pool_size: int = 1,
+        channel_routing: ChannelPool.Routing = ChannelPool.Routing.SIZE_CLASS,
+        share_health_channels: bool = False,
+        bootstrap_max_concurrency: int = BootstrapScheduler.MAX_CONCURRENCY,
+        bootstrap_ramp_up_rate: float | None = None,
+        make_before_break: bool = False,
+        offload_crypto: bool = False,
+        update_coalesce_window: float = EventCoalescer.WINDOW,
+        binary_websocket_encoding: bool = False,
+        monitor_event_loop: bool = False,
+        loop_monitor_log_interval: float | None = None,
+        call_hooks: list[CallHooks] | None = None,
     ):
         self.timeout = timeout
         self.host = host
         self.port = port
+        self.call_hooks = CallHookDispatcher()
+        for hooks in call_hooks or []:
+            self.call_hooks.add(hooks)
         self.model_cluster = ModelCluster(
             crunch_id,
             self.host,
             self.port,
             self.create_model_runner,
-            report_failure=report_failure
+            report_failure=report_failure,
+            bootstrap_scheduler=BootstrapScheduler(bootstrap_max_concurrency, bootstrap_ramp_up_rate),
+            make_before_break=make_before_break,
+            update_coalesce_window=update_coalesce_window,
+            binary_encoding=binary_websocket_encoding,
+            call_hooks=self.call_hooks,
         )
 
         self.max_consecutive_failures = max_consecutive_failures
@@ -101,17 +182,47 @@ class ModelConcurrentRunner(ABC):
         self.health_check_threshold = max(1, int(self.max_consecutive_timeout * 0.2))
         self.secure_credentials = secure_credentials
         self.gateway_credentials = gateway_credentials
+        self.channel_pool_size = channel_pool_size
+        self.channel_routing = channel_routing
+        self.health_channel_registry = HealthChannelRegistry() if share_health_channels else None
+        self.crypto_executor = CryptoExecutor() if offload_crypto else None
+        self.loop_monitor = LoopMonitor(log_interval=loop_monitor_log_interval) if monitor_event_loop else None
 
         # TODO: Add recovery mode functionality for handling model timeouts.
         # self.enable_recovery_mode
         # self.recovery_time
 
-    async def init(self):
-        await self.model_cluster.init()
+    async def init(self, ready_fraction: float = 1.0):
+        """
+        Fetch the models from the orchestrator and connect to them.
+
+        Args:
+            ready_fraction (float): Return once this fraction of the models is ready (e.g. 0.9),
+                the others keep connecting in the background. See `ModelCluster.bootstrap_progress`.
+        """
+        if self.loop_monitor:
+            self.loop_monitor.start()
+        await self.model_cluster.init(ready_fraction)
 
     async def sync(self):
         await self.model_cluster.sync()
 
+    def add_call_hooks(self, hooks: CallHooks):
+        self.call_hooks.add(hooks)
+
+    def remove_call_hooks(self, hooks: CallHooks):
+        self.call_hooks.remove(hooks)
+
+    async def close(self):
+        """
+        Report the pending failures to the orchestrator, then close the model connections.
+        """
+        await self.model_cluster.close()
+        if self.crypto_executor:
+            self.crypto_executor.shutdown()
+        if self.loop_monitor:
+            await self.loop_monitor.stop()
+
     @abstractmethod
     def create_model_runner(
         self,
@@ -126,9 +237,10 @@ class ModelConcurrentRunner(ABC):
         model_runs: list[ModelRunner] | None = None,
         *args: tuple[Any],
         **kwargs: dict[str, Any]
-    ) -> dict[ModelRunner, ModelPredictResult]:
+    ) -> ModelPredictResults:
         """
         Executes a method concurrently across all models in the cluster.
+        The models are taken from the current membership snapshot, which is reused as long as no model is added or removed.
 
         Args:
             method_name (str): Name of the method to call on each model.
@@ -136,26 +248,75 @@ class ModelConcurrentRunner(ABC):
             **kwargs: Keyword arguments for the method.
 
         Returns:
-            dict[ModelRunner, ModelPredictResult]: A dictionary where the key is the model runner,
+            ModelPredictResults: A dictionary where the key is the model runner,
             and the value is the result or error status of the method call.
         """
-        model_runs = model_runs or self.model_cluster.models_run.values()
+        model_runs, snapshot_version = self._select_models(model_runs)
         tasks = [
             self._execute_model_method_with_timeout(model, method_name, timeout, *args, **kwargs)
             for model in model_runs
         ]
+        if self.loop_monitor:
+            # named tasks, counted by category by the monitor
+            tasks = [asyncio.create_task(task, name=f"call:{model.model_id}") for task, model in zip(tasks, model_runs)]
 
         logger.debug(f"Executing '{method_name}' tasks concurrently: {tasks}")
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        return {
-            result.model_runner: result
-            for result in results
-            if not isinstance(result, BaseException)
-        }
+        return ModelPredictResults(
+            {
+                result.model_runner: result
+                for result in results
+                if not isinstance(result, BaseException)
+            },
+            snapshot_version,
+        )
+
+
+    def _select_models(self, model_runs: Sequence[ModelRunner] | None) -> tuple[Sequence[ModelRunner], int | None]:
+        """
+        The models to call and the membership version they come from: the current snapshot when `model_runs` is not
+        given, `model_runs` otherwise (its version is only known for a `ModelSnapshot`).
+        """
+        if model_runs:
+            return model_runs, getattr(model_runs, "version", None)
+        snapshot = self.model_cluster.models_run.snapshot()
+        return snapshot.model_runners, snapshot.version
+
+    def _execute_model_method_with_timeout(
+        self,
+        model: ModelRunner,
+        method_name: str,
+        timeout: int | None = None,
+        *args: tuple[Any],
+        **kwargs: dict[str, Any],
+    ) -> Awaitable[ModelPredictResult]:
+        # not a coroutine itself: without hooks, no extra coroutine per call
+        if not self.call_hooks.active:
+            return self._execute_model_method(model, method_name, timeout, *args, **kwargs)
+        return self._execute_hooked_model_method(model, method_name, timeout, *args, **kwargs)
+
+    async def _execute_hooked_model_method(
+        self,
+        model: ModelRunner,
+        method_name: str,
+        timeout: int | None = None,
+        *args: tuple[Any],
+        **kwargs: dict[str, Any],
+    ) -> ModelPredictResult:
+        event = self.call_hooks.dispatch(model, self._call_label(method_name, args))
+        result = None
+        try:
+            result = await self._execute_model_method(model, method_name, timeout, *args, **kwargs)
+            return result
+        finally:
+            self.call_hooks.complete(event, result)
 
+    def _call_label(self, method_name: str, args: tuple[Any]) -> str:
+        """The method name reported to the hooks."""
+        return method_name
 
-    async def _execute_model_method_with_timeout(
+    async def _execute_model_method(
         self,
         model: ModelRunner,
         method_name: str,
@@ -169,6 +330,9 @@ class ModelConcurrentRunner(ABC):
         try:
             method = getattr(model, method_name)
 
+            if not model.healthy:
+                return ModelPredictResult.of_skipped(model)
+
             if model.should_skip_for_timeout_reason():
                 raise asyncio.TimeoutError()
 
@@ -182,16 +346,17 @@ class ModelConcurrentRunner(ABC):
             if not error:
                 model.reset_failures()
                 model.reset_timeouts()
+                model.register_latency(exec_time)
 
                 return ModelPredictResult.of_success(model, result, exec_time)
 
             if error == ModelRunner.ErrorType.BAD_IMPLEMENTATION:
-                asyncio.create_task(self.model_cluster.process_failure(model, 'BAD_IMPLEMENTATION'))  # The model will be stopped
+                self._report_failure(model, 'BAD_IMPLEMENTATION')  # The model will be stopped
             else:
                 model.register_failure()
 
                 if self.max_consecutive_failures and model.consecutive_failures > self.max_consecutive_failures:
-                    asyncio.create_task(self.model_cluster.process_failure(model, 'MULTIPLE_FAILED'))
+                    self._report_failure(model, 'MULTIPLE_FAILED')
 
             return ModelPredictResult.of_failed(model, exec_time)
 
@@ -214,35 +379,47 @@ class ModelConcurrentRunner(ABC):
 
             # Perform health check when consecutive timeouts reach the threshold
             if model.consecutive_timeouts > 0 and (model.consecutive_timeouts % self.health_check_threshold) == 0:
-                try:
-                    hstub = health_pb2_grpc.HealthStub(model.grpc_health_channel)
-                    resp = await hstub.Check(
-                        health_pb2.HealthCheckRequest(service=""),
-                        timeout=timeout,
-                        wait_for_ready=False
-                    )
-                    health_serving = (resp.status == health_pb2.HealthCheckResponse.SERVING)
-                except Exception as he:
-                    health_serving = False
-                    logger.debug(f"Health check failed for model {model.model_id}, {model.model_name}: {he}")
+                health_check = self._check_health(model, timeout)
+                if self.loop_monitor:
+                    health_check = asyncio.create_task(health_check, name=f"health-check:{model.model_id}")
+                health_serving = await health_check
 
             # Determine action: penalize or reconnect
             if health_serving:
                 model.register_timeout()
             else:
                 logger.debug(f"Health not SERVING for model {model.model_id}; scheduling reconnect.")
-                asyncio.create_task(self.model_cluster.reconnect_model_runner(model))
+                model.healthy = False
+                asyncio.create_task(self.model_cluster.reconnect_model_runner(model), name=f"reconnect:{model.model_id}")
 
             if self.max_consecutive_timeout and model.consecutive_timeouts > self.max_consecutive_timeout:
-                asyncio.create_task(self.model_cluster.process_failure(model, 'MULTIPLE_TIMEOUT'))
+                self._report_failure(model, 'MULTIPLE_TIMEOUT')
 
             return ModelPredictResult.of_timeout(model, exec_time)
 
         except AuthError as e:
             logger.error(f"Auth error during concurrent execution of method {method_name} on model {model.model_id}: {e}")
-            asyncio.create_task(self.model_cluster.process_failure(model, 'CONNECTION_FAILED', str(e)))
+            model.invalidate_peer_key()
+            self._report_failure(model, 'CONNECTION_FAILED', str(e))
 
         except Exception:
             logger.error(f"Unexpected error during concurrent execution of method {method_name} on model {model.model_id}", exc_info=True)
 
-            return ModelPredictResult.of_failed(model, exec_time_f())
\ No newline at end of file
+            return ModelPredictResult.of_failed(model, exec_time_f())
+
+    def _report_failure(self, model: ModelRunner, *failure: str):
+        """Report in the background, `failure` is the failure code and optionally its reason (see `ModelCluster.process_failure`)."""
+        asyncio.create_task(self.model_cluster.process_failure(model, *failure), name=f"failure-report:{model.model_id}")
+
+    async def _check_health(self, model: ModelRunner, timeout: int) -> bool:
+        try:
+            hstub = health_pb2_grpc.HealthStub(model.grpc_health_channel)
+            resp = await hstub.Check(
+                health_pb2.HealthCheckRequest(service=""),
+                timeout=timeout,
+                wait_for_ready=False
+            )
+            return resp.status == health_pb2.HealthCheckResponse.SERVING
+        except Exception as he:
+            logger.debug(f"Health check failed for model {model.model_id}, {model.model_name}: {he}")
+            return False
\ No newline at end of file
@@ -0,0 +1,93 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from ..grpc.generated.dynamic_subclass_pb2 import CallRequest
+from ..model_runners import ModelRunner
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    max_entries: int = 1024  # least recently used entries are evicted beyond that
+    ttl: float | None = None  # seconds, None: entries never expire
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0  # entries dropped because the model runner was replaced
+
+
+@dataclass
+class _Entry:
+    model_runner: ModelRunner
+    result: Any
+    expires_at: float | None
+
+
+def arguments_key(call_request: CallRequest) -> bytes:
+    """Digest of the method name and its serialized arguments."""
+    return hashlib.blake2b(call_request.SerializeToString(deterministic=True), digest_size=16).digest()
+
+
+class ResultCache:
+    """
+    Memoized results of one method, keyed by (model_id, deployment_id, arguments digest).
+
+    Only meant for methods that are pure functions of their arguments. An entry is only returned for the
+    model runner that produced it: once a model is reconnected or redeployed, its entries are dropped.
+    """
+
+    def __init__(self, policy: CachePolicy = CachePolicy()):
+        self.policy = policy
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[str, str, bytes], _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model_runner: ModelRunner, key: bytes) -> tuple[bool, Any]:
+        """:return: (found, result)"""
+        entry_key = (model_runner.model_id, model_runner.deployment_id, key)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            self.stats.misses += 1
+            return False, None
+
+        if entry.model_runner is not model_runner:
+            self.stats.invalidations += 1
+            self.stats.misses += 1
+            del self._entries[entry_key]
+            return False, None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            del self._entries[entry_key]
+            return False, None
+
+        self._entries.move_to_end(entry_key)
+        self.stats.hits += 1
+        return True, entry.result
+
+    def put(self, model_runner: ModelRunner, key: bytes, result: Any):
+        expires_at = time.monotonic() + self.policy.ttl if self.policy.ttl is not None else None
+        entry_key = (model_runner.model_id, model_runner.deployment_id, key)
+        self._entries[entry_key] = _Entry(model_runner, result, expires_at)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.policy.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, model_id: str | None = None):
+        if model_id is None:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+            return
+
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == model_id]:
+            del self._entries[entry_key]
+            self.stats.invalidations += 1
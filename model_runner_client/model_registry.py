@@ -0,0 +1,200 @@
+import bisect
+import itertools
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+from .model_runners import ModelRunner
+
+_INDEXED_ATTRIBUTES = ("deployment_id", "ip", "model_name")
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    """
+    The running models at a given registry version. Never mutated: a membership change creates a new snapshot,
+    so a fan-out iterating over it is not affected by models added or removed meanwhile.
+    """
+    version: int
+    model_runners: tuple[ModelRunner, ...]
+
+    def __iter__(self) -> Iterator[ModelRunner]:
+        return iter(self.model_runners)
+
+    def __len__(self) -> int:
+        return len(self.model_runners)
+
+
+class ModelRegistry(MutableMapping[str, ModelRunner]):
+    """
+    The running models of a cluster, keyed by model_id, with secondary indexes for selection queries.
+
+        registry.select(ip="10.0.0.3")
+        registry.select(deployment_id="deployment_1", cruncher_hotkey="5F...")  # keyword arguments other than the
+                                                                                # attributes below match `infos` fields
+        registry.select(healthy=True, where=lambda model: model.consecutive_timeouts == 0)
+        registry.select(latency_tier=0)  # models answering within 10 ms on average
+
+    `deployment_id`, `ip` and `model_name` are indexed, and so is every `infos` field once it has been queried.
+    Indexes are maintained on add/remove and on `update_infos`, which must be used instead of assigning `infos`.
+
+    Selections are frozen tuples cached until the membership (or the infos) changes, so selecting the same subset
+    every prediction cycle costs a dictionary lookup. `healthy`, `latency_tier` and `where` depend on the runner's
+    live state and are evaluated on each call, on top of the cached selection.
+
+    The latency tier of a model is the index of the first `LATENCY_TIERS_US` bound above its average call latency
+    (`ModelRunner.latency_us`): 0 up to 10 ms, 1 up to 100 ms, 2 up to 1 s, 3 beyond. Models not called yet are in tier 0.
+    """
+    MAX_CACHED_SELECTIONS = 128
+    LATENCY_TIERS_US = (10_000, 100_000, 1_000_000)
+
+    def __init__(self):
+        self._models: dict[str, ModelRunner] = {}
+        self._ranks: dict[str, int] = {}  # insertion rank by model id, to order the selections
+        self._next_rank = itertools.count()
+        self._indexes: dict[str, dict[Any, set[str]]] = {field: {} for field in _INDEXED_ATTRIBUTES}  # field -> value -> model ids
+        self._selections: dict[tuple, tuple[ModelRunner, ...]] = {}
+        self._snapshot: ModelSnapshot | None = None
+        self.version = 0  # bumped on every membership or infos change
+
+    def __getitem__(self, model_id: str) -> ModelRunner:
+        return self._models[model_id]
+
+    def __setitem__(self, model_id: str, model_runner: ModelRunner):
+        if model_id in self._models:
+            self._unindex(self._models[model_id])
+        else:
+            self._ranks[model_id] = next(self._next_rank)
+        self._models[model_id] = model_runner
+        self._index(model_runner)
+        self._changed()
+
+    def __delitem__(self, model_id: str):
+        model_runner = self._models.pop(model_id)
+        del self._ranks[model_id]
+        self._unindex(model_runner)
+        self._changed()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._models)
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __repr__(self) -> str:
+        return f"ModelRegistry({len(self._models)} models, version {self.version})"
+
+    def snapshot(self) -> ModelSnapshot:
+        """The current snapshot, reused as long as nothing changed (copy-on-write)."""
+        if self._snapshot is None:
+            self._snapshot = ModelSnapshot(self.version, tuple(self._models.values()))
+        return self._snapshot
+
+    def update_infos(self, model_id: str, infos: dict | None, model_name: str | None):
+        model_runner = self._models[model_id]
+        if model_runner.infos == infos and model_runner.model_name == model_name:
+            return
+
+        self._unindex(model_runner)
+        model_runner.infos = infos
+        model_runner.model_name = model_name
+        self._index(model_runner)
+        self._changed()
+
+    def select(
+        self,
+        deployment_id: str | None = None,
+        ip: str | None = None,
+        model_name: str | None = None,
+        healthy: bool | None = None,
+        latency_tier: int | None = None,
+        where: Callable[[ModelRunner], bool] | None = None,
+        **infos: Any,
+    ) -> tuple[ModelRunner, ...]:
+        """
+        Models matching every given criterion, in insertion order.
+
+        :param infos: `infos` fields to match, e.g. `cruncher_hotkey="5F..."` (values must be hashable).
+        """
+        criteria = {"deployment_id": deployment_id, "ip": ip, "model_name": model_name}
+        criteria = {field: value for field, value in criteria.items() if value is not None}
+        criteria.update({_infos_field(key): value for key, value in infos.items()})
+
+        key = tuple(sorted(criteria.items()))
+        selection = self._selections.get(key)
+        if selection is None:
+            selection = self._select(criteria)
+            if len(self._selections) >= self.MAX_CACHED_SELECTIONS:
+                self._selections.pop(next(iter(self._selections)))
+            self._selections[key] = selection
+
+        if healthy is not None:
+            selection = tuple(model_runner for model_runner in selection if model_runner.healthy == healthy)
+        if latency_tier is not None:
+            selection = tuple(model_runner for model_runner in selection if self.latency_tier(model_runner) == latency_tier)
+        if where is not None:
+            selection = tuple(model_runner for model_runner in selection if where(model_runner))
+        return selection
+
+    def _select(self, criteria: dict[str, Any]) -> tuple[ModelRunner, ...]:
+        if not criteria:
+            return tuple(self._models.values())
+
+        candidates: set[str] | None = None
+        for field, value in sorted(criteria.items(), key=lambda item: len(self._index_of(item[0]).get(item[1], ()))):
+            model_ids = self._index_of(field).get(value, set())
+            candidates = model_ids if candidates is None else candidates & model_ids
+            if not candidates:
+                return ()
+
+        return tuple(self._models[model_id] for model_id in sorted(candidates, key=self._ranks.__getitem__))
+
+    def latency_tier(self, model_runner: ModelRunner) -> int:
+        return bisect.bisect_left(self.LATENCY_TIERS_US, model_runner.latency_us)
+
+    def _index_of(self, field: str) -> dict[Any, set[str]]:
+        index = self._indexes.get(field)
+        if index is None:
+            # built on the first query on this field, maintained afterward
+            index = self._indexes[field] = {}
+            for model_runner in self._models.values():
+                _add(index, _field_value(model_runner, field), model_runner.model_id)
+        return index
+
+    def _index(self, model_runner: ModelRunner):
+        for field, index in self._indexes.items():
+            _add(index, _field_value(model_runner, field), model_runner.model_id)
+
+    def _unindex(self, model_runner: ModelRunner):
+        for field, index in self._indexes.items():
+            value = _field_value(model_runner, field)
+            model_ids = index.get(value)
+            if model_ids is not None:
+                model_ids.discard(model_runner.model_id)
+                if not model_ids:
+                    del index[value]
+
+    def _changed(self):
+        self.version += 1
+        self._selections.clear()
+        self._snapshot = None
+
+
+def _infos_field(key: str) -> str:
+    return f"infos.{key}"
+
+
+def _field_value(model_runner: ModelRunner, field: str) -> Any:
+    if field in _INDEXED_ATTRIBUTES:
+        return getattr(model_runner, field)
+    value = (model_runner.infos or {}).get(field.removeprefix("infos."))
+    try:
+        hash(value)
+    except TypeError:
+        return None  # lists, dicts... cannot be selected on
+    return value
+
+
+def _add(index: dict[Any, set[str]], value: Any, model_id: str):
+    if value is not None:
+        index.setdefault(value, set()).add(model_id)
@@ -1,2 +1,3 @@
 from .dynamic_subclass_model_runner import DynamicSubclassModelRunner, ArgumentsType, ArgsAndKwargsTuple
 from .model_runner import ModelRunner
+from .call_order import CallOrder
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from grpc import StatusCode
+from grpc.aio import AioRpcError
+
+from ..grpc.generated.dynamic_subclass_pb2 import CallRequest, CallResponse
+
+logger = logging.getLogger("model_runner_client.call_batcher")
+
+SendCall = Callable[[CallRequest, float | None], Awaitable[CallResponse | None]]
+SendBatch = Callable[[list[CallRequest], float | None], Awaitable[list[CallResponse]]]
+
+
+@dataclass
+class BatcherStats:
+    calls: int = 0
+    batches: int = 0  # BatchCall requests sent
+    batched_calls: int = 0  # calls sent within a BatchCall
+
+
+@dataclass
+class _PendingCall:
+    call_request: CallRequest
+    timeout: float | None
+    future: asyncio.Future
+
+
+class CallBatcher:
+    """
+    Coalesces the calls to one model issued within `window` seconds (or up to `max_batch_size` calls)
+    into a single `BatchCall` request, and hands each caller its own response.
+
+    A call alone in its window is sent as a plain `Call`. Model nodes without `BatchCall` (UNIMPLEMENTED)
+    get the batched calls resent one by one, and batching is turned off for them.
+    """
+
+    WINDOW = 0.002
+    MAX_BATCH_SIZE = 32
+
+    def __init__(
+        self,
+        send_call: SendCall,
+        send_batch: SendBatch,
+        window: float = WINDOW,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        name: str = "batch-call",
+    ):
+        """
+        :param send_call: Sends one `CallRequest`.
+        :param send_batch: Sends a `BatchCallRequest` of the given calls, returns the responses in the same order.
+        :param name: Name of the tasks sending the batches.
+        """
+        self.send_call = send_call
+        self.send_batch = send_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.name = name
+        self.supported = True
+        self.stats = BatcherStats()
+
+        self._pending: list[_PendingCall] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def call(self, call_request: CallRequest, timeout: float | None = None) -> CallResponse | None:
+        self.stats.calls += 1
+        if not self.supported:
+            return await self.send_call(call_request, timeout)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())  # retrieved even if the caller gave up
+        self._pending.append(_PendingCall(call_request, timeout, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self.flush)
+
+        # the batch may last longer (another caller's timeout), this caller still times out on its own
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    def flush(self):
+        """Send the pending calls now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        asyncio.create_task(self._send(batch), name=self.name)
+
+    async def _send(self, batch: list[_PendingCall]):
+        if len(batch) == 1:
+            await self._send_one(batch[0])
+            return
+
+        timeouts = [pending_call.timeout for pending_call in batch]
+        batch_timeout = None if None in timeouts else max(timeouts)
+        try:
+            responses = await self.send_batch([pending_call.call_request for pending_call in batch], batch_timeout)
+        except AioRpcError as e:
+            if e.code() != StatusCode.UNIMPLEMENTED:
+                self._fail(batch, e)
+                return
+
+            logger.info(f"{self.name}: BatchCall not implemented by the model, calls are sent one by one")
+            self.supported = False
+            await asyncio.gather(*(self._send_one(pending_call) for pending_call in batch))
+            return
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        self.stats.batches += 1
+        self.stats.batched_calls += len(batch)
+        if len(responses) != len(batch):
+            self._fail(batch, ValueError(f"BatchCall returned {len(responses)} responses for {len(batch)} calls"))
+            return
+        for pending_call, response in zip(batch, responses):
+            if not pending_call.future.done():
+                pending_call.future.set_result(response)
+
+    async def _send_one(self, pending_call: _PendingCall):
+        try:
+            response = await self.send_call(pending_call.call_request, pending_call.timeout)
+        except Exception as e:
+            self._fail([pending_call], e)
+            return
+        if not pending_call.future.done():
+            pending_call.future.set_result(response)
+
+    @staticmethod
+    def _fail(batch: list[_PendingCall], error: Exception):
+        for pending_call in batch:
+            if not pending_call.future.done():
+                pending_call.future.set_exception(error)
@@ -0,0 +1,34 @@
+import asyncio
+
+CALL_SEQUENCE_METADATA = "x-call-sequence"
+
+
+class CallOrder:
+    """
+    Position of a call among the ordered calls to one model, reserved with `ModelRunner.reserve_call_order`.
+
+    An ordered call is started only once the previous one was started (or given up), on a single channel,
+    so gRPC opens their streams in sequence order. The sequence number is also sent in the
+    `x-call-sequence` metadata, for model nodes that process calls concurrently and reorder them. It is also
+    the only guarantee left when an interceptor awaits before sending (gateway token signing).
+    """
+    __slots__ = ("sequence", "previous", "started")
+
+    def __init__(self, sequence: int, previous: asyncio.Future | None):
+        self.sequence = sequence
+        self.previous = previous
+        self.started = asyncio.get_running_loop().create_future()
+
+    async def wait_for_previous(self):
+        if self.previous is not None:
+            # shielded: a cancelled call must not break the chain of the next ones
+            await asyncio.shield(self.previous)
+
+    def release(self):
+        """Let the next call start, once this one was started or will not be sent at all."""
+        if not self.started.done():
+            self.started.set_result(None)
+
+    @property
+    def metadata(self) -> tuple[tuple[str, str], ...]:
+        return ((CALL_SEQUENCE_METADATA, str(self.sequence)),)
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable
+
+from grpc import StatusCode
+from grpc.aio import AioRpcError
+
+logger = logging.getLogger("model_runner_client.channel_pool")
+
+
+@dataclass
+class ChannelStats:
+    """Per-connection counters, updated on every call routed through the pool."""
+    calls: int = 0
+    in_flight: int = 0
+    failures: int = 0
+    unavailable: int = 0
+    bytes_sent: int = 0
+    total_latency_us: int = 0
+
+    @property
+    def mean_latency_us(self) -> float:
+        return self.total_latency_us / self.calls if self.calls else 0.0
+
+
+class ChannelPool:
+    """
+    A fixed set of gRPC channels (each one its own TCP connection and HTTP/2
+    flow-control window) towards the same model.
+
+    Routing:
+        - SIZE_CLASS: small payloads always use channel 0, large payloads
+          (>= `large_payload_threshold` bytes) are spread over the remaining
+          channels, so a multi-MB upload never sits in front of a latency-sensitive call.
+        - ROUND_ROBIN: every call goes to the next channel.
+
+    A call failing with UNAVAILABLE is retried once on a different channel.
+    """
+
+    class Routing(Enum):
+        ROUND_ROBIN = "ROUND_ROBIN"
+        SIZE_CLASS = "SIZE_CLASS"
+
+    LARGE_PAYLOAD_THRESHOLD = 256 * 1024  # 256 KiB
+
+    def __init__(
+        self,
+        channels: list[Any],
+        routing: Routing = Routing.SIZE_CLASS,
+        large_payload_threshold: int = LARGE_PAYLOAD_THRESHOLD,
+    ):
+        if not channels:
+            raise ValueError("A channel pool needs at least one channel")
+
+        self.channels = channels
+        self.routing = routing
+        self.large_payload_threshold = large_payload_threshold
+        self.stats = [ChannelStats() for _ in channels]
+        self._next_index = 0
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def select(self, payload_size: int = 0, exclude: int | None = None) -> int:
+        """
+        Return the index of the channel to use for a payload of `payload_size` bytes.
+        `exclude` is skipped whenever another channel is available.
+        """
+        size = len(self.channels)
+        if size == 1:
+            return 0
+
+        if self.routing == ChannelPool.Routing.SIZE_CLASS:
+            if payload_size >= self.large_payload_threshold:
+                candidates = range(1, size)
+            else:
+                candidates = range(0, 1)
+            candidates = [i for i in candidates if i != exclude] or [i for i in range(size) if i != exclude]
+            # least loaded channel first, the stats are cheap to read
+            return min(candidates, key=lambda i: self.stats[i].in_flight)
+
+        index = self._next_index % size
+        if index == exclude:
+            index = (index + 1) % size
+        self._next_index = index + 1
+        return index
+
+    async def call(
+        self,
+        payload_size: int,
+        rpc: Callable[[int, float | None], Awaitable[Any]],
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Run `rpc(channel_index, timeout)` on the selected channel, keeping the stats up to date.
+        On UNAVAILABLE, the call is retried once on another channel with the remaining timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+
+        index = self.select(payload_size)
+        try:
+            return await self._call_on(index, payload_size, rpc, timeout)
+        except AioRpcError as e:
+            if e.code() != StatusCode.UNAVAILABLE or len(self.channels) == 1:
+                raise
+
+            remaining = deadline - loop.time() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                raise
+
+            retry_index = self.select(payload_size, exclude=index)
+            logger.debug(f"Channel {index} unavailable, retrying on channel {retry_index}")
+            return await self._call_on(retry_index, payload_size, rpc, remaining)
+
+    async def _call_on(self, index: int, payload_size: int, rpc, timeout: float | None):
+        stats = self.stats[index]
+        stats.calls += 1
+        stats.in_flight += 1
+        stats.bytes_sent += payload_size
+        start_time = asyncio.get_running_loop().time()
+        try:
+            return await rpc(index, timeout)
+        except AioRpcError as e:
+            stats.failures += 1
+            if e.code() == StatusCode.UNAVAILABLE:
+                stats.unavailable += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_latency_us += int((asyncio.get_running_loop().time() - start_time) * 1_000_000)
+
+    async def close(self):
+        await asyncio.gather(*(channel.close() for channel in self.channels))
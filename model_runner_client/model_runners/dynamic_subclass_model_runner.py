@@ -1,12 +1,21 @@
+import asyncio
+import functools
+import time
 from typing import Any, Callable, Optional, Union, cast
 
+from grpc.aio import AioRpcError
+
 from ..errors import InvalidCoordinatorUsageError
 from ..grpc.generated.commons_pb2 import Argument, KwArgument
-from ..grpc.generated.dynamic_subclass_pb2 import (CallRequest, CallResponse,
-                                                   SetupRequest, SetupResponse)
+from ..grpc.generated.dynamic_subclass_pb2 import (BatchCallRequest, CallRequest,
+                                                   CallResponse, SetupRequest,
+                                                   SetupResponse)
 from ..grpc.generated.dynamic_subclass_pb2_grpc import \
     DynamicSubclassServiceStub
+from ..model_runners.call_batcher import CallBatcher
+from ..model_runners.call_order import CallOrder
 from ..model_runners.model_runner import ModelRunner
+from ..utils.call_recorder import CallRecorder
 from ..utils.datatype_transformer import decode_data
 
 ArgsAndKwargsTuple = tuple[list[Argument] | None, list[KwArgument] | None]
@@ -23,6 +32,9 @@ class DynamicSubclassModelRunner(ModelRunner):
         base_classname: str,
         instance_args: list[Argument] = [],
         instance_kwargs: list[KwArgument] = [],
+        call_recorder: CallRecorder | None = None,
+        batch_window: float | None = None,
+        max_batch_size: int = CallBatcher.MAX_BATCH_SIZE,
         **kwargs
     ):
         """
@@ -37,15 +49,28 @@ class DynamicSubclassModelRunner(ModelRunner):
             port (int): The port number of the model runner service.
             instance_args (list[Argument]): A list of positional arguments to initialize the model instance.
             instance_kwargs (list[KwArgument]): A list of keyword arguments to initialize the model instance.
+            call_recorder (CallRecorder): Records the calls (request, response, latency) for offline replay.
+            batch_window (float): When set, the calls issued within that many seconds (up to `max_batch_size`)
+                are sent as one `BatchCall` request, see `CallBatcher`.
         """
         self.base_classname = base_classname
         self.instance_args = instance_args
         self.instance_kwargs = instance_kwargs
+        self.call_recorder = call_recorder
 
         self.grpc_stub: Optional[DynamicSubclassServiceStub] = None
+        self.grpc_stubs: list[DynamicSubclassServiceStub] = []
 
         super().__init__(**kwargs)
 
+        self.call_batcher = CallBatcher(
+            self._send_single_call,
+            self._send_batch_call,
+            batch_window,
+            max_batch_size,
+            name=f"batch-call:{self.model_id}",
+        ) if batch_window is not None else None
+
     async def setup(self, grpc_channel: Any) -> tuple[bool, ModelRunner.ErrorType | None]:
         """
         Asynchronously setup the gRPC stub and initialize the model instance
@@ -55,6 +80,10 @@ class DynamicSubclassModelRunner(ModelRunner):
             Any exceptions raised during the gRPC Setup call.
         """
         self.grpc_stub = DynamicSubclassServiceStub(grpc_channel)
+        # One stub per pooled channel, the first one is the setup channel
+        self.grpc_stubs = [self.grpc_stub]
+        if self.channel_pool:
+            self.grpc_stubs += [DynamicSubclassServiceStub(channel) for channel in self.channel_pool.channels[1:]]
         setup_response: SetupResponse = await self.grpc_stub.Setup(SetupRequest(className=self.base_classname, instanceArguments=self.instance_args, instanceKwArguments=self.instance_kwargs))
         status_code = setup_response.status.code
         if status_code == 'SUCCESS':
@@ -70,7 +99,9 @@ class DynamicSubclassModelRunner(ModelRunner):
         self,
         method_name: str,
         arguments: ArgumentsType = ([], []),
-        timeout: int | None = None
+        timeout: int | None = None,
+        decode_response: bool = True,
+        order: CallOrder | None = None,
     ) -> tuple[Any, ModelRunner.ErrorType | None]:
         """
         An asynchronous method for executing a remote procedure call over gRPC using method name,
@@ -80,6 +111,9 @@ class DynamicSubclassModelRunner(ModelRunner):
             method_name (str): The name of the remote method to invoke.
             args (list[Argument]): A list of positional arguments for the remote method.
             kwargs (list[KwArgument]): A list of keyword arguments for the remote method.
+            decode_response (bool): When False, the returned value of a successful call is not decoded (None is returned).
+            order (CallOrder): Position of the call among the ordered calls to this model (see `reserve_call_order`).
+                Ordered calls are sent on the setup channel and never batched.
         """
 
         if callable(arguments):
@@ -91,12 +125,19 @@ class DynamicSubclassModelRunner(ModelRunner):
             raise InvalidCoordinatorUsageError("gRPC stub is not initialized, please call setup() first.")
 
         call_request = CallRequest(methodName=method_name, methodArguments=args, methodKwArguments=kwargs)
-        call_response = cast(Optional[CallResponse], await self.grpc_stub.Call(call_request, timeout=timeout, wait_for_ready=True))
+        send = functools.partial(self._send_ordered_call, order=order) if order is not None else self._send_call
+        if self.call_recorder:
+            call_response = await self._send_recorded_call(call_request, timeout, send)
+        else:
+            call_response = await send(call_request, timeout)
+        call_response = cast(Optional[CallResponse], call_response)
         if call_response is None:
             return None, self.ErrorType.FAILED
 
         status_code = call_response.status.code
         if status_code == 'SUCCESS':
+            if not decode_response:
+                return None, None
             return decode_data(call_response.methodResponse.value, call_response.methodResponse.type), None
         elif status_code == 'INVALID_ARGUMENT' or status_code == 'FAILED_PRECONDITION':
             raise InvalidCoordinatorUsageError(call_response.status.message)
@@ -104,3 +145,56 @@ class DynamicSubclassModelRunner(ModelRunner):
             return None, self.ErrorType.BAD_IMPLEMENTATION
         else:
             return None, self.ErrorType.FAILED
+
+    async def _send_call(self, call_request: CallRequest, timeout: int | None) -> CallResponse | None:
+        if self.call_batcher:
+            return await self.call_batcher.call(call_request, timeout)
+        return await self._send_single_call(call_request, timeout)
+
+    async def _send_ordered_call(self, call_request: CallRequest, timeout: int | None, order: CallOrder) -> CallResponse | None:
+        try:
+            await order.wait_for_previous()
+            # one channel, the call is created synchronously: its stream is opened before the next call's
+            grpc_call = self.grpc_stub.Call(call_request, timeout=timeout, metadata=order.metadata, wait_for_ready=True)
+        finally:
+            order.release()
+        return await grpc_call
+
+    async def _send_single_call(self, call_request: CallRequest, timeout: int | None) -> CallResponse | None:
+        if self.channel_pool:
+            return await self.channel_pool.call(
+                call_request.ByteSize(),
+                lambda index, remaining: self.grpc_stubs[index].Call(call_request, timeout=remaining, wait_for_ready=True),
+                timeout=timeout,
+            )
+        return await self.grpc_stub.Call(call_request, timeout=timeout, wait_for_ready=True)
+
+    async def _send_batch_call(self, call_requests: list[CallRequest], timeout: int | None) -> list[CallResponse]:
+        batch_request = BatchCallRequest(calls=call_requests)
+        if self.channel_pool:
+            batch_response = await self.channel_pool.call(
+                batch_request.ByteSize(),
+                lambda index, remaining: self.grpc_stubs[index].BatchCall(batch_request, timeout=remaining, wait_for_ready=True),
+                timeout=timeout,
+            )
+        else:
+            batch_response = await self.grpc_stub.BatchCall(batch_request, timeout=timeout, wait_for_ready=True)
+        return list(batch_response.responses)
+
+    async def _send_recorded_call(
+        self,
+        call_request: CallRequest,
+        timeout: int | None,
+        send: Callable[[CallRequest, int | None], Any],
+    ) -> CallResponse | None:
+        started_at = time.time()
+        try:
+            call_response = await send(call_request, timeout)
+        except AioRpcError as e:
+            self.call_recorder.record_error(self.model_id, call_request, started_at, e.code().name)
+            raise
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self.call_recorder.record_error(self.model_id, call_request, started_at, None)
+            raise
+        self.call_recorder.record_response(self.model_id, call_request, started_at, call_response)
+        return call_response
@@ -0,0 +1,58 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger("model_runner_client.health_channel_registry")
+
+
+@dataclass
+class _SharedChannel:
+    channel: Any
+    ref_count: int
+
+
+class HealthChannelRegistry:
+    """
+    Node-level health-check multiplexer.
+
+    Model runners reaching the same node (same target and same transport credentials) share a single
+    health channel instead of opening one each. The channel is reference counted and closed when the
+    last runner releases it.
+
+    The key must identify everything that makes a channel unique (target, TLS root, authority...):
+    in secure mode each model presents its own server hostname, so health channels end up not shared there.
+    """
+
+    def __init__(self):
+        self._channels: dict[Hashable, _SharedChannel] = {}
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._channels
+
+    def acquire(self, key: Hashable, create_channel: Callable[[], Any]) -> Any:
+        shared = self._channels.get(key)
+        if shared is None:
+            shared = _SharedChannel(channel=create_channel(), ref_count=0)
+            self._channels[key] = shared
+            logger.debug(f"Health channel opened for {key[:2] if isinstance(key, tuple) else key}")
+
+        shared.ref_count += 1
+        return shared.channel
+
+    async def release(self, key: Hashable):
+        shared = self._channels.get(key)
+        if shared is None:
+            return
+
+        shared.ref_count -= 1
+        if shared.ref_count <= 0:
+            del self._channels[key]
+            await shared.channel.close()
+            logger.debug(f"Health channel closed for {key[:2] if isinstance(key, tuple) else key}")
+
+    def ref_count(self, key: Hashable) -> int:
+        shared = self._channels.get(key)
+        return shared.ref_count if shared else 0
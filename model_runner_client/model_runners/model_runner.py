@@ -3,22 +3,29 @@ import asyncio
 import logging
 import math
 import uuid
+from contextlib import nullcontext
 from enum import Enum
-from typing import Any
+from typing import Any, AsyncContextManager, Callable
 
 import grpc
 from grpc.aio import AioRpcError
 
 from ..errors import InvalidCoordinatorUsageError
 from ..security.credentials import SecureCredentials
+from ..security.crypto_executor import CryptoExecutor
 from ..security.gateway_auth_interceptor import GatewayAuthClientInterceptor
 from ..security.gateway_credentials import GatewayCredentials
 from ..security.grpc_auth_interceptor import WalletTlsAuthClientInterceptor
-from ..security.tls_peer_key import fetch_peer_rsa_spki_mtls, TlsProbeError, is_tls_connection
+from ..security.tls_peer_key import TlsProbeError, is_tls_connection
 from ..security.wallet_gelegation import AuthError
+from .call_order import CallOrder
+from .channel_pool import ChannelPool
+from .health_channel_registry import HealthChannelRegistry
 
 logger = logging.getLogger("model_runner_client.model_runner")
 
+LATENCY_SMOOTHING = 0.2  # weight of the last call in `ModelRunner.latency_us`
+
 
 class ModelRunner:
     class ErrorType(Enum):
@@ -39,6 +46,10 @@ class ModelRunner:
         retry_backoff_factor: float = 2,
         secure_credentials: SecureCredentials | None = None,
         gateway_credentials: GatewayCredentials | None = None,
+        channel_pool_size: int = 1,
+        channel_routing: ChannelPool.Routing = ChannelPool.Routing.SIZE_CLASS,
+        health_channel_registry: HealthChannelRegistry | None = None,
+        crypto_executor: CryptoExecutor | None = None,
     ):
         self.runner_id = uuid.uuid4().hex  # unique identifier per instance
         self.deployment_id = deployment_id
@@ -52,25 +63,52 @@ class ModelRunner:
 
         self.grpc_channel = None
         self.grpc_health_channel = None
+        self.channel_pool: ChannelPool | None = None
+        if channel_pool_size < 1:
+            raise ValueError("channel_pool_size must be at least 1")
+        self.channel_pool_size = channel_pool_size
+        self.channel_routing = channel_routing
+        self.health_channel_registry = health_channel_registry
+        self.health_channel_key: tuple | None = None
         self.retry_attempts = 5  # args ?
         self.min_retry_interval = 2  # 2 seconds
         self.closed = False
+        self.healthy = True  # False once a health check failed, until the runner is replaced
         self.consecutive_failures = 0
         self.consecutive_timeouts = 0
         self.cooldown_calls_remaining = 0
+        self.latency_us = 0.0  # moving average of the successful calls' execution time, 0 before the first one
+        self.call_sequence = 0  # next ordered call, see `reserve_call_order`
+        self._last_call_order: CallOrder | None = None
 
         if secure_credentials and gateway_credentials:
             raise ValueError("secure_credentials and gateway_credentials are mutually exclusive")
 
         self.secure_credentials = secure_credentials
         self.gateway_credentials = gateway_credentials
+        self.crypto_executor = crypto_executor
         self.server_hostname = f"model-node-{self.model_id}.crunchdao.internal"
+        self.gateway_token_registered = False
+
+    def reserve_call_order(self) -> CallOrder:
+        """
+        Reserve the next position among the ordered calls to this model. Reservations are made in the order the calls
+        must reach the model, every reserved `CallOrder` must be passed to a call or released.
+        """
+        previous = self._last_call_order.started if self._last_call_order else None
+        self._last_call_order = CallOrder(self.call_sequence, previous)
+        self.call_sequence += 1
+        return self._last_call_order
 
     @abc.abstractmethod
     async def setup(self, grpc_channel) -> tuple[bool, ErrorType | None]:
         pass
 
-    async def init(self) -> tuple[bool, ErrorType | None]:
+    async def init(self, admission: Callable[[], AsyncContextManager] | None = None) -> tuple[bool, ErrorType | None]:
+        """
+        :param admission: Entered around each connection attempt (e.g. a `BootstrapScheduler` slot),
+            it is not held during the backoff between attempts.
+        """
         self.grpc_options: list[tuple[str, any]] = [
             # Very fast reconnection
             ("grpc.initial_reconnect_backoff_ms", 100),  # 100 ms on the first attempt
@@ -96,23 +134,27 @@ class ModelRunner:
                 logger.debug(f"Model runner {self.model_id} closed, aborting initialization")
                 return False, self.ErrorType.ABORTED
             try:
-                if is_secure_connection:
-                    await self._connect_secure_channels()
-                elif is_gateway_connection:
-                    self._connect_gateway_channels()
-                else:
-                    self._connect_insecure_channels()
-
-                await asyncio.wait_for(self.grpc_channel.channel_ready(), timeout=grpc_setup_timeout)
-                await asyncio.wait_for(self.grpc_health_channel.channel_ready(), timeout=grpc_setup_timeout)
-
-                # todo what happen is this take long time, need to add timeout ????
-                setup_succeed, error = await self.setup(self.grpc_channel)
+                async with admission() if admission else nullcontext():
+                    await self._release_health_channel()
+                    if is_secure_connection:
+                        await self._connect_secure_channels()
+                    elif is_gateway_connection:
+                        self._connect_gateway_channels()
+                    else:
+                        self._connect_insecure_channels()
+
+                    await asyncio.wait_for(asyncio.gather(*(channel.channel_ready() for channel in self.channel_pool.channels)), timeout=grpc_setup_timeout)
+                    await asyncio.wait_for(self.grpc_health_channel.channel_ready(), timeout=grpc_setup_timeout)
+
+                    # todo what happen is this take long time, need to add timeout ????
+                    setup_succeed, error = await self.setup(self.grpc_channel)
                 if setup_succeed:
                     logger.info(f"Model {self.model_id} ({self.model_name}) connected at {self.ip}:{self.port}")
                 return setup_succeed, error
 
             except (AioRpcError, asyncio.TimeoutError) as e:
+                # the cached peer certificate may be outdated (e.g. node restarted with a new certificate)
+                self.invalidate_peer_key()
                 if not is_secure_connection and await is_tls_connection(self.ip, self.port):
                     raise InvalidCoordinatorUsageError("The Model Nodes are in secure mode and credentials were not provided for connection.")
 
@@ -123,6 +165,7 @@ class ModelRunner:
                 raise
 
             except (AuthError, TlsProbeError) as e:
+                self.invalidate_peer_key()
                 logger.warning(f"Model runner {self.model_id} initialization failed due to authentication error => {e}")
                 return False, self.ErrorType.AUTH_ERROR
 
@@ -142,12 +185,23 @@ class ModelRunner:
                 logger.error(f"Model {self.model_id} failed to initialize after {self.retry_attempts} attempts.", exc_info=last_error)
                 return False, self.ErrorType.GRPC_CONNECTION_FAILED
 
+    def invalidate_peer_key(self):
+        """Drop the cached TLS probe result of this model (secure mode only)."""
+        if self.secure_credentials is not None:
+            self.secure_credentials.peer_key_cache.invalidate((self.ip, self.port, self.server_hostname))
+
     def register_failure(self):
         self.consecutive_failures += 1
 
     def register_timeout(self):
         self.consecutive_timeouts += 1
 
+    def register_latency(self, exec_time_us: int):
+        if self.latency_us:
+            self.latency_us += LATENCY_SMOOTHING * (exec_time_us - self.latency_us)
+        else:
+            self.latency_us = float(exec_time_us)
+
     def reset_failures(self):
         self.consecutive_failures = 0
 
@@ -182,40 +236,67 @@ class ModelRunner:
 
         return False
 
+    def _pool_channel_options(self) -> list[tuple[str, Any]]:
+        if self.channel_pool_size == 1:
+            return self.grpc_options
+        # Without a local subchannel pool, channels with the same target and args share one TCP connection
+        return self.grpc_options + [("grpc.use_local_subchannel_pool", 1)]
+
+    def _create_channel_pool(self, create_channel):
+        options = self._pool_channel_options()
+        self.channel_pool = ChannelPool(
+            [create_channel(options) for _ in range(self.channel_pool_size)],
+            routing=self.channel_routing,
+        )
+        self.grpc_channel = self.channel_pool.channels[0]
+
     def _connect_insecure_channels(self):
-        # Main gRPC channel (for model interaction)
-        self.grpc_channel = grpc.aio.insecure_channel(f"{self.ip}:{self.port}", self.grpc_options)
+        # Main gRPC channels (for model interaction)
+        self._create_channel_pool(lambda options: grpc.aio.insecure_channel(f"{self.ip}:{self.port}", options))
         # Separate health check channel (isolated TCP connection)
-        self.grpc_health_channel = grpc.aio.insecure_channel(f"{self.ip}:{self.port}", self.grpc_options)
+        self._connect_health_channel(
+            ("insecure", f"{self.ip}:{self.port}"),
+            lambda options: grpc.aio.insecure_channel(f"{self.ip}:{self.port}", options)
+        )
 
     def _connect_gateway_channels(self):
         """Connect via TLS-terminating gateway (e.g. Phala CVM) with signed-token auth."""
         target = f"{self.ip}:{self.port}"
         credentials = grpc.ssl_channel_credentials()
+        if not self.gateway_token_registered:
+            # from now on, the token of this model is kept fresh in the background
+            self.gateway_credentials.token_cache.register(self.model_id)
+            self.gateway_token_registered = True
 
-        self.grpc_channel = grpc.aio.secure_channel(
+        self._create_channel_pool(lambda options: grpc.aio.secure_channel(
             target=target,
             credentials=credentials,
-            options=self.grpc_options,
+            options=options,
             interceptors=[
                 GatewayAuthClientInterceptor(
                     private_key=self.gateway_credentials.private_key,
                     model_id=self.model_id,
+                    token_cache=self.gateway_credentials.token_cache,
+                    crypto_executor=self.crypto_executor,
                 )
             ],
-        )
+        ))
         # Health check channel — standard TLS, no auth interceptor needed
-        self.grpc_health_channel = grpc.aio.secure_channel(
-            target=target,
-            credentials=credentials,
-            options=self.grpc_options,
+        self._connect_health_channel(
+            ("gateway", target),
+            lambda options: grpc.aio.secure_channel(
+                target=target,
+                credentials=credentials,
+                options=options,
+            )
         )
 
     async def _connect_secure_channels(self):
         target = f"{self.ip}:{self.port}"
-        peer_tls = await fetch_peer_rsa_spki_mtls(
-            host=self.ip,
-            port=self.port,
+        # Cached across reconnects, a hit skips the extra mTLS handshake of the probe
+        peer_tls = await self.secure_credentials.peer_key_cache.fetch(
+            self.ip,
+            self.port,
             tls_ctx=self.secure_credentials.tls_ctx,
             server_hostname=self.server_hostname
         )
@@ -226,29 +307,58 @@ class ModelRunner:
             certificate_chain=self.secure_credentials.cert_bytes,
         )
 
-        self.grpc_channel = grpc.aio.secure_channel(
+        self._create_channel_pool(lambda options: grpc.aio.secure_channel(
             target=target,
             credentials=channel_creds,
-            options=self.grpc_options,
+            options=options,
             interceptors=[
                 WalletTlsAuthClientInterceptor(
                     expected_wallet_pub_b58=self.infos.get("cruncher_wallet_pubkey"),
                     expected_hotkey=self.infos.get("cruncher_hotkey"),
                     expected_model_id=self.model_id,
-                    tls_pub=peer_tls.spki_der
+                    tls_pub=peer_tls.spki_der,
+                    crypto_executor=self.crypto_executor,
                 )
             ]
-        )
+        ))
 
         # Separate health check channel (isolated TCP connection)
-        self.grpc_health_channel = grpc.aio.secure_channel(target, channel_creds, self.grpc_options)
+        self._connect_health_channel(
+            ("secure", target, self.server_hostname, peer_tls.leaf_cert_pem),
+            lambda options: grpc.aio.secure_channel(target, channel_creds, options)
+        )
+
+    def _connect_health_channel(self, key: tuple, create_channel):
+        if self.health_channel_registry is None:
+            self.grpc_health_channel = create_channel(self.grpc_options)
+            return
+
+        # A local subchannel pool keeps the shared health connection apart from the main traffic
+        options = self.grpc_options + [("grpc.use_local_subchannel_pool", 1)]
+        self.grpc_health_channel = self.health_channel_registry.acquire(key, lambda: create_channel(options))
+        self.health_channel_key = key
+
+    async def _release_health_channel(self):
+        if self.health_channel_key is None:
+            return
+
+        key, self.health_channel_key = self.health_channel_key, None
+        self.grpc_health_channel = None
+        await self.health_channel_registry.release(key)
 
     async def close(self):
         self.closed = True
+        if self.gateway_token_registered:
+            self.gateway_credentials.token_cache.unregister(self.model_id)
+            self.gateway_token_registered = False
         tasks = []
-        if self.grpc_channel:
+        if self.channel_pool:
+            tasks.append(self.channel_pool.close())
+        elif self.grpc_channel:
             tasks.append(self.grpc_channel.close())
-        if self.grpc_health_channel:
+        if self.health_channel_key is not None:
+            tasks.append(self._release_health_channel())
+        elif self.grpc_health_channel:
             tasks.append(self.grpc_health_channel.close())
 
         if tasks:
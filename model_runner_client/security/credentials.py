@@ -4,6 +4,8 @@ import ssl
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .tls_peer_key import PeerKeyCache
+
 
 @dataclass(frozen=True)
 class SecureCredentials:
@@ -12,6 +14,11 @@ class SecureCredentials:
     key_bytes: bytes
 
     tls_ctx: ssl.SSLContext = field(init=False, repr=False, compare=False)
+    peer_key_cache: PeerKeyCache = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # TLS probe results are shared by every model runner using these credentials
+        object.__setattr__(self, "peer_key_cache", PeerKeyCache())
 
     @classmethod
     def from_directory(
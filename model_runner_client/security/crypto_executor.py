@@ -0,0 +1,98 @@
+"""
+Off-loop execution of the auth crypto (RSA signing, Ed25519 verification).
+
+The `cryptography` primitives release the GIL, so running them in a thread pool lets the
+asyncio loop keep dispatching calls while signatures are computed or verified.
+
+Wallet delegation verifications requested during the same loop iteration (typically the
+responses of one fan-out) are grouped, and split into at most one executor job per worker.
+"""
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from .wallet_gelegation import AuthError, DelegationInfo, verify_wallet_delegation
+
+logger = logging.getLogger("model_runner_client.crypto_executor")
+
+
+def verify_wallet_delegations(requests: list[dict[str, Any]]) -> list[DelegationInfo | AuthError]:
+    """Verify many delegations at once, each result is either a `DelegationInfo` or the `AuthError` raised."""
+    results: list[DelegationInfo | AuthError] = []
+    for request in requests:
+        try:
+            results.append(verify_wallet_delegation(**request))
+        except AuthError as e:
+            results.append(e)
+    return results
+
+
+class CryptoExecutor:
+    MAX_BATCH_SIZE = 256
+
+    def __init__(self, max_workers: int | None = None, max_batch_size: int = MAX_BATCH_SIZE):
+        self.max_batch_size = max_batch_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crypto")
+        self.max_workers = self._executor._max_workers  # resolved default when None
+        self._pending_verifications: list[tuple[dict[str, Any], asyncio.Future]] = []
+
+        self.batches = 0
+        self.jobs = 0  # executor jobs, up to `max_workers` per batch
+        self.batched_verifications = 0
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def verify_wallet_delegation(self, **kwargs) -> DelegationInfo:
+        """
+        Same contract as `wallet_gelegation.verify_wallet_delegation`, executed off-loop in a batch
+        with the other verifications requested during the current loop iteration.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending_verifications:
+            loop.call_soon(self._flush_verifications)
+        self._pending_verifications.append((kwargs, future))
+        if len(self._pending_verifications) >= self.max_batch_size:
+            self._flush_verifications()
+
+        result = await future
+        if isinstance(result, AuthError):
+            raise result
+        return result
+
+    def _flush_verifications(self):
+        batch, self._pending_verifications = self._pending_verifications, []
+        if not batch:
+            return
+
+        self.batches += 1
+        self.batched_verifications += len(batch)
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(batch) // self.max_workers)  # spread the batch over the workers
+        for start in range(0, len(batch), chunk_size):
+            chunk = batch[start:start + chunk_size]
+            job = loop.run_in_executor(
+                self._executor,
+                verify_wallet_delegations,
+                [request for request, _ in chunk],
+            )
+            job.add_done_callback(functools.partial(self._resolve_verifications, chunk))
+            self.jobs += 1
+
+    @staticmethod
+    def _resolve_verifications(batch: list[tuple[dict[str, Any], asyncio.Future]], job: asyncio.Future):
+        error = job.exception() if not job.cancelled() else asyncio.CancelledError()
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(job.result()[index])
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
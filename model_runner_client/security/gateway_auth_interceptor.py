@@ -13,6 +13,10 @@ The model runner server:
     (via cpi.crunchdao.io/certificates?wallet=<wallet>)
   - Verifies the signature against the presented public key
   - Checks timestamp freshness
+
+Since the token only depends on the model_id and a second-resolution timestamp,
+`GatewayTokenCache` reuses a signed token during a short time bucket and re-signs
+the tokens of every registered model in a worker thread before they get old.
 """
 from __future__ import annotations
 
@@ -20,7 +24,9 @@ import base64
 import collections
 import json
 import logging
+import threading
 import time
+from typing import TYPE_CHECKING
 
 import grpc
 
@@ -28,6 +34,9 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 
+if TYPE_CHECKING:
+    from .crypto_executor import CryptoExecutor
+
 logger = logging.getLogger("model_runner_client.gateway_auth")
 
 # Metadata keys (no -bin suffix → ASCII / base64-encoded)
@@ -52,6 +61,133 @@ def _public_key_der(private_key: rsa.RSAPrivateKey) -> bytes:
     return private_key.public_key().public_bytes(Encoding.DER, PublicFormat.SubjectPublicKeyInfo)
 
 
+def _build_auth_metadata(
+    private_key: rsa.RSAPrivateKey,
+    pubkey_b64: str,
+    model_id: str,
+    timestamp: int,
+) -> list[tuple[str, str]]:
+    payload = json.dumps(
+        {"model_id": model_id, "timestamp": timestamp},
+        separators=(",", ":"),
+    ).encode()
+    signature = _sign(private_key, payload)
+    return [
+        (AUTH_MESSAGE_KEY, base64.b64encode(payload).decode()),
+        (AUTH_SIGNATURE_KEY, base64.b64encode(signature).decode()),
+        (AUTH_PUBKEY_KEY, pubkey_b64),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Token cache
+# ---------------------------------------------------------------------------
+
+class GatewayTokenCache:
+    """
+    Per-model cache of signed auth metadata, reused for `bucket_seconds`.
+
+    Registered models get their token re-signed by a background worker thread once it is
+    older than `refresh_ratio * bucket_seconds`, so the per-call cost is a dict lookup.
+    An expired or missing token is signed inline (e.g. right after registration).
+
+    `bucket_seconds` must stay well below the server freshness window.
+    """
+
+    BUCKET_SECONDS = 10
+
+    def __init__(
+        self,
+        private_key: rsa.RSAPrivateKey,
+        bucket_seconds: int = BUCKET_SECONDS,
+        refresh_ratio: float = 0.5,
+    ):
+        self.private_key = private_key
+        self.bucket_seconds = bucket_seconds
+        self.refresh_ratio = refresh_ratio
+        self._pubkey_b64 = base64.b64encode(_public_key_der(private_key)).decode()
+
+        # model_id -> (timestamp, metadata), entries are replaced atomically
+        self._tokens: dict[str, tuple[int, list[tuple[str, str]]]] = {}
+        self._registrations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._worker: threading.Thread | None = None
+
+        self.inline_signatures = 0
+        self.background_signatures = 0
+
+    def register(self, model_id: str):
+        with self._lock:
+            self._registrations[model_id] = self._registrations.get(model_id, 0) + 1
+            if self._worker is None:
+                self._stop_event = threading.Event()  # one per worker, a stopping worker keeps its own
+                self._worker = threading.Thread(target=self._refresh_loop, name="gateway-token-refresh", daemon=True)
+                self._worker.start()
+
+    def unregister(self, model_id: str):
+        with self._lock:
+            count = self._registrations.get(model_id, 0) - 1
+            if count > 0:
+                self._registrations[model_id] = count
+                return
+
+            self._registrations.pop(model_id, None)
+            self._tokens.pop(model_id, None)
+            if not self._registrations and self._worker is not None:
+                self._stop_event.set()
+                self._worker = None
+
+    def lookup(self, model_id: str) -> list[tuple[str, str]] | None:
+        """Return the cached metadata if still fresh, without signing."""
+        token = self._tokens.get(model_id)
+        if token is not None and int(time.time()) - token[0] < self.bucket_seconds:
+            return token[1]
+        return None
+
+    def get(self, model_id: str) -> list[tuple[str, str]]:
+        metadata = self.lookup(model_id)
+        if metadata is not None:
+            return metadata
+
+        self.inline_signatures += 1
+        metadata, _ = self._sign(model_id, int(time.time()))
+        return metadata
+
+    def _sign(self, model_id: str, timestamp: int) -> tuple[list[tuple[str, str]], bool]:
+        """Sign outside the lock, and cache the token only if the model is still registered (not unregistered meanwhile)."""
+        metadata = _build_auth_metadata(self.private_key, self._pubkey_b64, model_id, timestamp)
+        with self._lock:
+            registered = model_id in self._registrations
+            if registered:
+                self._tokens[model_id] = (timestamp, metadata)
+        return metadata, registered
+
+    def refresh(self):
+        """Re-sign the tokens of all registered models that are getting old."""
+        with self._lock:
+            model_ids = list(self._registrations)
+
+        now = int(time.time())
+        refresh_age = self.bucket_seconds * self.refresh_ratio
+        for model_id in model_ids:
+            token = self._tokens.get(model_id)
+            if token is None or now - token[0] >= refresh_age:
+                _, registered = self._sign(model_id, now)
+                if registered:
+                    with self._lock:
+                        self.background_signatures += 1
+
+    def _refresh_loop(self):
+        stop_event = self._stop_event
+        interval = max(self.bucket_seconds * self.refresh_ratio / 2, 0.1)
+        while not stop_event.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.error("Gateway token refresh failed", exc_info=True)
+
+
 # ---------------------------------------------------------------------------
 # gRPC client interceptor
 # ---------------------------------------------------------------------------
@@ -78,29 +214,42 @@ class GatewayAuthClientInterceptor(
     using the coordinator's public key (checked against on-chain cert hash).
     """
 
-    def __init__(self, private_key: rsa.RSAPrivateKey, model_id: str):
+    def __init__(
+        self,
+        private_key: rsa.RSAPrivateKey,
+        model_id: str,
+        token_cache: GatewayTokenCache | None = None,
+        crypto_executor: CryptoExecutor | None = None,
+    ):
         self.private_key = private_key
         self.model_id = model_id
+        self.token_cache = token_cache
+        self.crypto_executor = crypto_executor
         # Pre-compute the base64-encoded DER public key (doesn't change per call)
         self._pubkey_b64 = base64.b64encode(_public_key_der(private_key)).decode()
 
     def _build_auth_metadata(self) -> list[tuple[str, str]]:
-        payload = json.dumps(
-            {"model_id": self.model_id, "timestamp": int(time.time())},
-            separators=(",", ":"),
-        ).encode()
-        signature = _sign(self.private_key, payload)
-        return [
-            (AUTH_MESSAGE_KEY, base64.b64encode(payload).decode()),
-            (AUTH_SIGNATURE_KEY, base64.b64encode(signature).decode()),
-            (AUTH_PUBKEY_KEY, self._pubkey_b64),
-        ]
-
-    def _enrich_metadata(
+        if self.token_cache is not None:
+            return self.token_cache.get(self.model_id)
+        return _build_auth_metadata(self.private_key, self._pubkey_b64, self.model_id, int(time.time()))
+
+    async def _auth_metadata(self) -> list[tuple[str, str]]:
+        if self.crypto_executor is None:
+            return self._build_auth_metadata()
+
+        if self.token_cache is not None:
+            metadata = self.token_cache.lookup(self.model_id)
+            if metadata is not None:
+                return metadata
+
+        # signing needed, keep it off the event loop
+        return await self.crypto_executor.run(self._build_auth_metadata)
+
+    async def _enrich_metadata(
         self, client_call_details: grpc.aio.ClientCallDetails,
     ) -> _ClientCallDetails:
         metadata = list(client_call_details.metadata or [])
-        metadata.extend(self._build_auth_metadata())
+        metadata.extend(await self._auth_metadata())
         return _ClientCallDetails(
             method=client_call_details.method,
             timeout=client_call_details.timeout,
@@ -110,7 +259,7 @@ class GatewayAuthClientInterceptor(
         )
 
     async def intercept_unary_unary(self, continuation, client_call_details, request):
-        return await continuation(self._enrich_metadata(client_call_details), request)
+        return await continuation(await self._enrich_metadata(client_call_details), request)
 
     async def intercept_unary_stream(self, continuation, client_call_details, request):
-        return await continuation(self._enrich_metadata(client_call_details), request)
+        return await continuation(await self._enrich_metadata(client_call_details), request)
@@ -8,13 +8,15 @@ Authentication uses a signed token in gRPC metadata:
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from cryptography.x509 import load_pem_x509_certificate
 
+from .gateway_auth_interceptor import GatewayTokenCache
+
 
 @dataclass(frozen=True)
 class GatewayCredentials:
@@ -25,6 +27,12 @@ class GatewayCredentials:
 
     private_key: rsa.RSAPrivateKey
 
+    token_cache: GatewayTokenCache = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Signed tokens are shared by every model runner using these credentials
+        object.__setattr__(self, "token_cache", GatewayTokenCache(self.private_key))
+
     @classmethod
     def from_files(
         cls,
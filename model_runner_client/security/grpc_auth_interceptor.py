@@ -1,8 +1,14 @@
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Sequence, Tuple
+
 import grpc
-from typing import Any, Sequence, Tuple
 
 from .wallet_gelegation import verify_wallet_delegation, AuthError
 
+if TYPE_CHECKING:
+    from .crypto_executor import CryptoExecutor
+
 Metadata = Sequence[Tuple[str, Any]]  # values are usually str, or bytes for *-bin
 
 
@@ -14,6 +20,14 @@ class StaticAuthMetadata(grpc.AuthMetadataPlugin):
         callback(self._metadata, None)
 
 
+@dataclass
+class VerificationStats:
+    verifications: int = 0  # full verifications (decoding + Ed25519 + JSON)
+    cache_hits: int = 0
+    failures: int = 0
+    expired: int = 0  # cached delegations dropped because of their expires_at
+
+
 def _md_to_dict(md: Metadata) -> dict[str, Any]:
     # gRPC metadata keys are case-insensitive; normalize to lowercase
     out: dict[str, Any] = {}
@@ -26,10 +40,19 @@ class WalletTlsAuthClientInterceptor(
     grpc.aio.UnaryUnaryClientInterceptor,
     grpc.aio.UnaryStreamClientInterceptor,
 ):
+    """
+    Verifies the wallet delegation sent by the model node in the response headers.
+
+    Nodes send the same signed delegation on every call, so successfully verified
+    (message, signature, wallet) triples are cached for the lifetime of the channel, until their
+    `expires_at`. Any change in the headers, or an expired delegation, means a full verification.
+    """
     MESSAGE_KEY = "x-server-auth-message"
     SIGNATURE_KEY = "x-server-auth-signature"
     WALLET_KEY = "x-server-wallet-pubkey"
 
+    MAX_CACHED_DELEGATIONS = 8
+
     def __init__(
         self,
         expected_wallet_pub_b58: str,
@@ -37,12 +60,17 @@ class WalletTlsAuthClientInterceptor(
         expected_model_id: str,
         tls_pub: bytes,
         protected_prefix: str = "",
+        crypto_executor: "CryptoExecutor | None" = None,
     ):
         self.expected_wallet_pub_b58 = expected_wallet_pub_b58
         self.expected_hotkey = expected_hotkey
         self.expected_model_id = expected_model_id
         self.tls_pub = tls_pub
         self.protected_prefix = protected_prefix
+        self.crypto_executor = crypto_executor
+
+        self.stats = VerificationStats()
+        self._verified_delegations: dict[tuple[str, str, str], int | None] = {}  # -> expires_at
 
     def _should_protect(self, method: str) -> bool:
         return not self.protected_prefix or method.startswith(self.protected_prefix)
@@ -64,7 +92,17 @@ class WalletTlsAuthClientInterceptor(
         if not isinstance(message_b64, str) or not isinstance(signature_b64, str) or not isinstance(wallet_pubkey_b58, str):
             raise AuthError("Auth metadata must be strings (non -bin headers)")
 
-        verify_wallet_delegation(
+        key = (message_b64, signature_b64, wallet_pubkey_b58)
+        if key in self._verified_delegations:
+            expires_at = self._verified_delegations[key]
+            if expires_at is None or time.time() < expires_at:
+                self.stats.cache_hits += 1
+                return
+
+            del self._verified_delegations[key]
+            self.stats.expired += 1
+
+        verification = dict(
             message_b64=message_b64,
             signature_b64=signature_b64,
             wallet_pub_b58=wallet_pubkey_b58,
@@ -73,6 +111,26 @@ class WalletTlsAuthClientInterceptor(
             expected_hotkey=self.expected_hotkey,
             expected_model_id=self.expected_model_id
         )
+        try:
+            if self.crypto_executor is not None:
+                delegation = await self.crypto_executor.verify_wallet_delegation(**verification)
+            else:
+                delegation = verify_wallet_delegation(**verification)
+        except AuthError:
+            self.stats.failures += 1
+            raise
+
+        self.stats.verifications += 1
+        self._remember(key, delegation.expires_at)
+
+    def _remember(self, key: tuple[str, str, str], expires_at: int | None):
+        if expires_at is not None and time.time() >= expires_at:
+            return
+
+        if len(self._verified_delegations) >= self.MAX_CACHED_DELEGATIONS:
+            # drop the oldest entry, the node rotated its delegation
+            del self._verified_delegations[next(iter(self._verified_delegations))]
+        self._verified_delegations[key] = expires_at
 
     async def _intercept(self, continuation, client_call_details, request, is_stream: bool):
         call = await continuation(client_call_details, request)
@@ -1,5 +1,7 @@
 import asyncio
+import logging
 import ssl
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -8,6 +10,9 @@ from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 
 
+logger = logging.getLogger("model_runner_client.tls_peer_key")
+
+
 class TlsProbeError(RuntimeError):
     pass
 
@@ -121,3 +126,108 @@ async def fetch_peer_rsa_spki_mtls(
             transport.abort()
 
     return await asyncio.wait_for(_connect(), timeout=timeout)
+
+
+PeerKeyCacheKey = tuple[str, int, str]  # (ip, port, server_hostname)
+
+
+class PeerKeyCache:
+    """
+    Cache of TLS probe results, keyed by (ip, port, server_hostname).
+
+    A cache hit skips the extra mTLS handshake of `fetch_peer_rsa_spki_mtls`, so the gRPC channels are created
+    right away. Once an entry is older than `refresh_ratio * ttl`, it is still served but a probe runs in the
+    background, concurrently with the gRPC handshake, to renew it before it expires.
+
+    Entries must be invalidated on authentication or certificate verification failures.
+    """
+
+    TTL = 300  # 5 minutes
+
+    def __init__(self, ttl: float = TTL, refresh_ratio: float = 0.8):
+        self.ttl = ttl
+        self.refresh_ratio = refresh_ratio
+        self._entries: dict[PeerKeyCacheKey, tuple[PeerTlsRsaKey, float]] = {}
+        self._probes: dict[PeerKeyCacheKey, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: PeerKeyCacheKey) -> PeerTlsRsaKey | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        peer_tls, fetched_at = entry
+        if time.monotonic() - fetched_at >= self.ttl:
+            del self._entries[key]
+            return None
+        return peer_tls
+
+    def put(self, key: PeerKeyCacheKey, peer_tls: PeerTlsRsaKey):
+        self._entries[key] = (peer_tls, time.monotonic())
+
+    def invalidate(self, key: PeerKeyCacheKey):
+        if self._entries.pop(key, None) is not None:
+            logger.debug(f"Peer key cache entry invalidated for {key}")
+
+    def _is_stale(self, key: PeerKeyCacheKey) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() - entry[1] >= self.ttl * self.refresh_ratio
+
+    async def fetch(
+        self,
+        host: str,
+        port: int,
+        *,
+        tls_ctx: ssl.SSLContext,
+        server_hostname: str,
+        timeout: float = 5,
+    ) -> PeerTlsRsaKey:
+        """
+        Return the peer key from the cache, or probe it.
+        Concurrent fetches of the same key share a single probe.
+        """
+        key = (host, port, server_hostname)
+
+        peer_tls = self.get(key)
+        if peer_tls is not None:
+            self.hits += 1
+            if self._is_stale(key) and key not in self._probes:
+                self._start_probe(key, tls_ctx, timeout).add_done_callback(_ignore_background_error)
+            return peer_tls
+
+        self.misses += 1
+        probe = self._probes.get(key) or self._start_probe(key, tls_ctx, timeout)
+        return await asyncio.shield(probe)
+
+    def _start_probe(self, key: PeerKeyCacheKey, tls_ctx: ssl.SSLContext, timeout: float) -> asyncio.Task:
+        host, port, server_hostname = key
+
+        async def probe():
+            try:
+                peer_tls = await fetch_peer_rsa_spki_mtls(
+                    host=host,
+                    port=port,
+                    tls_ctx=tls_ctx,
+                    server_hostname=server_hostname,
+                    timeout=timeout,
+                )
+                self.put(key, peer_tls)
+                return peer_tls
+            except BaseException:
+                self.invalidate(key)
+                raise
+            finally:
+                self._probes.pop(key, None)
+
+        task = asyncio.create_task(probe())
+        self._probes[key] = task
+        return task
+
+
+def _ignore_background_error(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Background TLS probe failed: {task.exception()}")
@@ -0,0 +1,3 @@
+from .fake_model_server import FakeModelBehavior, FakeModelServer
+from .fake_orchestrator import FakeOrchestrator
+from .replay_server import ReplayCluster
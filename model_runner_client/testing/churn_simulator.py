@@ -0,0 +1,299 @@
+"""
+Orchestrator churn simulator: replays connection storms against a real `ModelCluster`.
+
+A `FakeOrchestrator` serves the models, all hosted by a few `FakeModelServer` endpoints (a model node does not
+care which model it serves), and a scenario emits a stream of events at a configurable rate:
+
+    - mass_init: the orchestrator restarts, every client reconnects and receives a full init snapshot
+    - rolling_ip: every model moves to another endpoint, one after the other
+    - flapping: models go RECOVERING then RUNNING again, several times
+    - deployment_swap: every model is redeployed (new deployment_id) on the same endpoint
+    - random: a random mix of the above, per event
+
+The simulator measures how long the cluster takes, from the first event, to converge to the final
+orchestrator state (time to steady state), the peak of open gRPC channels, and the wasted initializations
+(model runners created during the scenario that never served).
+
+From pytest:
+
+    report = await simulate("rolling_ip", models=20, rate=500)
+    assert report.converged
+
+From the command line:
+
+    python -m model_runner_client.testing.churn_simulator --scenario flapping --models 200 --rate 1000
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable
+
+from ..event_coalescer import EventCoalescer
+from ..model_cluster import ModelCluster
+from ..model_registry import ModelRegistry
+from ..model_runners import DynamicSubclassModelRunner, ModelRunner
+from .fake_model_server import FakeModelBehavior, FakeModelServer
+from .fake_orchestrator import FakeOrchestrator
+
+logger = logging.getLogger("model_runner_client.testing.churn_simulator")
+
+
+@dataclass
+class ChurnReport:
+    scenario: str
+    models: int
+    events: int = 0
+    converged: bool = False
+    scenario_s: float = 0.0  # time to play the scenario
+    time_to_steady_state_s: float | None = None  # from the first event to convergence
+    peak_open_channels: int = 0
+    inits: int = 0  # model runners created during the scenario
+    wasted_inits: int = 0  # ... that never served
+    coalescer: dict = field(default_factory=dict)
+
+
+class _RecordingRegistry(ModelRegistry):
+    def __init__(self):
+        super().__init__()
+        self.served: set[int] = set()  # ids of the model runners that were running at some point
+
+    def __setitem__(self, model_id: str, model_runner: ModelRunner):
+        self.served.add(id(model_runner))
+        super().__setitem__(model_id, model_runner)
+
+
+class ChurnSimulator:
+    SAMPLE_INTERVAL = 0.005
+
+    def __init__(
+        self,
+        models: int = 100,
+        rate: float = 500.0,
+        endpoints: int = 4,
+        flaps: int = 3,
+        seed: int = 0,
+        settle_timeout: float = 30.0,
+        model_behavior: FakeModelBehavior | None = None,
+        **cluster_options,
+    ):
+        """
+        :param models: Number of models announced by the orchestrator.
+        :param rate: Events per second emitted by the scenarios.
+        :param endpoints: Number of model servers hosting the models.
+        :param flaps: RECOVERING/RUNNING cycles per model in the `flapping` scenario.
+        :param settle_timeout: Give up waiting for the steady state after this many seconds.
+        :param cluster_options: Passed to `ModelCluster` (e.g. `update_coalesce_window`, `make_before_break`).
+        """
+        self.model_count = models
+        self.rate = rate
+        self.endpoint_count = endpoints
+        self.flaps = flaps
+        self.rng = random.Random(seed)
+        self.settle_timeout = settle_timeout
+        self.model_behavior = model_behavior or FakeModelBehavior()
+        self.cluster_options = cluster_options
+
+        self.servers: list[FakeModelServer] = []
+        self.endpoints: list[int] = []
+        self.orchestrator = FakeOrchestrator()
+        self.cluster: ModelCluster | None = None
+        self.sync_task: asyncio.Task | None = None
+        self.created_runners: list[ModelRunner] = []
+        self.events = 0
+
+    @property
+    def scenarios(self) -> dict[str, Callable[[], Awaitable[None]]]:
+        return {
+            "mass_init": self.mass_init,
+            "rolling_ip": self.rolling_ip,
+            "flapping": self.flapping,
+            "deployment_swap": self.deployment_swap,
+            "random": self.random,
+        }
+
+    async def start(self):
+        for _ in range(self.endpoint_count):
+            server = FakeModelServer(self.model_behavior)
+            self.servers.append(server)
+            self.endpoints.append(await server.start())
+
+        for index in range(self.model_count):
+            self.orchestrator.add_model(f"model_{index}", "127.0.0.1", self.endpoints[index % len(self.endpoints)])
+        orchestrator_port = await self.orchestrator.start()
+
+        self.cluster = ModelCluster("churn", "127.0.0.1", orchestrator_port, self.create_model_runner, **self.cluster_options)
+        self.cluster.models_run = _RecordingRegistry()
+        self.cluster.ws_client.retry_interval = 0.05
+        await self.cluster.init()
+        self.sync_task = asyncio.create_task(self.cluster.sync(), name="churn-simulator:sync")
+
+    async def stop(self):
+        if self.sync_task:
+            self.sync_task.cancel()
+        if self.cluster:
+            await self.cluster.close()
+        await self.orchestrator.stop()
+        for server in self.servers:
+            await server.stop()
+
+    def create_model_runner(self, **kwargs) -> ModelRunner:
+        model_runner = DynamicSubclassModelRunner("churn.Model", retry_backoff_factor=0.1, **kwargs)
+        self.created_runners.append(model_runner)
+        return model_runner
+
+    async def run(self, scenario: str) -> ChurnReport:
+        report = ChurnReport(scenario, self.model_count)
+        created_before = len(self.created_runners)
+        self.events = 0
+
+        sampler = asyncio.create_task(self._sample_open_channels(report), name="churn-simulator:sampler")
+        start = time.perf_counter()
+        await self.scenarios[scenario]()
+        report.scenario_s = round(time.perf_counter() - start, 3)
+
+        report.converged = await self._wait_steady_state()
+        if report.converged:
+            report.time_to_steady_state_s = round(time.perf_counter() - start, 3)
+        sampler.cancel()
+
+        created = self.created_runners[created_before:]
+        report.events = self.events
+        report.inits = len(created)
+        report.wasted_inits = sum(1 for model_runner in created if id(model_runner) not in self.cluster.models_run.served)
+        report.coalescer = asdict(self.cluster.event_coalescer.stats)
+        return report
+
+    def open_channels(self) -> int:
+        return sum(
+            len(model_runner.channel_pool.channels) + (1 if model_runner.grpc_health_channel else 0)
+            for model_runner in self.created_runners
+            if not model_runner.closed and model_runner.channel_pool
+        )
+
+    async def _sample_open_channels(self, report: ChurnReport):
+        while True:
+            report.peak_open_channels = max(report.peak_open_channels, self.open_channels())
+            await asyncio.sleep(self.SAMPLE_INTERVAL)
+
+    def is_steady(self) -> bool:
+        cluster = self.cluster
+        if cluster.pending_model_runs or len(cluster.model_actors) or len(cluster.event_coalescer):
+            return False
+
+        expected = {
+            model["model_id"]: (model["deployment_id"], model["ip"], model["port"])
+            for model in self.orchestrator.models.values()
+            if model["state"] == "RUNNING"
+        }
+        actual = {
+            model_id: (model_runner.deployment_id, model_runner.ip, model_runner.port)
+            for model_id, model_runner in cluster.models_run.items()
+        }
+        return expected == actual
+
+    async def _wait_steady_state(self) -> bool:
+        deadline = time.perf_counter() + self.settle_timeout
+        while not self.is_steady():
+            if time.perf_counter() > deadline:
+                logger.warning(f"No steady state after {self.settle_timeout}s")
+                return False
+            await asyncio.sleep(self.SAMPLE_INTERVAL)
+        return True
+
+    async def _emit(self, model_id: str, **changes):
+        self.events += 1
+        await self.orchestrator.set_state(model_id, changes.pop("state", "RUNNING"), **changes)
+        await asyncio.sleep(1 / self.rate)
+
+    def _model_ids(self) -> list[str]:
+        return list(self.orchestrator.models)
+
+    def _other_endpoint(self, model_id: str) -> int:
+        current = self.orchestrator.models[model_id]["port"]
+        return self.rng.choice([port for port in self.endpoints if port != current] or [current])
+
+    async def mass_init(self):
+        for model_id in self.rng.sample(self._model_ids(), k=self.model_count // 4):
+            self.orchestrator.models[model_id]["port"] = self._other_endpoint(model_id)  # moved while we were away
+        self.events += 1
+        await self.orchestrator.restart()
+
+    async def rolling_ip(self):
+        for model_id in self._model_ids():
+            await self._emit(model_id, port=self._other_endpoint(model_id))
+
+    async def flapping(self):
+        for _ in range(self.flaps):
+            for model_id in self._model_ids():
+                await self._emit(model_id, state="RECOVERING")
+                await self._emit(model_id, state="RUNNING")
+
+    async def deployment_swap(self):
+        for model_id in self._model_ids():
+            deployment_id = self.orchestrator.models[model_id]["deployment_id"]
+            await self._emit(model_id, deployment_id=f"{deployment_id}+")
+
+    async def random(self):
+        model_ids = self._model_ids()
+        for _ in range(self.model_count * 2):
+            model_id = self.rng.choice(model_ids)
+            kind = self.rng.choice(("ip", "flap", "deployment"))
+            if kind == "ip":
+                await self._emit(model_id, port=self._other_endpoint(model_id))
+            elif kind == "flap":
+                await self._emit(model_id, state="RECOVERING")
+                await self._emit(model_id, state="RUNNING")
+            else:
+                await self._emit(model_id, deployment_id=f"{self.orchestrator.models[model_id]['deployment_id']}+")
+
+
+async def simulate(scenario: str, **options) -> ChurnReport:
+    """Start a simulator, play one scenario and stop it. See `ChurnSimulator` for the options."""
+    simulator = ChurnSimulator(**options)
+    try:
+        await simulator.start()
+        return await simulator.run(scenario)
+    finally:
+        await simulator.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay orchestrator churn against a ModelCluster, prints a JSON report.")
+    parser.add_argument("--scenario", nargs="+", default=["mass_init", "rolling_ip", "flapping", "deployment_swap", "random"])
+    parser.add_argument("--models", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=500.0, help="events per second")
+    parser.add_argument("--endpoints", type=int, default=4)
+    parser.add_argument("--flaps", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="model call latency, also applies to Setup")
+    parser.add_argument("--coalesce-window", type=float, default=EventCoalescer.WINDOW)
+    parser.add_argument("--make-before-break", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--settle-timeout", type=float, default=30.0)
+    parser.add_argument("--log-level", default="WARNING")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(level=arguments.log_level)
+
+    async def main():
+        reports = []
+        for scenario in arguments.scenario:
+            report = await simulate(
+                scenario,
+                models=arguments.models,
+                rate=arguments.rate,
+                endpoints=arguments.endpoints,
+                flaps=arguments.flaps,
+                seed=arguments.seed,
+                settle_timeout=arguments.settle_timeout,
+                model_behavior=FakeModelBehavior(latency_ms=arguments.latency_ms, setup_latency_ms=arguments.latency_ms),
+                update_coalesce_window=arguments.coalesce_window,
+                make_before_break=arguments.make_before_break,
+            )
+            reports.append(asdict(report))
+        print(json.dumps(reports, indent=2))
+
+    asyncio.run(main())
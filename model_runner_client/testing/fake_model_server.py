@@ -0,0 +1,158 @@
+"""
+A stand-in `DynamicSubclassService` model node, with configurable latency, failures, timeouts and response size.
+
+In-process (several servers can share one event loop):
+
+    server = FakeModelServer(FakeModelBehavior(latency_ms=5, failure_rate=0.01))
+    port = await server.start()
+    ...
+    await server.stop()
+
+Or in its own process, the bound port is printed on stdout:
+
+    python -m model_runner_client.testing.fake_model_server --latency-ms 5 --failure-rate 0.01
+"""
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass
+
+import grpc
+from grpc_health.v1 import health_pb2, health_pb2_grpc
+from grpc_health.v1.health import aio as health_aio
+
+from ..grpc.generated import commons_pb2, dynamic_subclass_pb2, dynamic_subclass_pb2_grpc
+from ..model_runners.call_order import CALL_SEQUENCE_METADATA
+
+
+@dataclass
+class FakeModelBehavior:
+    latency_ms: float = 1.0  # median latency of a call
+    latency_jitter: float = 0.0  # sigma of the lognormal latency distribution, 0 for a constant latency
+    setup_latency_ms: float = 0.0  # latency of Setup
+    failure_rate: float = 0.0  # fraction of calls answered with a FAILED status
+    timeout_rate: float = 0.0  # fraction of calls that hang for `hang_seconds` (beyond the client timeout)
+    hang_seconds: float = 60.0
+    response_bytes: int = 16  # size of the returned value
+    bad_implementation: bool = False  # Setup answers BAD_IMPLEMENTATION
+    batch_call: bool = True  # False: BatchCall answers UNIMPLEMENTED, like model nodes predating it
+
+    def sample_latency(self, rng: random.Random) -> float:
+        latency = self.latency_ms / 1000
+        if self.latency_jitter > 0:
+            latency *= rng.lognormvariate(0, self.latency_jitter)
+        return latency
+
+
+class FakeDynamicSubclassServicer(dynamic_subclass_pb2_grpc.DynamicSubclassServiceServicer):
+    def __init__(self, behavior: FakeModelBehavior, seed: int | None = None):
+        self.behavior = behavior
+        self.rng = random.Random(seed)
+        self.response = commons_pb2.Variant(type=commons_pb2.VariantType.STRING, value=b"x" * behavior.response_bytes)
+
+        self.calls = 0
+        self.batches = 0  # BatchCall requests, their calls are also counted in `calls`
+        self.received_bytes = 0
+        self.sequences: list[int] = []  # `x-call-sequence` of the ordered calls, in arrival order
+
+    async def Setup(self, request, context):
+        if self.behavior.setup_latency_ms > 0:
+            await asyncio.sleep(self.behavior.setup_latency_ms / 1000)
+        if self.behavior.bad_implementation:
+            return dynamic_subclass_pb2.SetupResponse(status=commons_pb2.Status(code="BAD_IMPLEMENTATION", message=f"{request.className} not found"))
+        return dynamic_subclass_pb2.SetupResponse(status=commons_pb2.Status(code="SUCCESS", message="OK"))
+
+    async def Call(self, request, context):
+        self.calls += 1
+        self.received_bytes += request.ByteSize()
+        sequence = dict(context.invocation_metadata()).get(CALL_SEQUENCE_METADATA)
+        if sequence is not None:
+            self.sequences.append(int(sequence))
+
+        draw = self.rng.random()
+        await self._wait([draw])
+        return self._response(draw)
+
+    async def BatchCall(self, request, context):
+        if not self.behavior.batch_call:
+            await context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not implemented!")
+
+        self.batches += 1
+        self.calls += len(request.calls)
+        self.received_bytes += request.ByteSize()
+
+        draws = [self.rng.random() for _ in request.calls]
+        await self._wait(draws)  # one latency for the whole batch
+        return dynamic_subclass_pb2.BatchCallResponse(responses=[self._response(draw) for draw in draws])
+
+    async def _wait(self, draws: list[float]):
+        if any(draw < self.behavior.timeout_rate for draw in draws):
+            await asyncio.sleep(self.behavior.hang_seconds)
+        else:
+            await asyncio.sleep(self.behavior.sample_latency(self.rng))
+
+    def _response(self, draw: float) -> dynamic_subclass_pb2.CallResponse:
+        if draw >= 1 - self.behavior.failure_rate:
+            return dynamic_subclass_pb2.CallResponse(status=commons_pb2.Status(code="FAILED", message="injected failure"))
+        return dynamic_subclass_pb2.CallResponse(status=commons_pb2.Status(code="SUCCESS", message="OK"), methodResponse=self.response)
+
+    async def Rest(self, request, context):
+        return dynamic_subclass_pb2.RestResponse(status=commons_pb2.Status(code="SUCCESS", message="OK"))
+
+
+class FakeModelServer:
+    def __init__(self, behavior: FakeModelBehavior | None = None, host: str = "127.0.0.1", port: int = 0, seed: int | None = None):
+        self.behavior = behavior or FakeModelBehavior()
+        self.host = host
+        self.port = port
+        self.servicer = FakeDynamicSubclassServicer(self.behavior, seed)
+        self.server: grpc.aio.Server | None = None
+
+    async def start(self) -> int:
+        """Start serving, returns the bound port."""
+        self.server = grpc.aio.server()
+        dynamic_subclass_pb2_grpc.add_DynamicSubclassServiceServicer_to_server(self.servicer, self.server)
+
+        health_servicer = health_aio.HealthServicer()
+        await health_servicer.set("", health_pb2.HealthCheckResponse.SERVING)
+        health_pb2_grpc.add_HealthServicer_to_server(health_servicer, self.server)
+
+        self.port = self.server.add_insecure_port(f"{self.host}:{self.port}")
+        await self.server.start()
+        return self.port
+
+    async def stop(self, grace: float | None = None):
+        if self.server:
+            await self.server.stop(grace)
+            self.server = None
+
+
+async def _serve(arguments: argparse.Namespace):
+    behavior = FakeModelBehavior(
+        latency_ms=arguments.latency_ms,
+        latency_jitter=arguments.latency_jitter,
+        failure_rate=arguments.failure_rate,
+        timeout_rate=arguments.timeout_rate,
+        response_bytes=arguments.response_bytes,
+    )
+    servers = [FakeModelServer(behavior, arguments.host, seed=arguments.seed + index) for index in range(arguments.count)]
+    ports = [await server.start() for server in servers]
+    print(" ".join(map(str, ports)), flush=True)
+    await asyncio.gather(*(server.server.wait_for_termination() for server in servers))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve fake DynamicSubclassService model nodes, prints their ports.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--count", type=int, default=1, help="number of servers (one port each)")
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--response-bytes", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,104 @@
+"""
+A stand-in model orchestrator: the websocket server `ModelCluster` connects to.
+
+    orchestrator = FakeOrchestrator()
+    port = await orchestrator.start()
+    orchestrator.add_model("model_1", "127.0.0.1", model_port)  # announced in the init snapshot
+    ...
+    await orchestrator.set_state("model_1", "STOPPED")  # broadcast as an update
+    await orchestrator.stop()
+"""
+import asyncio
+import json
+import logging
+
+import websockets
+
+logger = logging.getLogger("model_runner_client.testing.fake_orchestrator")
+
+
+class FakeOrchestrator:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, init_page_size: int | None = None):
+        """
+        :param init_page_size: Split the init snapshot in pages of this many models (None: one message).
+        """
+        self.host = host
+        self.port = port
+        self.init_page_size = init_page_size
+        self.models: dict[str, dict] = {}
+        self.failure_reports: list[dict] = []
+        self.received_messages: list[dict] = []
+
+        self._server = None
+        self._clients: set = set()
+
+    async def start(self) -> int:
+        """Start serving, returns the bound port."""
+        self._server = await websockets.serve(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def restart(self):
+        """Drop the client connections, as an orchestrator restart would: clients reconnect and receive a new init."""
+        await asyncio.gather(*(client.close() for client in list(self._clients)), return_exceptions=True)
+
+    def add_model(self, model_id: str, ip: str, port: int, deployment_id: str = "deployment_1", state: str = "RUNNING", infos: dict | None = None) -> dict:
+        """Register a model without notifying the connected clients (see `update`)."""
+        model = self.models[model_id] = {
+            "deployment_id": deployment_id,
+            "model_id": model_id,
+            "state": state,
+            "ip": ip,
+            "port": port,
+            "infos": infos or {"model_name": f"{model_id}_name", "cruncher_id": f"{model_id}_cruncher"},
+        }
+        return model
+
+    async def update(self, *models: dict):
+        """Store the models and broadcast them as an `update` event."""
+        for model in models:
+            self.models[model["model_id"]] = model
+        await self.broadcast({"event": "update", "data": list(models)})
+
+    async def set_state(self, model_id: str, state: str, **changes):
+        await self.update({**self.models[model_id], "state": state, **changes})
+
+    async def broadcast(self, event: dict):
+        message = json.dumps(event)
+        await asyncio.gather(*(client.send(message) for client in list(self._clients)), return_exceptions=True)
+
+    def init_messages(self) -> list[str]:
+        models = list(self.models.values())
+        if not self.init_page_size or len(models) <= self.init_page_size:
+            return [json.dumps({"event": "init", "data": models})]
+
+        pages = [models[start:start + self.init_page_size] for start in range(0, len(models), self.init_page_size)]
+        return [
+            json.dumps({"event": "init", "data": page, "page": index, "pages": len(pages)})
+            for index, page in enumerate(pages)
+        ]
+
+    async def _handle_client(self, websocket):
+        self._clients.add(websocket)
+        try:
+            for message in self.init_messages():
+                await websocket.send(message)
+
+            async for message in websocket:
+                event = json.loads(message)
+                self.received_messages.append(event)
+                if event.get("event") == "report_failure":
+                    self.failure_reports.extend(event.get("data") or [])
+                    for report in event.get("data") or []:
+                        if report.get("model_id") in self.models:
+                            self.models[report["model_id"]]["state"] = "STOPPED"
+        except websockets.ConnectionClosed:
+            logger.debug("Client disconnected")
+        finally:
+            self._clients.discard(websocket)
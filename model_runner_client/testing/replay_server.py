@@ -0,0 +1,108 @@
+"""
+Serve a call recording (see `utils.call_recorder`) as stand-in model nodes.
+
+Each recorded model gets its own `DynamicSubclassService` server, answering every method with the recorded
+responses of that model, in recorded order (cycling once exhausted), after the recorded latency.
+Recorded gRPC errors are replayed as such, recorded timeouts hang for `hang_seconds`.
+
+    with CallRecordReader("traffic.rec") as reader:
+        replay = ReplayCluster(reader)
+    orchestrator_port = await replay.start()  # a FakeOrchestrator announcing the replayed models
+    runner = DynamicSubclassModelConcurrentRunner(timeout, "replay", "127.0.0.1", orchestrator_port, ...)
+"""
+import asyncio
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
+
+import grpc
+from grpc_health.v1 import health_pb2, health_pb2_grpc
+from grpc_health.v1.health import aio as health_aio
+
+from ..grpc.generated import commons_pb2, dynamic_subclass_pb2, dynamic_subclass_pb2_grpc
+from ..utils.call_recorder import CallRecordReader, Outcome
+from .fake_orchestrator import FakeOrchestrator
+
+
+@dataclass
+class ReplayedCall:
+    latency: float
+    outcome: Outcome
+    response: dynamic_subclass_pb2.CallResponse | None
+    error_code: grpc.StatusCode | None
+
+
+class ReplayServicer(dynamic_subclass_pb2_grpc.DynamicSubclassServiceServicer):
+    def __init__(self, calls: dict[str, list[ReplayedCall]], hang_seconds: float = 60.0, speed: float = 1.0):
+        """
+        :param calls: Recorded calls by method name.
+        :param speed: Latency divisor, e.g. 2 replays twice as fast.
+        """
+        self.calls = {method_name: itertools.cycle(method_calls) for method_name, method_calls in calls.items()}
+        self.hang_seconds = hang_seconds
+        self.speed = speed
+        self.replayed = 0
+
+    async def Setup(self, request, context):
+        return dynamic_subclass_pb2.SetupResponse(status=commons_pb2.Status(code="SUCCESS", message="OK"))
+
+    async def Call(self, request, context):
+        calls = self.calls.get(request.methodName)
+        if calls is None:
+            return dynamic_subclass_pb2.CallResponse(status=commons_pb2.Status(code="FAILED", message=f"{request.methodName} was not recorded"))
+
+        call = next(calls)
+        self.replayed += 1
+        if call.outcome == Outcome.TIMEOUT:
+            await asyncio.sleep(self.hang_seconds)
+        else:
+            await asyncio.sleep(call.latency / self.speed)
+
+        if call.outcome == Outcome.RPC_ERROR:
+            await context.abort(call.error_code, "replayed error")
+        if call.outcome == Outcome.NO_RESPONSE:
+            # the client got no CallResponse and failed the call, replayed as a failure
+            return dynamic_subclass_pb2.CallResponse(status=commons_pb2.Status(code="FAILED", message="no response recorded"))
+        return call.response
+
+    async def Rest(self, request, context):
+        return dynamic_subclass_pb2.RestResponse(status=commons_pb2.Status(code="SUCCESS", message="OK"))
+
+
+class ReplayCluster:
+    def __init__(self, reader: CallRecordReader, host: str = "127.0.0.1", hang_seconds: float = 60.0, speed: float = 1.0):
+        """
+        The recording is loaded in memory (responses are parsed once), the reader can be closed afterward.
+        """
+        self.host = host
+        self.calls: dict[str, dict[str, list[ReplayedCall]]] = defaultdict(lambda: defaultdict(list))
+        for recorded_call in reader:
+            error_code = getattr(grpc.StatusCode, recorded_call.error_code) if recorded_call.outcome == Outcome.RPC_ERROR else None
+            self.calls[recorded_call.model_id][recorded_call.request.methodName].append(
+                ReplayedCall(recorded_call.latency, recorded_call.outcome, recorded_call.response, error_code)
+            )
+
+        self.servicers = {model_id: ReplayServicer(calls, hang_seconds, speed) for model_id, calls in self.calls.items()}
+        self.servers: dict[str, grpc.aio.Server] = {}
+        self.orchestrator = FakeOrchestrator(host)
+
+    async def start(self) -> int:
+        """Start one server per recorded model and the orchestrator announcing them, returns the orchestrator port."""
+        for model_id, servicer in self.servicers.items():
+            server = grpc.aio.server()
+            dynamic_subclass_pb2_grpc.add_DynamicSubclassServiceServicer_to_server(servicer, server)
+            health_servicer = health_aio.HealthServicer()
+            await health_servicer.set("", health_pb2.HealthCheckResponse.SERVING)
+            health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+
+            port = server.add_insecure_port(f"{self.host}:0")
+            await server.start()
+            self.servers[model_id] = server
+            self.orchestrator.add_model(model_id, self.host, port)
+
+        return await self.orchestrator.start()
+
+    async def stop(self):
+        await self.orchestrator.stop()
+        await asyncio.gather(*(server.stop(None) for server in self.servers.values()))
+        self.servers.clear()
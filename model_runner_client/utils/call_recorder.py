@@ -0,0 +1,177 @@
+"""
+Record-and-replay of `DynamicSubclassModelRunner.call` traffic.
+
+The recording is an append-only file: a magic header followed by length-prefixed frames, one per call:
+
+    frame length     uint32
+    cycle            uint64   fan-out cycle the call belongs to
+    started_at       float64  epoch seconds
+    latency          float64  seconds
+    outcome          uint8    RESPONSE, RPC_ERROR (payload: status code name), TIMEOUT or NO_RESPONSE (no payload)
+    model_id length  uint16
+    request length   uint32
+    payload length   uint32
+    model_id, serialized CallRequest, payload (serialized CallResponse for RESPONSE)
+
+`CallRecorder` buffers the frames in memory and writes them from its own thread, once per cycle or once
+`FLUSH_BYTES` are buffered, so recording does not block the event loop on file I/O.
+
+`CallRecordReader` memory-maps the file and parses frames lazily, so large recordings can be scanned
+without loading them. See `model_runner_client.testing.replay_server` to serve a recording.
+"""
+import mmap
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Iterator
+
+from ..grpc.generated.dynamic_subclass_pb2 import CallRequest, CallResponse
+
+MAGIC = b"MRCREC1\n"
+_FRAME_LENGTH = struct.Struct("<I")
+_FRAME_HEADER = struct.Struct("<QddBHII")
+
+
+class Outcome(IntEnum):
+    RESPONSE = 0
+    RPC_ERROR = 1
+    TIMEOUT = 2
+    NO_RESPONSE = 3  # the call returned no CallResponse
+
+
+@dataclass
+class RecordedCall:
+    cycle: int
+    started_at: float
+    latency: float
+    outcome: Outcome
+    model_id: str
+    request_bytes: memoryview
+    payload: memoryview
+
+    @property
+    def request(self) -> CallRequest:
+        return CallRequest.FromString(self.request_bytes)
+
+    @property
+    def response(self) -> CallResponse | None:
+        return CallResponse.FromString(self.payload) if self.outcome == Outcome.RESPONSE else None
+
+    @property
+    def error_code(self) -> str | None:
+        return bytes(self.payload).decode() if self.outcome == Outcome.RPC_ERROR else None
+
+
+class CallRecorder:
+    FLUSH_BYTES = 1 << 20
+
+    def __init__(self, path: str, flush_bytes: int = FLUSH_BYTES):
+        """
+        :param flush_bytes: Buffered frames are written once they reach this size, or at the next cycle.
+        """
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self.cycle = 0
+        self.records = 0
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._frames: list[bytes] = []
+        self._buffered_bytes = 0
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="call-recorder")  # one thread, frames stay in order
+
+    def next_cycle(self) -> int:
+        self._write_buffered()
+        self.cycle += 1
+        return self.cycle
+
+    def record(self, model_id: str, request: CallRequest, started_at: float, latency: float, outcome: Outcome, payload: bytes = b""):
+        model_id_bytes = model_id.encode()
+        request_bytes = request.SerializeToString()
+        header = _FRAME_HEADER.pack(self.cycle, started_at, latency, outcome, len(model_id_bytes), len(request_bytes), len(payload))
+        frame_length = len(header) + len(model_id_bytes) + len(request_bytes) + len(payload)
+        frame = b"".join((_FRAME_LENGTH.pack(frame_length), header, model_id_bytes, request_bytes, payload))
+        self._frames.append(frame)
+        self._buffered_bytes += len(frame)
+        self.records += 1
+        if self._buffered_bytes >= self.flush_bytes:
+            self._write_buffered()
+
+    def record_response(self, model_id: str, request: CallRequest, started_at: float, response: CallResponse | None):
+        if response is None:
+            self.record(model_id, request, started_at, time.time() - started_at, Outcome.NO_RESPONSE)
+            return
+        self.record(model_id, request, started_at, time.time() - started_at, Outcome.RESPONSE, response.SerializeToString())
+
+    def record_error(self, model_id: str, request: CallRequest, started_at: float, error_code: str | None):
+        outcome = Outcome.TIMEOUT if error_code is None else Outcome.RPC_ERROR
+        self.record(model_id, request, started_at, time.time() - started_at, outcome, (error_code or "").encode())
+
+    def _write_buffered(self):
+        if not self._frames:
+            return
+        frames, self._frames, self._buffered_bytes = self._frames, [], 0
+        self._writer.submit(self._file.writelines, frames)
+
+    def flush(self):
+        """Write the buffered frames and wait until they reach the file (blocking)."""
+        self._write_buffered()
+        self._writer.submit(self._file.flush).result()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._writer.shutdown()
+            self._file.close()
+
+    def __enter__(self) -> "CallRecorder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CallRecordReader:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a call recording")
+
+    def __iter__(self) -> Iterator[RecordedCall]:
+        view = memoryview(self._mmap)
+        offset = len(MAGIC)
+        end = len(view)
+        while offset + _FRAME_LENGTH.size <= end:
+            (frame_length,) = _FRAME_LENGTH.unpack_from(view, offset)
+            offset += _FRAME_LENGTH.size
+            if offset + frame_length > end:
+                break  # truncated last frame (recorder interrupted)
+
+            cycle, started_at, latency, outcome, model_id_length, request_length, payload_length = _FRAME_HEADER.unpack_from(view, offset)
+            position = offset + _FRAME_HEADER.size
+            model_id = bytes(view[position:position + model_id_length]).decode()
+            position += model_id_length
+            request_bytes = view[position:position + request_length]
+            position += request_length
+            payload = view[position:position + payload_length]
+
+            yield RecordedCall(cycle, started_at, latency, Outcome(outcome), model_id, request_bytes, payload)
+            offset += frame_length
+
+    def close(self):
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # recorded calls still reference the mapping, it is released with them
+        self._file.close()
+
+    def __enter__(self) -> "CallRecordReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,9 +1,48 @@
 import json
+import math
 import struct
 import io
+import numpy
 import pandas
 from model_runner_client.grpc.generated.commons_pb2 import VariantType
 
+# NDARRAY layout: dtype length (uint8), ndim (uint8), dtype string (e.g. "<f8"), shape (int64 each),
+# zero padding up to a multiple of 16 bytes so the data is aligned, then the raw C-ordered little-endian buffer.
+_TENSOR_HEADER = struct.Struct("<BB")
+_TENSOR_ALIGNMENT = 16
+
+
+def _encode_ndarray(array: numpy.ndarray) -> bytes:
+    if array.dtype.hasobject or array.dtype.fields is not None:
+        raise ValueError(f"Unsupported array dtype: {array.dtype}")
+
+    little_endian = array.dtype.newbyteorder("<")
+    if array.dtype != little_endian:
+        array = array.astype(little_endian)
+    if not array.flags.c_contiguous:
+        array = array.copy(order="C")
+
+    dtype = array.dtype.str.encode()
+    header = _TENSOR_HEADER.pack(len(dtype), array.ndim) + dtype + struct.pack(f"<{array.ndim}q", *array.shape)
+    header += b"\0" * (-len(header) % _TENSOR_ALIGNMENT)
+    # the array buffer is only read once, when joined with the header
+    return b"".join((header, memoryview(array.reshape(-1).view(numpy.uint8))))
+
+
+def _decode_ndarray(data_bytes: bytes) -> numpy.ndarray:
+    """The returned array is a read-only view over `data_bytes`, copy it to modify it."""
+    try:
+        dtype_length, ndim = _TENSOR_HEADER.unpack_from(data_bytes)
+        offset = _TENSOR_HEADER.size
+        dtype = numpy.dtype(bytes(data_bytes[offset:offset + dtype_length]).decode())
+        offset += dtype_length
+        shape = struct.unpack_from(f"<{ndim}q", data_bytes, offset)
+        offset += 8 * ndim
+        offset += -offset % _TENSOR_ALIGNMENT
+        return numpy.frombuffer(data_bytes, dtype=dtype, count=math.prod(shape), offset=offset).reshape(shape)
+    except (struct.error, TypeError, ValueError) as e:
+        raise ValueError(f"Failed to decode NDARRAY data: {e}")
+
 
 # Encoder: Converts data to bytes
 def encode_data(data_type: VariantType, data) -> bytes:
@@ -12,7 +51,7 @@ def encode_data(data_type: VariantType, data) -> bytes:
     elif data_type == VariantType.DOUBLE:
         return struct.pack("d", data)
     elif data_type == VariantType.INT:
-        return data.to_bytes(8, byteorder="little", signed=True)
+        return int(data).to_bytes(8, byteorder="little", signed=True)
     elif data_type == VariantType.STRING:
         return data.encode("utf-8")
     elif data_type == VariantType.PARQUET:
@@ -28,6 +67,10 @@ def encode_data(data_type: VariantType, data) -> bytes:
             return json_data.encode("utf-8")  # Return the JSON string as bytes
         except TypeError as e:
             raise ValueError(f"Data cannot be serialized to JSON: {e}")
+    elif data_type == VariantType.NDARRAY:
+        return _encode_ndarray(numpy.asarray(data))
+    elif data_type == VariantType.BYTES:
+        return bytes(data)
     else:
         raise ValueError(f"Unsupported data type: {data_type}")
 
@@ -53,6 +96,10 @@ def decode_data(data_bytes: bytes, data_type: VariantType):
             return json.loads(json_data)
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to decode JSON data: {e}")
+    elif data_type == VariantType.NDARRAY:
+        return _decode_ndarray(data_bytes)
+    elif data_type == VariantType.BYTES:
+        return data_bytes
 
     else:
         raise ValueError(f"Unsupported data type: {data_type}")
@@ -65,12 +112,16 @@ def detect_data_type(data) -> VariantType:
     """
     if data is None:
         return VariantType.NONE
-    elif isinstance(data, float):
+    elif isinstance(data, (float, numpy.floating)):
         return VariantType.DOUBLE
-    elif isinstance(data, int):
+    elif isinstance(data, (int, numpy.integer, numpy.bool_)):
         return VariantType.INT
     elif isinstance(data, str):
         return VariantType.STRING
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        return VariantType.BYTES
+    elif isinstance(data, numpy.ndarray):
+        return VariantType.NDARRAY
     elif isinstance(data, pandas.DataFrame):
         return VariantType.PARQUET
     elif isinstance(data, dict) or isinstance(data, list):
@@ -0,0 +1,175 @@
+"""
+Event loop instrumentation: scheduling lag, live tasks by category and slow callbacks.
+
+- Lag: a probe task sleeps `interval` seconds and measures how late it wakes up.
+- Tasks: live tasks are counted by category, the part of their name before ":" (e.g. `call:model_1`),
+  tasks without a category are counted as "other".
+- Slow callbacks: a watchdog thread notices when the probe has not run for `slow_callback_threshold` seconds,
+  i.e. one callback holds the loop, and records the running task and the code it is executing.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from dataclasses import dataclass, field
+
+logger = logging.getLogger("model_runner_client.loop_monitor")
+
+
+@dataclass
+class SlowCallback:
+    duration_ms: float  # how long the loop was blocked when it was sampled (at least)
+    task: str | None  # name of the running task, None for a plain callback
+    coroutine: str | None
+    location: str  # innermost frame of the loop thread
+
+
+@dataclass
+class LoopStats:
+    samples: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    total_lag_ms: float = 0.0
+    slow_callbacks: int = 0
+    tasks: dict[str, int] = field(default_factory=dict)  # live tasks by category, at the last sample
+    recent_slow_callbacks: deque[SlowCallback] = field(default_factory=lambda: deque(maxlen=20))
+
+    @property
+    def mean_lag_ms(self) -> float:
+        return self.total_lag_ms / self.samples if self.samples else 0.0
+
+
+def task_category(task: asyncio.Task) -> str:
+    name = task.get_name()
+    category, separator, _ = name.partition(":")
+    return category if separator else "other"
+
+
+class LoopMonitor:
+    INTERVAL = 0.1
+    SLOW_CALLBACK_THRESHOLD = 0.1
+
+    def __init__(
+        self,
+        interval: float = INTERVAL,
+        slow_callback_threshold: float = SLOW_CALLBACK_THRESHOLD,
+        log_interval: float | None = None,
+    ):
+        """
+        :param interval: Lag probe period (seconds).
+        :param slow_callback_threshold: A callback holding the loop longer than this (seconds) is reported.
+        :param log_interval: Log a summary every `log_interval` seconds (None: no log).
+        """
+        self.interval = interval
+        self.slow_callback_threshold = slow_callback_threshold
+        self.log_interval = log_interval
+        self.stats = LoopStats()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat = 0.0  # time.monotonic() of the last probe run
+        self._probe_task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._probe_task is not None
+
+    def start(self):
+        if self.running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._probe_task = asyncio.create_task(self._probe(), name="loop-monitor:probe")
+
+        self._stop = threading.Event()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self):
+        if not self.running:
+            return
+
+        self._stop.set()
+        self._probe_task.cancel()
+        await asyncio.gather(self._probe_task, return_exceptions=True)
+        self._probe_task = None
+        self._watchdog.join(timeout=1)
+        self._watchdog = None
+
+    async def _probe(self):
+        loop = asyncio.get_running_loop()
+        last_log = loop.time()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            now = loop.time()
+            self._heartbeat = time.monotonic()
+            self._record_lag(max(0.0, now - expected))
+
+            if self.log_interval is not None and now - last_log >= self.log_interval:
+                last_log = now
+                self.count_tasks()
+                logger.info(self.summary())
+
+    def _record_lag(self, lag: float):
+        lag_ms = lag * 1000
+        self.stats.samples += 1
+        self.stats.last_lag_ms = lag_ms
+        self.stats.total_lag_ms += lag_ms
+        self.stats.max_lag_ms = max(self.stats.max_lag_ms, lag_ms)
+
+    def count_tasks(self) -> dict[str, int]:
+        """Count the live tasks by category (walks every task, not done on each probe)."""
+        self.stats.tasks = dict(Counter(task_category(task) for task in asyncio.all_tasks(self._loop)))
+        return self.stats.tasks
+
+    def summary(self) -> str:
+        stats = self.stats
+        tasks = ", ".join(f"{category}={count}" for category, count in sorted(stats.tasks.items()))
+        return (
+            f"Event loop: lag last={stats.last_lag_ms:.1f}ms mean={stats.mean_lag_ms:.1f}ms max={stats.max_lag_ms:.1f}ms, "
+            f"slow callbacks={stats.slow_callbacks}, tasks: {tasks or 'not counted'}"
+        )
+
+    def _watch(self):
+        reported_heartbeat = None
+        while not self._stop.wait(self.slow_callback_threshold / 2):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - self.interval
+            if blocked < self.slow_callback_threshold or heartbeat == reported_heartbeat:
+                continue
+
+            reported_heartbeat = heartbeat  # one report per stall
+            slow_callback = self._sample_loop_thread(blocked)
+            if slow_callback is None:
+                continue
+            self.stats.slow_callbacks += 1
+            self.stats.recent_slow_callbacks.append(slow_callback)
+            logger.warning(
+                f"Event loop blocked for {slow_callback.duration_ms:.0f}ms+ by "
+                f"{slow_callback.coroutine or 'a callback'} (task {slow_callback.task}) at {slow_callback.location}"
+            )
+
+    def _sample_loop_thread(self, blocked: float) -> SlowCallback | None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+
+        stack = traceback.extract_stack(frame, limit=20)
+        location = f"{stack[-1].filename}:{stack[-1].lineno} in {stack[-1].name}" if stack else "unknown"
+
+        task = asyncio.current_task(self._loop)  # read-only access to the loop's current task
+        coroutine = task.get_coro() if task else None
+        return SlowCallback(
+            duration_ms=blocked * 1000,
+            task=task.get_name() if task else None,
+            coroutine=getattr(coroutine, "__qualname__", None),
+            location=location,
+        )
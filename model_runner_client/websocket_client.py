@@ -2,15 +2,32 @@ import asyncio
 import atexit
 import json
 import logging
+from collections import deque
 
 import websockets
 from websockets import State
 
+from .failure_reporter import FailureReportBatcher
+from .utils.message_codec import MSGPACK, binary_encoding_available, decode_message
+
 logger = logging.getLogger("model_runner_client")
 
 
 class WebsocketClient:
-    def __init__(self, host, port, crunch_id, event_handler=None):
+    MAX_MERGED_REPORTS = FailureReportBatcher.MAX_BATCH_SIZE
+    MAX_MESSAGE_SIZE = 64 * 1024 * 1024  # init snapshots of 10k+ models are several MB
+
+    def __init__(
+        self,
+        host,
+        port,
+        crunch_id,
+        event_handler=None,
+        max_merged_reports=MAX_MERGED_REPORTS,
+        compression: str | None = "deflate",
+        max_message_size: int | None = MAX_MESSAGE_SIZE,
+        binary_encoding: bool = False,
+    ):
         """
         WebsocketClient constructor.
 
@@ -18,6 +35,10 @@ class WebsocketClient:
         :param port: WebSocket server port.
         :param crunch_id: Crunch ID used to connect to the server.
         :param event_handler: Optional handler for WebSocket events (delegated to ModelCluster).
+        :param max_merged_reports: Failure reports merged into one queued `report_failure` message, at most.
+        :param compression: Negotiate permessage-deflate ("deflate") or not (None).
+        :param max_message_size: Largest message accepted from the server, None for no limit.
+        :param binary_encoding: Ask the server for msgpack encoded events (ignored if msgpack is not installed).
         """
         self.retry_interval = 10
         self.max_retries = 5
@@ -27,7 +48,14 @@ class WebsocketClient:
         self.crunch_id = crunch_id
         self.websocket = None
         self.event_handler = event_handler  # Delegate to ModelCluster
-        self.message_queue = asyncio.Queue()
+        self.message_queue: deque[str] = deque()
+        self.max_merged_reports = max_merged_reports
+        self._tail_reports: dict[str, dict] | None = None  # reports of the last queued message, while it can be merged into
+        self.compression = compression
+        self.max_message_size = max_message_size
+        self.binary_encoding = binary_encoding and binary_encoding_available()
+        if binary_encoding and not self.binary_encoding:
+            logger.warning("Binary encoding requested but msgpack is not installed, falling back to JSON")
 
     def __del__(self):
         atexit.register(self.disconnect_sync)
@@ -38,11 +66,13 @@ class WebsocketClient:
         """
         retry_count = 0
         uri = f"ws://{self.host}:{self.port}/{self.crunch_id}"
+        if self.binary_encoding:
+            uri += f"?encoding={MSGPACK}"
 
         while self.max_retries > retry_count:
             try:
                 logger.debug(f"Connecting to WebSocket server at {uri}")
-                self.websocket = await websockets.connect(uri)
+                self.websocket = await websockets.connect(uri, compression=self.compression, max_size=self.max_message_size)
                 logger.info(f"Connected to WebSocket server at {uri}")
                 break
             except (websockets.exceptions.ConnectionClosed, ConnectionRefusedError, OSError, asyncio.TimeoutError) as e:
@@ -60,11 +90,15 @@ class WebsocketClient:
     async def init(self):
         """
         Listen first message who is init from the WebSocket server.
+        A paged snapshot (`page`/`pages` fields) is read until its last page, each page is handled as it arrives.
         """
         # retry here doesn't make sens, it comme after connection and connection handle retries
         try:
-            message = await self.websocket.recv()
-            await self.handle_event(message)
+            while True:
+                message = await self.websocket.recv()
+                event = await self.handle_event(message)
+                if not event or event.get("page", 0) + 1 >= event.get("pages", 1):
+                    break
         except websockets.exceptions.ConnectionClosed:
             logger.warning("WebSocket connection closed by the server.")
         except Exception as e:
@@ -105,26 +139,34 @@ class WebsocketClient:
         """
         return self.websocket is not None and self.websocket.state == State.OPEN
 
-    async def handle_event(self, message):
+    async def handle_event(self, message) -> dict | None:
         """
         Handle incoming WebSocket messages and forward to the event handler.
 
-        :param message: Message received from the server.
+        :param message: Message received from the server (JSON text or msgpack binary frame).
+        :return: The decoded event, None if it could not be decoded.
         """
         try:
-            event = json.loads(message)
-            event_type = event.get("event")
-            data = event.get("data")
-
-            logger.debug(f"Received event: {event_type}, data: {data}")
-
-            # Delegate to the event handler, if available
-            if self.event_handler:
-                await self.event_handler(event_type, data)
-            else:
-                logger.warning("No event handler defined. Event will be ignored.")
-        except json.JSONDecodeError:
-            logger.error(f"Failed to decode WebSocket message: {message}")
+            event = decode_message(message)
+            if not isinstance(event, dict):
+                raise ValueError("not an event")
+        except ValueError:
+            logger.error(f"Failed to decode WebSocket message ({len(message)} bytes): {message[:200]!r}")
+            return None
+
+        event_type = event.get("event")
+        data = event.get("data")
+        paging = {key: event[key] for key in ("page", "pages") if key in event}
+
+        # the payload itself is not logged, an init snapshot can be several MB
+        logger.debug(f"Received event: {event_type}, {len(data) if data else 0} entries {paging or ''}")
+
+        # Delegate to the event handler, if available
+        if self.event_handler:
+            await self.event_handler(event_type, data, **paging)
+        else:
+            logger.warning("No event handler defined. Event will be ignored.")
+        return event
 
     async def send_message(self, message: str):
         """
@@ -137,23 +179,55 @@ class WebsocketClient:
                 logger.info(f"Message sent: {message}")
             except (websockets.ConnectionClosed, websockets.InvalidState, asyncio.TimeoutError) as e:
                 logger.warning(f"Failed to send message, queuing it: {message}. Error: {e}")
-                await self.message_queue.put(message)
+                self._queue_message(message)
         else:
             logger.info(f"Connection unavailable, queuing message: {message}")
-            await self.message_queue.put(message)
+            self._queue_message(message)
+
+    def _queue_message(self, message: str):
+        """
+        Queue a message, in order. A `report_failure` message following another one in the queue is merged into it
+        (keeping the first report of each model), up to `max_merged_reports` reports per message.
+        """
+        reports = self._failure_reports(message)
+        if not reports:
+            self.message_queue.append(message)
+            self._tail_reports = None
+            return
+
+        for report in reports:
+            if self._tail_reports is None or len(self._tail_reports) >= self.max_merged_reports:
+                self._serialize_tail_reports()
+                self._tail_reports = {}
+                self.message_queue.append(message)  # replaced by the merged reports
+            self._tail_reports.setdefault(report.get("model_id"), report)
+        self._serialize_tail_reports()
+
+    def _serialize_tail_reports(self):
+        if self._tail_reports is not None:
+            self.message_queue[-1] = json.dumps({"event": "report_failure", "data": list(self._tail_reports.values())})
+
+    @staticmethod
+    def _failure_reports(message: str) -> list[dict] | None:
+        try:
+            event = json.loads(message)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(event, dict) or event.get("event") != "report_failure":
+            return None
+        return event.get("data") or []
 
     async def _send_pending_messages(self):
         """
-        Process the queue and send pending messages
+        Process the queue and send pending messages, in order. A message leaves the queue once sent.
         """
-        while not self.message_queue.empty():
-            message = await self.message_queue.get()
-            try:
-                await self.websocket.send(message)
-                logger.info(f"Message sent from queue: {message}")
-            except Exception as e:
-                await self.message_queue.put(message)
-                raise e
+        while self.message_queue:
+            if len(self.message_queue) == 1:
+                self._tail_reports = None  # being sent, the next reports go to a new message
+            message = self.message_queue[0]
+            await self.websocket.send(message)
+            self.message_queue.popleft()
+            logger.info(f"Message sent from queue: {message}")
 
     def disconnect_sync(self):
         loop = asyncio.get_event_loop()
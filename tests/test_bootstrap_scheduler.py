@@ -0,0 +1,134 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from model_runner_client.bootstrap_scheduler import BootstrapProgress, BootstrapScheduler
+
+
+class TestBootstrapScheduler(IsolatedAsyncioTestCase):
+    async def test_max_concurrency(self):
+        scheduler = BootstrapScheduler(max_concurrency=2)
+        running = 0
+        max_running = 0
+
+        async def bootstrap(model_id):
+            nonlocal running, max_running
+            async with scheduler.slot(model_id):
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(bootstrap(f"model_{i}") for i in range(10)))
+
+        self.assertEqual(2, max_running)
+        self.assertEqual(0, scheduler.active)
+        self.assertEqual(0, scheduler.waiting)
+
+    async def test_healthy_models_first(self):
+        scheduler = BootstrapScheduler(max_concurrency=1)
+        scheduler.mark_healthy("healthy")
+        order = []
+
+        async def bootstrap(model_id):
+            async with scheduler.slot(model_id):
+                order.append(model_id)
+                await asyncio.sleep(0)
+
+        blocker = asyncio.Event()
+
+        async def block():
+            async with scheduler.slot("blocker"):
+                await blocker.wait()
+
+        blocking_task = asyncio.create_task(block())
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(bootstrap(model_id)) for model_id in ("new_1", "new_2", "healthy")]
+        await asyncio.sleep(0)
+        blocker.set()
+        await asyncio.gather(blocking_task, *tasks)
+
+        self.assertEqual(["healthy", "new_1", "new_2"], order)
+
+    async def test_cancelled_waiter_releases_its_place(self):
+        scheduler = BootstrapScheduler(max_concurrency=1)
+
+        async def hold():
+            async with scheduler.slot("holder"):
+                await asyncio.sleep(0.01)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await holder
+
+        self.assertEqual(0, scheduler.active)
+        self.assertEqual(0, scheduler.waiting)
+
+    async def test_waiter_cancelled_while_handing_over(self):
+        scheduler = BootstrapScheduler(max_concurrency=1)
+        released = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot("holder"):
+                await released.wait()
+
+        async def wait():
+            async with scheduler.slot("waiter"):
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0)
+        released.set()
+        waiter.cancel()  # in the same loop iteration as the release
+        results = await asyncio.gather(holder, waiter, return_exceptions=True)
+
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], asyncio.CancelledError)
+        self.assertEqual(0, scheduler.active)
+        self.assertEqual(0, scheduler.waiting)
+
+        async with scheduler.slot("next"):
+            self.assertEqual(1, scheduler.active)
+
+    async def test_ramp_up_rate(self):
+        scheduler = BootstrapScheduler(max_concurrency=10, ramp_up_rate=100)
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        async def bootstrap(model_id):
+            async with scheduler.slot(model_id):
+                pass
+
+        await asyncio.gather(*(bootstrap(f"model_{i}") for i in range(5)))
+
+        self.assertGreaterEqual(loop.time() - start_time, 0.04)
+
+
+class TestBootstrapProgress(IsolatedAsyncioTestCase):
+    async def test_wait_for_fraction(self):
+        progress = BootstrapProgress()
+        waiter = asyncio.create_task(progress.wait_for(0.5))
+
+        progress.reset({"model_1", "model_2", "model_3", "model_4"})
+        progress.mark_ready("model_1")
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        progress.mark_ready("model_2")
+        await asyncio.wait_for(waiter, timeout=1)
+        self.assertEqual(0.5, progress.fraction)
+
+    async def test_wait_for_settled(self):
+        progress = BootstrapProgress()
+        progress.reset({"model_1", "model_2"})
+        progress.mark_ready("model_1")
+        progress.mark_failed("model_2")
+        progress.mark_ready("unknown_model")
+
+        await asyncio.wait_for(progress.wait_for(1.0), timeout=1)
+        self.assertEqual(1, progress.ready)
+        self.assertEqual(1, progress.failed)
@@ -0,0 +1,103 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+import grpc
+from grpc.aio import AioRpcError
+
+from model_runner_client.grpc.generated.commons_pb2 import Status
+from model_runner_client.grpc.generated.dynamic_subclass_pb2 import CallRequest, CallResponse
+from model_runner_client.model_concurrent_runners import DynamicSubclassModelConcurrentRunner, ModelPredictResult
+from model_runner_client.model_runners.call_batcher import CallBatcher
+from model_runner_client.testing import FakeModelBehavior, FakeModelServer, FakeOrchestrator
+
+
+def echo(call_request: CallRequest) -> CallResponse:
+    return CallResponse(status=Status(code="SUCCESS", message=call_request.methodName))
+
+
+class TestCallBatcher(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.send_call = AsyncMock(side_effect=lambda call_request, timeout: echo(call_request))
+        self.send_batch = AsyncMock(side_effect=lambda call_requests, timeout: [echo(call_request) for call_request in call_requests])
+        self.batcher = CallBatcher(self.send_call, self.send_batch, window=0.01, max_batch_size=3)
+
+    async def call_all(self, *method_names: str, timeout=1.0) -> list[str]:
+        responses = await asyncio.gather(*(self.batcher.call(CallRequest(methodName=name), timeout) for name in method_names))
+        return [response.status.message for response in responses]
+
+    async def test_calls_within_the_window_are_batched(self):
+        self.assertEqual(["a", "b"], await self.call_all("a", "b"))
+        self.send_batch.assert_awaited_once()
+        self.assertEqual(1.0, self.send_batch.await_args.args[1])
+        self.send_call.assert_not_awaited()
+        self.assertEqual(2, self.batcher.stats.batched_calls)
+
+    async def test_single_call_is_sent_alone(self):
+        self.assertEqual(["a"], await self.call_all("a"))
+        self.send_call.assert_awaited_once()
+        self.send_batch.assert_not_awaited()
+
+    async def test_max_batch_size(self):
+        self.assertEqual(["a", "b", "c", "d"], await self.call_all("a", "b", "c", "d"))
+        self.assertEqual(3, len(self.send_batch.await_args.args[0]))  # the first 3 are sent without waiting
+        self.send_call.assert_awaited_once()
+
+    async def test_unimplemented_falls_back_to_single_calls(self):
+        self.send_batch.side_effect = AioRpcError(grpc.StatusCode.UNIMPLEMENTED, None, None)
+        self.assertEqual(["a", "b"], await self.call_all("a", "b"))
+        self.assertFalse(self.batcher.supported)
+        self.assertEqual(2, self.send_call.await_count)
+
+        self.assertEqual(["c", "d"], await self.call_all("c", "d"))
+        self.send_batch.assert_awaited_once()
+
+    async def test_errors_reach_every_caller(self):
+        self.send_batch.side_effect = AioRpcError(grpc.StatusCode.UNAVAILABLE, None, None)
+        results = await asyncio.gather(*(self.batcher.call(CallRequest(methodName=name), 1.0) for name in "ab"), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, AioRpcError) for result in results))
+
+    async def test_caller_timeout(self):
+        async def slow_batch(call_requests, timeout):
+            await asyncio.sleep(0.2)
+            return [echo(call_request) for call_request in call_requests]
+
+        self.send_batch.side_effect = slow_batch
+        fast, slow = await asyncio.gather(
+            self.batcher.call(CallRequest(methodName="a"), 0.05),
+            self.batcher.call(CallRequest(methodName="b"), 1.0),
+            return_exceptions=True,
+        )
+        self.assertIsInstance(fast, asyncio.TimeoutError)
+        self.assertEqual("b", slow.status.message)
+
+
+class TestBatchCallServer(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.servers = [FakeModelServer(FakeModelBehavior(latency_ms=5)), FakeModelServer(FakeModelBehavior(latency_ms=5, batch_call=False))]
+        self.orchestrator = FakeOrchestrator()
+        orchestrator_port = await self.orchestrator.start()
+        for index, server in enumerate(self.servers):
+            self.orchestrator.add_model(f"model_{index}", "127.0.0.1", await server.start())
+
+        self.runner = DynamicSubclassModelConcurrentRunner(1, "crunch_id", "127.0.0.1", orchestrator_port, base_classname="test.Model", batch_window=0.01)
+        await self.runner.init()
+
+    async def asyncTearDown(self):
+        await self.runner.close()
+        await self.orchestrator.stop()
+        for server in self.servers:
+            await server.stop()
+
+    async def test_concurrent_producers(self):
+        results = await asyncio.gather(*(self.runner.call("predict") for _ in range(3)))
+
+        for cycle_results in results:
+            self.assertEqual(
+                [ModelPredictResult.Status.SUCCESS] * 2,
+                [result.status for result in cycle_results.values()],
+            )
+
+        batching, legacy = (server.servicer for server in self.servers)
+        self.assertEqual((3, 1), (batching.calls, batching.batches))
+        self.assertEqual((3, 0), (legacy.calls, legacy.batches))
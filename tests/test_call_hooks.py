@@ -0,0 +1,159 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from model_runner_client.call_hooks import CallEvent, CallHookDispatcher, CallHooks, ModelEvent
+from model_runner_client.model_cluster import ModelCluster
+from model_runner_client.model_concurrent_runners import CachePolicy, DynamicSubclassModelConcurrentRunner, ModelPredictResult
+from model_runner_client.model_registry import ModelRegistry
+from model_runner_client.model_runners import ModelRunner
+
+
+class RecordingHooks(CallHooks):
+    def __init__(self):
+        self.events: list[tuple] = []
+
+    def on_dispatch(self, event: CallEvent):
+        self.events.append(("dispatch", event.model.model_id, event.method_name))
+
+    def on_result(self, event: CallEvent):
+        self.events.append(("result", event.model.model_id, event.status, event.result))
+
+    def on_failure(self, event: CallEvent):
+        self.events.append(("failure", event.model.model_id, event.status))
+
+    def on_skip(self, event: CallEvent):
+        self.events.append(("skip", event.model.model_id))
+
+    def on_reconnect(self, event: ModelEvent):
+        self.events.append(("reconnect", event.model.model_id))
+
+    def on_model_added(self, event: ModelEvent):
+        self.events.append(("added", event.model.model_id))
+
+    def on_model_removed(self, event: ModelEvent):
+        self.events.append(("removed", event.model.model_id))
+
+
+class TestCallHookDispatcher(TestCase):
+    def test_inactive_without_overridden_hooks(self):
+        dispatcher = CallHookDispatcher()
+        self.assertFalse(dispatcher.active)
+
+        dispatcher.add(CallHooks())
+        self.assertFalse(dispatcher.active)
+
+        hooks = RecordingHooks()
+        dispatcher.add(hooks)
+        self.assertTrue(dispatcher.active)
+        dispatcher.remove(hooks)
+        self.assertFalse(dispatcher.active)
+
+    def test_events_are_recycled(self):
+        dispatcher = CallHookDispatcher()
+        dispatcher.add(RecordingHooks())
+        model = ModelRunner("deployment_1", "model_1", "model", "127.0.0.1", 5000, {})
+
+        event = dispatcher.dispatch(model, "predict")
+        dispatcher.complete(event, ModelPredictResult.of_success(model, 1, 10))
+        self.assertIs(event, dispatcher.dispatch(model, "predict"))
+        self.assertIsNone(event.status)
+
+    def test_failing_hook_does_not_propagate(self):
+        class FailingHooks(CallHooks):
+            def on_dispatch(self, event):
+                raise RuntimeError("broken hook")
+
+        dispatcher = CallHookDispatcher()
+        dispatcher.add(FailingHooks())
+        model = ModelRunner("deployment_1", "model_1", "model", "127.0.0.1", 5000, {})
+        with self.assertLogs("model_runner_client.call_hooks", "ERROR"):
+            dispatcher.dispatch(model, "predict")
+
+
+class TestCallHooks(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.patcher = patch("model_runner_client.model_concurrent_runners.model_concurrent_runner.ModelCluster")
+        self.addCleanup(self.patcher.stop)
+        self.mock_model_cluster = self.patcher.start().return_value
+
+        self.models = [ModelRunner("deployment_1", f"model_{index}", "model", "127.0.0.1", 5000, {}) for index in range(3)]
+        self.models[0].call = AsyncMock(return_value=("value", None))
+        self.models[1].call = AsyncMock(return_value=(None, ModelRunner.ErrorType.FAILED))
+        self.models[2].call = AsyncMock(return_value=("value", None))
+        self.models[2].healthy = False
+        self.mock_model_cluster.models_run = ModelRegistry()
+        self.mock_model_cluster.models_run.update({model.model_id: model for model in self.models})
+
+        self.hooks = RecordingHooks()
+        self.concurrent_runner = DynamicSubclassModelConcurrentRunner(
+            10, "crunch", "localhost", 1234, "base.Class",
+            report_failure=False, call_hooks=[self.hooks], cached_methods={"describe": CachePolicy()},
+        )
+
+    async def test_call_lifecycle(self):
+        await self.concurrent_runner.call("predict")
+
+        self.assertEqual(
+            sorted([
+                ("dispatch", "model_0", "predict"),
+                ("dispatch", "model_1", "predict"),
+                ("dispatch", "model_2", "predict"),
+                ("result", "model_0", ModelPredictResult.Status.SUCCESS, "value"),
+                ("failure", "model_1", ModelPredictResult.Status.FAILED),
+                ("skip", "model_2"),
+            ], key=str),
+            sorted(self.hooks.events, key=str),
+        )
+
+    async def test_cached_results(self):
+        await self.concurrent_runner.call("describe", model_runs=[self.models[0]])
+        self.hooks.events.clear()
+        await self.concurrent_runner.call("describe", model_runs=[self.models[0]])
+
+        self.assertEqual(
+            [("dispatch", "model_0", "describe"), ("result", "model_0", ModelPredictResult.Status.CACHED, "value")],
+            self.hooks.events,
+        )
+
+    async def test_removed_hooks_are_not_called(self):
+        self.concurrent_runner.remove_call_hooks(self.hooks)
+        await self.concurrent_runner.call("predict")
+        self.assertEqual([], self.hooks.events)
+
+
+class TestClusterHooks(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.hooks = RecordingHooks()
+        dispatcher = CallHookDispatcher()
+        dispatcher.add(self.hooks)
+        self.cluster = ModelCluster("crunch_id", "localhost", 9091, self.create_model_runner, call_hooks=dispatcher)
+        self.cluster.ws_client = MagicMock(send_message=AsyncMock())
+
+    @staticmethod
+    def create_model_runner(**kwargs) -> ModelRunner:
+        model_runner = ModelRunner(**kwargs)
+        model_runner.init = AsyncMock(return_value=(True, None))
+        return model_runner
+
+    async def test_membership_events(self):
+        model_runner = self.create_model_runner(deployment_id="deployment_1", model_id="model_1", model_name="model", ip="127.0.0.1", port=5000, infos={})
+        await self.cluster.add_model_runner(model_runner)
+        await self.cluster.reconnect_model_runner(model_runner)
+        await self.cluster.remove_model(model_runner.model_id)
+
+        self.assertEqual(
+            [("added", "model_1"), ("reconnect", "model_1"), ("removed", "model_1"), ("added", "model_1"), ("removed", "model_1")],
+            self.hooks.events,
+        )
+
+    async def test_make_before_break_membership_events(self):
+        self.cluster.make_before_break = True
+        model_runner = self.create_model_runner(deployment_id="deployment_1", model_id="model_1", model_name="model", ip="127.0.0.1", port=5000, infos={})
+        await self.cluster.add_model_runner(model_runner)
+        await self.cluster.reconnect_model_runner(model_runner)
+        await self.cluster.remove_model("model_1")
+
+        self.assertEqual(
+            [("added", "model_1"), ("reconnect", "model_1"), ("removed", "model_1"), ("added", "model_1"), ("removed", "model_1")],
+            self.hooks.events,
+        )
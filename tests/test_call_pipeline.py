@@ -0,0 +1,152 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from model_runner_client.model_concurrent_runners import CachePolicy, CallPipeline, DynamicSubclassModelConcurrentRunner, ModelPredictResult
+from model_runner_client.model_registry import ModelRegistry
+from model_runner_client.model_runners import ModelRunner
+from model_runner_client.model_runners.channel_pool import ChannelPool
+from model_runner_client.testing import FakeModelBehavior, FakeModelServer, FakeOrchestrator
+
+
+class EchoModelRunner(ModelRunner):
+    def __init__(self, model_id: str, latency: float):
+        super().__init__("deployment_1", model_id, "model", "127.0.0.1", 5000, {})
+        self.latency = latency
+        self.received = []
+        self.sequences = []
+
+    async def call(self, method_name, arguments=([], []), timeout=None, decode_response=True, order=None):
+        args, _ = arguments(self) if callable(arguments) else arguments
+        self.received.append(args)
+        self.sequences.append(order.sequence)
+        await asyncio.sleep(self.latency)
+        return args, None
+
+
+class TestCallPipeline(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.patcher = patch("model_runner_client.model_concurrent_runners.model_concurrent_runner.ModelCluster")
+        self.addCleanup(self.patcher.stop)
+        self.mock_model_cluster = self.patcher.start().return_value
+
+        self.fast_model = EchoModelRunner("fast", latency=0.01)
+        self.slow_model = EchoModelRunner("slow", latency=0.3)
+        self.mock_model_cluster.models_run = ModelRegistry()
+        self.mock_model_cluster.models_run.update({"fast": self.fast_model, "slow": self.slow_model})
+
+        self.concurrent_runner = DynamicSubclassModelConcurrentRunner(10, "crunch", "localhost", 1234, "base.Class")
+
+    async def test_cycles_overlap_within_the_window(self):
+        pipeline = self.concurrent_runner.pipeline(window=2)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        cycles = [pipeline.submit("predict", ([cycle], [])) for cycle in range(2)]
+        await asyncio.sleep(0.05)  # the fast model is done with both, the slow one is not
+        cycles.append(pipeline.submit("predict", ([2], [])))
+        self.assertEqual([0, 1, 2], cycles)
+        self.assertEqual(2, pipeline.in_flight[self.slow_model])
+
+        results = [results async for results in pipeline.results()]
+        self.assertLess(loop.time() - started, 0.5)  # the slow model's calls overlap
+        self.assertEqual([0, 1, 2], [cycle_results.cycle for cycle_results in results])
+        self.assertEqual([[0], [1], [2]], self.fast_model.received)
+        self.assertEqual([[0], [1]], self.slow_model.received)  # sent in cycle order
+        self.assertEqual([0, 1], self.slow_model.sequences)
+
+        self.assertEqual(1, results[1][self.slow_model].result[0])
+        self.assertEqual(ModelPredictResult.Status.SKIPPED, results[2][self.slow_model].status)
+        self.assertEqual(ModelPredictResult.Status.SUCCESS, results[2][self.fast_model].status)
+        self.assertEqual(1, pipeline.stats.skipped)
+        self.assertEqual(2, pipeline.stats.max_in_flight)
+        self.assertEqual(0, len(pipeline.in_flight))
+
+    async def test_result_of_one_cycle(self):
+        pipeline = self.concurrent_runner.pipeline(window=1)
+        first = pipeline.submit("predict", model_runs=[self.fast_model])
+        second = pipeline.submit("predict", model_runs=[self.fast_model])
+
+        results = await pipeline.result(second)
+        self.assertEqual(second, results.cycle)
+        self.assertEqual(ModelPredictResult.Status.SKIPPED, results[self.fast_model].status)
+        self.assertEqual([first], pipeline.pending)
+        with self.assertRaises(KeyError):
+            await pipeline.result(second)
+
+        await pipeline.result(first)
+        self.assertEqual([], pipeline.pending)
+
+    async def test_close_cancels_cycles_in_flight(self):
+        pipeline = self.concurrent_runner.pipeline()
+        pipeline.submit("predict")
+        await asyncio.sleep(0.05)
+        await pipeline.close()
+
+        await asyncio.sleep(0)
+        self.assertEqual([], pipeline.pending)
+        self.assertEqual(0, len(pipeline.in_flight))
+
+    async def test_raised_call_reported_as_failed(self):
+        execute = self.concurrent_runner._execute_model_method_with_timeout
+
+        def broken_for_fast_model(model, *args, **kwargs):
+            if model is self.fast_model:
+                raise RuntimeError("broken")
+            return execute(model, *args, **kwargs)
+
+        pipeline = self.concurrent_runner.pipeline()
+        with patch.object(self.concurrent_runner, "_execute_model_method_with_timeout", side_effect=broken_for_fast_model):
+            results = await pipeline.result(pipeline.submit("predict"))
+
+        self.assertEqual(ModelPredictResult.Status.FAILED, results[self.fast_model].status)
+        self.assertEqual(ModelPredictResult.Status.SUCCESS, results[self.slow_model].status)
+
+    async def test_recorder_cycles_and_cached_results(self):
+        call_recorder = MagicMock()
+        concurrent_runner = DynamicSubclassModelConcurrentRunner(
+            10, "crunch", "localhost", 1234, "base.Class", call_recorder=call_recorder, cached_methods={"describe": CachePolicy()},
+        )
+        pipeline = concurrent_runner.pipeline()
+
+        first = await pipeline.result(pipeline.submit("describe", model_runs=[self.fast_model]))
+        second = await pipeline.result(pipeline.submit("describe", model_runs=[self.fast_model]))
+
+        self.assertEqual(ModelPredictResult.Status.SUCCESS, first[self.fast_model].status)
+        self.assertEqual(ModelPredictResult.Status.CACHED, second[self.fast_model].status)
+        self.assertEqual([[]], self.fast_model.received)
+        self.assertEqual(2, call_recorder.next_cycle.call_count)
+
+    def test_window_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            CallPipeline(self.concurrent_runner, window=0)
+
+
+class TestCallPipelineDelivery(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = FakeModelServer(FakeModelBehavior(latency_ms=5, latency_jitter=1.0), seed=0)
+        self.orchestrator = FakeOrchestrator()
+        orchestrator_port = await self.orchestrator.start()
+        self.orchestrator.add_model("model_1", "127.0.0.1", await self.server.start())
+
+        self.runner = DynamicSubclassModelConcurrentRunner(
+            1, "crunch_id", "127.0.0.1", orchestrator_port, base_classname="test.Model",
+            channel_pool_size=4, channel_routing=ChannelPool.Routing.ROUND_ROBIN,
+        )
+        await self.runner.init()
+
+    async def asyncTearDown(self):
+        await self.runner.close()
+        await self.orchestrator.stop()
+        await self.server.stop()
+
+    async def test_calls_reach_the_model_in_cycle_order(self):
+        pipeline = self.runner.pipeline(window=20)
+        for _ in range(20):
+            pipeline.submit("predict")
+        results = [results async for results in pipeline.results()]
+
+        self.assertEqual(
+            [ModelPredictResult.Status.SUCCESS] * 20,
+            [status for cycle_results in results for status in (result.status for result in cycle_results.values())],
+        )
+        self.assertEqual(list(range(20)), self.server.servicer.sequences)
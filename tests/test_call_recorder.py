@@ -0,0 +1,109 @@
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from model_runner_client.grpc.generated.commons_pb2 import Argument, Status, Variant, VariantType
+from model_runner_client.grpc.generated.dynamic_subclass_pb2 import CallRequest, CallResponse
+from model_runner_client.model_concurrent_runners import DynamicSubclassModelConcurrentRunner, ModelPredictResult
+from model_runner_client.testing import FakeModelBehavior, FakeModelServer, FakeOrchestrator, ReplayCluster
+from model_runner_client.utils.call_recorder import CallRecorder, CallRecordReader, Outcome
+
+
+def temporary_path(test_case) -> str:
+    directory = tempfile.TemporaryDirectory()
+    test_case.addCleanup(directory.cleanup)
+    return os.path.join(directory.name, "calls.rec")
+
+
+class TestCallRecorder(TestCase):
+    def test_round_trip(self):
+        path = temporary_path(self)
+        request = CallRequest(methodName="predict", methodArguments=[Argument(position=1, data=Variant(type=VariantType.STRING, value=b"x"))])
+        response = CallResponse(status=Status(code="SUCCESS"), methodResponse=Variant(type=VariantType.STRING, value=b"y"))
+
+        with CallRecorder(path) as recorder:
+            recorder.next_cycle()
+            recorder.record("model_1", request, 1000.0, 0.005, Outcome.RESPONSE, response.SerializeToString())
+            recorder.next_cycle()
+            recorder.record("model_2", request, 1001.0, 1.0, Outcome.RPC_ERROR, b"DEADLINE_EXCEEDED")
+        with open(path, "ab") as file:
+            file.write(b"\x50\x00\x00\x00truncated")
+
+        with CallRecordReader(path) as reader:
+            calls = [(call.cycle, call.model_id, call.latency, call.request, call.response, call.error_code) for call in reader]
+
+        self.assertEqual([
+            (1, "model_1", 0.005, request, response, None),
+            (2, "model_2", 1.0, request, None, "DEADLINE_EXCEEDED"),
+        ], calls)
+
+    def test_frames_written_per_cycle(self):
+        path = temporary_path(self)
+        request = CallRequest(methodName="predict")
+
+        with CallRecorder(path) as recorder:
+            recorder.next_cycle()
+            recorder.record_response("model_1", request, 1000.0, None)
+            recorder.flush()
+            written = os.path.getsize(path)
+            recorder.record_response("model_2", request, 1000.0, CallResponse(status=Status(code="SUCCESS")))
+            self.assertEqual(written, os.path.getsize(path))  # buffered until the next cycle
+            recorder.next_cycle()
+            recorder.flush()
+            self.assertGreater(os.path.getsize(path), written)
+
+        with CallRecordReader(path) as reader:
+            calls = [(call.model_id, call.outcome, call.response) for call in reader]
+
+        self.assertEqual([
+            ("model_1", Outcome.NO_RESPONSE, None),
+            ("model_2", Outcome.RESPONSE, CallResponse(status=Status(code="SUCCESS"))),
+        ], calls)
+
+    def test_not_a_recording(self):
+        path = temporary_path(self)
+        with open(path, "wb") as file:
+            file.write(b"something else")
+
+        with self.assertRaises(ValueError):
+            CallRecordReader(path)
+
+
+class TestReplay(IsolatedAsyncioTestCase):
+    async def run_cycles(self, orchestrator_port: int, cycles: int, **kwargs) -> list[dict]:
+        runner = DynamicSubclassModelConcurrentRunner(0.5, "crunch_id", "127.0.0.1", orchestrator_port, base_classname="test.Model", **kwargs)
+        try:
+            await runner.init()
+            arguments = ([Argument(position=1, data=Variant(type=VariantType.STRING, value=b"payload"))], [])
+            return [
+                {model_runner.model_id: (result.status, result.result) for model_runner, result in (await runner.call("predict", arguments)).items()}
+                for _ in range(cycles)
+            ]
+        finally:
+            await runner.close()
+
+    async def test_record_then_replay(self):
+        path = temporary_path(self)
+        servers = [FakeModelServer(FakeModelBehavior(response_bytes=3)), FakeModelServer(FakeModelBehavior(failure_rate=1.0))]
+        orchestrator = FakeOrchestrator()
+        for index, server in enumerate(servers):
+            orchestrator.add_model(f"model_{index}", "127.0.0.1", await server.start())
+        try:
+            with CallRecorder(path) as recorder:
+                recorded = await self.run_cycles(await orchestrator.start(), 2, call_recorder=recorder)
+        finally:
+            await orchestrator.stop()
+            for server in servers:
+                await server.stop()
+
+        with CallRecordReader(path) as reader:
+            self.assertEqual([1, 1, 2, 2], sorted(call.cycle for call in reader))
+            replay = ReplayCluster(reader)
+        try:
+            replayed = await self.run_cycles(await replay.start(), 2)
+        finally:
+            await replay.stop()
+
+        self.assertEqual(recorded, replayed)
+        self.assertEqual((ModelPredictResult.Status.SUCCESS, "xxx"), replayed[0]["model_0"])
+        self.assertEqual(ModelPredictResult.Status.FAILED, replayed[1]["model_1"][0])
@@ -0,0 +1,61 @@
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+import grpc
+
+from model_runner_client.model_runners.channel_pool import ChannelPool
+
+
+class TestChannelPool(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.channels = [MagicMock(close=AsyncMock()) for _ in range(3)]
+        self.pool = ChannelPool(self.channels, large_payload_threshold=1000)
+
+    def test_size_class_routing(self):
+        self.assertEqual(0, self.pool.select(10))
+        self.assertIn(self.pool.select(5000), {1, 2})
+
+        self.pool.stats[1].in_flight = 2
+        self.assertEqual(2, self.pool.select(5000))
+
+    def test_round_robin_routing(self):
+        pool = ChannelPool(self.channels, routing=ChannelPool.Routing.ROUND_ROBIN)
+
+        self.assertEqual([0, 1, 2, 0], [pool.select() for _ in range(4)])
+
+    async def test_call_updates_stats(self):
+        rpc = AsyncMock(return_value="response")
+
+        response = await self.pool.call(10, rpc, timeout=1)
+
+        self.assertEqual("response", response)
+        rpc.assert_called_once()
+        self.assertEqual(0, rpc.call_args.args[0])
+        self.assertEqual(1, self.pool.stats[0].calls)
+        self.assertEqual(10, self.pool.stats[0].bytes_sent)
+        self.assertEqual(0, self.pool.stats[0].in_flight)
+
+    async def test_call_retries_unavailable_on_other_channel(self):
+        rpc = AsyncMock(side_effect=[grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, None, None), "response"])
+
+        response = await self.pool.call(10, rpc, timeout=1)
+
+        self.assertEqual("response", response)
+        self.assertEqual(2, rpc.call_count)
+        self.assertNotEqual(rpc.call_args_list[0].args[0], rpc.call_args_list[1].args[0])
+        self.assertEqual(1, self.pool.stats[0].unavailable)
+
+    async def test_call_does_not_retry_other_errors(self):
+        rpc = AsyncMock(side_effect=grpc.aio.AioRpcError(grpc.StatusCode.INTERNAL, None, None))
+
+        with self.assertRaises(grpc.aio.AioRpcError):
+            await self.pool.call(10, rpc, timeout=1)
+
+        self.assertEqual(1, rpc.call_count)
+        self.assertEqual(1, self.pool.stats[0].failures)
+
+    async def test_close(self):
+        await self.pool.close()
+
+        for channel in self.channels:
+            channel.close.assert_awaited_once()
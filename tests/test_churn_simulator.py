@@ -0,0 +1,29 @@
+from unittest import IsolatedAsyncioTestCase
+
+from model_runner_client.testing.churn_simulator import ChurnSimulator, simulate
+
+
+class TestChurnSimulator(IsolatedAsyncioTestCase):
+    async def test_flapping_coalesced(self):
+        report = await simulate("flapping", models=10, rate=2000, flaps=2, settle_timeout=10)
+
+        self.assertTrue(report.converged)
+        self.assertEqual(40, report.events)
+        self.assertGreater(report.coalescer["coalesced"], 0)
+        self.assertEqual(0, report.wasted_inits)
+
+    async def test_rolling_ip_converges(self):
+        report = await simulate("rolling_ip", models=10, rate=2000, endpoints=2, settle_timeout=10)
+
+        self.assertTrue(report.converged)
+        self.assertEqual(10, report.inits)
+        self.assertLessEqual(report.peak_open_channels, 2 * 10 * 2)
+
+    async def test_mass_init_reconnects(self):
+        report = await simulate("mass_init", models=8, endpoints=2, settle_timeout=10)
+
+        self.assertTrue(report.converged)
+        self.assertEqual(2, report.inits)  # only the models that moved are reconnected
+
+    async def test_stop_without_start(self):
+        await ChurnSimulator().stop()
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import numpy
+
+from model_runner_client.grpc.generated.commons_pb2 import VariantType
+from model_runner_client.utils.datatype_transformer import decode_data, detect_data_type, encode_data
+
+
+class TestNdarray(TestCase):
+    def round_trip(self, array):
+        return decode_data(encode_data(VariantType.NDARRAY, array), VariantType.NDARRAY)
+
+    def test_round_trip(self):
+        for array in [
+            numpy.arange(12, dtype=numpy.float32).reshape(3, 4),
+            numpy.arange(6, dtype=">i4").reshape(2, 3).T,  # big-endian and not contiguous
+            numpy.array(3.5),
+            numpy.zeros((0, 3)),
+            numpy.array([True, False]),
+            numpy.array(["ab", "c"]),
+        ]:
+            decoded = self.round_trip(array)
+            self.assertEqual(array.shape, decoded.shape)
+            self.assertEqual(array.dtype.newbyteorder("<"), decoded.dtype)
+            numpy.testing.assert_array_equal(array, decoded)
+
+    def test_decoded_array_is_a_view(self):
+        encoded = encode_data(VariantType.NDARRAY, numpy.arange(4, dtype=numpy.int64))
+        decoded = decode_data(encoded, VariantType.NDARRAY)
+
+        self.assertFalse(decoded.flags.writeable)
+        self.assertTrue(decoded.flags.aligned)
+        base = decoded
+        while isinstance(base, numpy.ndarray):
+            base = base.base
+        self.assertIs(encoded, base)  # no copy of the received bytes
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            encode_data(VariantType.NDARRAY, numpy.array([{}, None]))
+        with self.assertRaises(ValueError):
+            decode_data(b"\x03", VariantType.NDARRAY)
+
+
+class TestDetectDataType(TestCase):
+    def test_numpy_and_bytes(self):
+        self.assertEqual(VariantType.NDARRAY, detect_data_type(numpy.zeros(3)))
+        self.assertEqual(VariantType.DOUBLE, detect_data_type(numpy.float32(1.5)))
+        self.assertEqual(VariantType.INT, detect_data_type(numpy.int8(3)))
+        self.assertEqual(VariantType.BYTES, detect_data_type(b"payload"))
+
+        self.assertEqual(3, decode_data(encode_data(VariantType.INT, numpy.int8(3)), VariantType.INT))
+        self.assertEqual(b"payload", decode_data(encode_data(VariantType.BYTES, memoryview(b"payload")), VariantType.BYTES))
@@ -0,0 +1,63 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from model_runner_client.event_coalescer import EventCoalescer
+
+
+class TestEventCoalescer(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.dispatched: list[list[dict]] = []
+        self.coalescer = EventCoalescer(self.dispatched.append, window=0.05)
+
+    async def test_updates_collapsed_within_window(self):
+        self.coalescer.push([{"model_id": "model_1", "state": "RECOVERING"}, {"model_id": "model_2", "state": "RUNNING"}])
+        self.coalescer.push([{"model_id": "model_1", "state": "RUNNING"}])
+        self.assertEqual([], self.dispatched)
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual([[{"model_id": "model_1", "state": "RUNNING", "restarted": True}, {"model_id": "model_2", "state": "RUNNING"}]], self.dispatched)
+        self.assertEqual(3, self.coalescer.stats.received)
+        self.assertEqual(2, self.coalescer.stats.applied)
+        self.assertEqual(1, self.coalescer.stats.coalesced)
+
+    async def test_window_not_extended(self):
+        self.coalescer.push([{"model_id": "model_1", "state": "RUNNING"}])
+        await asyncio.sleep(0.03)
+        self.coalescer.push([{"model_id": "model_2", "state": "RUNNING"}])
+        await asyncio.sleep(0.03)
+
+        self.assertEqual(1, len(self.dispatched))
+        self.assertEqual(2, len(self.dispatched[0]))
+
+    async def test_zero_window_dispatches_immediately(self):
+        self.coalescer.window = 0
+        self.coalescer.push([{"model_id": "model_1", "state": "RECOVERING"}, {"model_id": "model_1", "state": "RUNNING"}])
+
+        self.assertEqual([[{"model_id": "model_1", "state": "RUNNING", "restarted": True}]], self.dispatched)
+
+    async def test_stopped_not_delayed(self):
+        self.coalescer.push([{"model_id": "model_1", "state": "RUNNING"}, {"model_id": "model_2", "state": "RUNNING"}])
+        self.coalescer.push([{"model_id": "model_1", "state": "STOPPED"}])
+
+        self.assertEqual([[{"model_id": "model_1", "state": "STOPPED"}]], self.dispatched)
+        self.assertEqual(1, len(self.coalescer))
+
+    async def test_superseded_stop_marks_restart(self):
+        self.coalescer.push([{"model_id": "model_1", "state": "RECOVERING"}, {"model_id": "model_2", "state": "RUNNING"}])
+        self.coalescer.push([{"model_id": "model_1", "state": "RUNNING"}, {"model_id": "model_2", "state": "RUNNING"}])
+        self.coalescer.push([{"model_id": "model_1", "state": "RUNNING"}])
+        self.coalescer.flush()
+
+        self.assertEqual(
+            [[{"model_id": "model_1", "state": "RUNNING", "restarted": True}, {"model_id": "model_2", "state": "RUNNING"}]],
+            self.dispatched,
+        )
+
+    async def test_discard(self):
+        self.coalescer.push([{"model_id": "model_1", "state": "RUNNING"}])
+        self.coalescer.discard()
+        await asyncio.sleep(0.1)
+
+        self.assertEqual([], self.dispatched)
+        self.assertEqual(0, len(self.coalescer))
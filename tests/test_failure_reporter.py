@@ -0,0 +1,47 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from model_runner_client.failure_reporter import FailureReportBatcher
+
+
+class TestFailureReportBatcher(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.send_message = AsyncMock()
+        self.batcher = FailureReportBatcher(self.send_message, window=0.05)
+
+    def sent_messages(self) -> list[dict]:
+        return [json.loads(call.args[0]) for call in self.send_message.call_args_list]
+
+    async def test_reports_merged_and_deduplicated(self):
+        self.batcher.report("model_1", "MULTIPLE_TIMEOUT", ip="127.0.0.1")
+        self.batcher.report("model_2", "MULTIPLE_TIMEOUT", ip="127.0.0.2")
+        self.batcher.report("model_1", "MULTIPLE_FAILED", ip="127.0.0.1")
+        self.send_message.assert_not_called()
+
+        await asyncio.sleep(0.1)
+
+        messages = self.sent_messages()
+        self.assertEqual(1, len(messages))
+        self.assertEqual("report_failure", messages[0]["event"])
+        self.assertEqual(["model_1", "model_2"], [report["model_id"] for report in messages[0]["data"]])
+        self.assertEqual("MULTIPLE_TIMEOUT", messages[0]["data"][0]["failure_code"])
+        self.assertEqual(1, self.batcher.deduplicated)
+
+    async def test_full_batch_sent_immediately(self):
+        self.batcher.max_batch_size = 2
+        self.batcher.report("model_1", "MULTIPLE_TIMEOUT")
+        self.batcher.report("model_2", "MULTIPLE_TIMEOUT")
+        await asyncio.sleep(0)
+
+        self.assertEqual(1, len(self.sent_messages()))
+
+    async def test_close_flushes(self):
+        self.batcher.window = 60
+        self.batcher.report("model_1", "CONNECTION_FAILED", "refused")
+        await self.batcher.close()
+
+        self.assertEqual("refused", self.sent_messages()[0]["data"][0]["failure_reason"])
+        self.assertEqual(0, len(self.batcher))
+
@@ -0,0 +1,46 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from model_runner_client.grpc.generated.commons_pb2 import Argument, Variant, VariantType
+from model_runner_client.model_concurrent_runners import DynamicSubclassModelConcurrentRunner, ModelPredictResult
+from model_runner_client.testing import FakeModelBehavior, FakeModelServer, FakeOrchestrator
+
+
+class TestFakeServers(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.servers = [
+            FakeModelServer(FakeModelBehavior(latency_ms=1, setup_latency_ms=50)),
+            FakeModelServer(FakeModelBehavior(failure_rate=1.0)),
+            FakeModelServer(FakeModelBehavior(timeout_rate=1.0, hang_seconds=1)),
+            FakeModelServer(FakeModelBehavior(bad_implementation=True)),
+        ]
+        self.orchestrator = FakeOrchestrator(init_page_size=3)
+        orchestrator_port = await self.orchestrator.start()
+        for index, server in enumerate(self.servers):
+            self.orchestrator.add_model(f"model_{index}", "127.0.0.1", await server.start())
+
+        self.runner = DynamicSubclassModelConcurrentRunner(0.2, "crunch_id", "127.0.0.1", orchestrator_port, base_classname="test.Model")
+
+    async def asyncTearDown(self):
+        await self.runner.close()
+        await self.orchestrator.stop()
+        for server in self.servers:
+            await server.stop()
+
+    async def test_fan_out(self):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await self.runner.init()
+        self.assertGreaterEqual(loop.time() - started, 0.05)  # Setup latency of model_0
+        self.assertEqual({"model_0", "model_1", "model_2"}, set(self.runner.model_cluster.models_run))
+
+        results = await self.runner.call("predict", ([Argument(position=1, data=Variant(type=VariantType.STRING, value=b"payload"))], []))
+        statuses = {model_runner.model_id: result.status for model_runner, result in results.items()}
+
+        self.assertEqual(ModelPredictResult.Status.SUCCESS, statuses["model_0"])
+        self.assertEqual(ModelPredictResult.Status.FAILED, statuses["model_1"])
+        self.assertEqual(ModelPredictResult.Status.TIMEOUT, statuses["model_2"])
+        self.assertEqual(1, self.servers[0].servicer.calls)
+
+        await asyncio.sleep(0.2)  # failure reports are batched
+        self.assertEqual([("model_3", "BAD_IMPLEMENTATION")], [(report["model_id"], report["failure_code"]) for report in self.orchestrator.failure_reports])
@@ -0,0 +1,99 @@
+import base64
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from model_runner_client.security.gateway_auth_interceptor import (AUTH_MESSAGE_KEY, AUTH_SIGNATURE_KEY,
+                                                                   GatewayAuthClientInterceptor, GatewayTokenCache,
+                                                                   _build_auth_metadata)
+
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class TestGatewayTokenCache(TestCase):
+    def setUp(self):
+        self.cache = GatewayTokenCache(PRIVATE_KEY, bucket_seconds=10)
+
+    def tearDown(self):
+        self.cache.unregister("model_1")
+
+    def assertValidToken(self, metadata, model_id):
+        metadata = dict(metadata)
+        payload = base64.b64decode(metadata[AUTH_MESSAGE_KEY])
+        signature = base64.b64decode(metadata[AUTH_SIGNATURE_KEY])
+        PRIVATE_KEY.public_key().verify(signature, payload, padding.PKCS1v15(), hashes.SHA256())
+        self.assertEqual(model_id, json.loads(payload)["model_id"])
+
+    def test_token_reused_within_bucket(self):
+        self.cache.register("model_1")
+
+        first = self.cache.get("model_1")
+        second = self.cache.get("model_1")
+
+        self.assertIs(first, second)
+        self.assertEqual(1, self.cache.inline_signatures)
+        self.assertValidToken(first, "model_1")
+
+    def test_token_renewed_after_bucket(self):
+        self.cache.register("model_1")
+
+        with patch("model_runner_client.security.gateway_auth_interceptor.time.time", return_value=1000):
+            first = self.cache.get("model_1")
+        with patch("model_runner_client.security.gateway_auth_interceptor.time.time", return_value=1010):
+            second = self.cache.get("model_1")
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(2, self.cache.inline_signatures)
+
+    def test_refresh_signs_registered_models(self):
+        self.cache.register("model_1")
+        self.cache.register("model_2")
+
+        with patch("model_runner_client.security.gateway_auth_interceptor.time.time", return_value=1000):
+            self.cache.refresh()
+        with patch("model_runner_client.security.gateway_auth_interceptor.time.time", return_value=1004):
+            self.cache.refresh()  # not old enough yet
+        with patch("model_runner_client.security.gateway_auth_interceptor.time.time", return_value=1005):
+            self.cache.refresh()
+            metadata = self.cache.get("model_2")
+
+        self.assertEqual(4, self.cache.background_signatures)
+        self.assertEqual(0, self.cache.inline_signatures)
+        self.assertValidToken(metadata, "model_2")
+        self.cache.unregister("model_2")
+
+    def test_unregister_stops_worker(self):
+        self.cache.register("model_1")
+        self.cache.register("model_1")
+        self.cache.get("model_1")
+
+        self.cache.unregister("model_1")
+        self.assertIsNotNone(self.cache._worker)
+
+        self.cache.unregister("model_1")
+        self.assertIsNone(self.cache._worker)
+        self.assertNotIn("model_1", self.cache._tokens)
+
+    def test_refresh_racing_unregister(self):
+        self.cache.register("model_1")
+        build = _build_auth_metadata
+
+        def unregister_while_signing(*args):
+            self.cache.unregister("model_1")  # the worker signs outside the lock
+            return build(*args)
+
+        with patch("model_runner_client.security.gateway_auth_interceptor._build_auth_metadata", side_effect=unregister_while_signing):
+            self.cache.refresh()
+
+        self.assertNotIn("model_1", self.cache._tokens)
+        self.assertEqual(0, self.cache.background_signatures)
+
+    def test_interceptor_uses_cache(self):
+        self.cache.register("model_1")
+        interceptor = GatewayAuthClientInterceptor(PRIVATE_KEY, "model_1", token_cache=self.cache)
+
+        self.assertIs(interceptor._build_auth_metadata(), interceptor._build_auth_metadata())
+        self.assertValidToken(GatewayAuthClientInterceptor(PRIVATE_KEY, "model_1")._build_auth_metadata(), "model_1")
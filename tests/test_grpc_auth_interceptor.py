@@ -0,0 +1,102 @@
+import asyncio
+import base64
+import json
+import time
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+import base58
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from model_runner_client.security.crypto_executor import CryptoExecutor
+from model_runner_client.security.grpc_auth_interceptor import WalletTlsAuthClientInterceptor
+from model_runner_client.security.wallet_gelegation import AuthError, verify_wallet_delegation
+
+WALLET_KEY = ed25519.Ed25519PrivateKey.generate()
+WALLET_PUB_B58 = base58.b58encode(WALLET_KEY.public_key().public_bytes_raw()).decode()
+TLS_PUB = b"tls-public-key"
+
+
+def delegation_metadata(expires_at=None, model_id="model_1", signature=None):
+    payload = {"cert_pub": base64.b64encode(TLS_PUB).decode(), "model_id": model_id, "hotkey": "hotkey_1"}
+    if expires_at is not None:
+        payload["expires_at"] = expires_at
+    message = json.dumps(payload).encode()
+    return [
+        (WalletTlsAuthClientInterceptor.MESSAGE_KEY, base64.b64encode(message).decode()),
+        (WalletTlsAuthClientInterceptor.SIGNATURE_KEY, base64.b64encode(signature or WALLET_KEY.sign(message)).decode()),
+        (WalletTlsAuthClientInterceptor.WALLET_KEY, WALLET_PUB_B58),
+    ]
+
+
+class TestWalletTlsAuthClientInterceptor(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.interceptor = WalletTlsAuthClientInterceptor(
+            expected_wallet_pub_b58=WALLET_PUB_B58,
+            expected_hotkey="hotkey_1",
+            expected_model_id="model_1",
+            tls_pub=TLS_PUB,
+        )
+        patcher = patch("model_runner_client.security.grpc_auth_interceptor.verify_wallet_delegation", wraps=verify_wallet_delegation)
+        self.mock_verify = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_verified_delegation_cached(self):
+        metadata = delegation_metadata(expires_at=int(time.time()) + 3600)
+
+        for _ in range(3):
+            await self.interceptor._verify_from_call_headers("/method", metadata)
+
+        self.assertEqual(1, self.mock_verify.call_count)
+        self.assertEqual(1, self.interceptor.stats.verifications)
+        self.assertEqual(2, self.interceptor.stats.cache_hits)
+
+    async def test_changed_delegation_verified_again(self):
+        await self.interceptor._verify_from_call_headers("/method", delegation_metadata())
+        await self.interceptor._verify_from_call_headers("/method", delegation_metadata(expires_at=int(time.time()) + 3600))
+
+        self.assertEqual(2, self.mock_verify.call_count)
+
+    async def test_expired_delegation_verified_again(self):
+        metadata = delegation_metadata(expires_at=int(time.time()) + 3600)
+        await self.interceptor._verify_from_call_headers("/method", metadata)
+
+        with patch("model_runner_client.security.grpc_auth_interceptor.time.time", return_value=time.time() + 7200):
+            await self.interceptor._verify_from_call_headers("/method", metadata)
+
+        self.assertEqual(2, self.mock_verify.call_count)
+        self.assertEqual(1, self.interceptor.stats.expired)
+
+    async def test_invalid_delegation_not_cached(self):
+        metadata = delegation_metadata(signature=b"\0" * 64)
+
+        for _ in range(2):
+            with self.assertRaises(AuthError):
+                await self.interceptor._verify_from_call_headers("/method", metadata)
+
+        self.assertEqual(2, self.mock_verify.call_count)
+        self.assertEqual(2, self.interceptor.stats.failures)
+        self.assertEqual(0, self.interceptor.stats.cache_hits)
+
+    async def test_offloaded_verifications_batched(self):
+        executor = CryptoExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        interceptors = [
+            WalletTlsAuthClientInterceptor(
+                expected_wallet_pub_b58=WALLET_PUB_B58,
+                expected_hotkey="hotkey_1",
+                expected_model_id="model_1",
+                tls_pub=TLS_PUB,
+                crypto_executor=executor,
+            )
+            for _ in range(3)
+        ]
+
+        await asyncio.gather(*(interceptor._verify_from_call_headers("/method", delegation_metadata()) for interceptor in interceptors))
+        with self.assertRaises(AuthError):
+            await interceptors[0]._verify_from_call_headers("/method", delegation_metadata(model_id="model_2"))
+
+        self.assertEqual(2, executor.batches)
+        self.assertEqual(3, executor.jobs)  # the first batch of 3 is split over the 2 workers
+        self.assertEqual(4, executor.batched_verifications)
+        self.assertEqual(1, interceptors[0].stats.failures)
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from unittest import IsolatedAsyncioTestCase
+
+from model_runner_client.utils.loop_monitor import LoopMonitor
+
+
+def block_loop(seconds: float):
+    time.sleep(seconds)
+
+
+class TestLoopMonitor(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.monitor = LoopMonitor(interval=0.01, slow_callback_threshold=0.05)
+        self.monitor.start()
+
+    async def asyncTearDown(self):
+        await self.monitor.stop()
+
+    async def test_lag_measured(self):
+        await asyncio.sleep(0.05)
+        self.assertGreater(self.monitor.stats.samples, 0)
+
+        block_loop(0.03)
+        await asyncio.sleep(0.03)
+        self.assertGreaterEqual(self.monitor.stats.max_lag_ms, 15)
+
+    async def test_slow_callback_reported(self):
+        async def slow_coroutine():
+            block_loop(0.2)
+
+        await asyncio.sleep(0.02)
+        await asyncio.create_task(slow_coroutine(), name="call:model_1")
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, self.monitor.stats.slow_callbacks)
+        slow_callback = self.monitor.stats.recent_slow_callbacks[-1]
+        self.assertEqual("call:model_1", slow_callback.task)
+        self.assertIn("slow_coroutine", slow_callback.coroutine)
+        self.assertIn("block_loop", slow_callback.location)
+
+    async def test_tasks_counted_by_category(self):
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(gate.wait(), name=f"call:model_{index}") for index in range(3)]
+        tasks.append(asyncio.create_task(gate.wait(), name="reconnect:model_1"))
+
+        counts = self.monitor.count_tasks()
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(3, counts["call"])
+        self.assertEqual(1, counts["reconnect"])
+        self.assertEqual(1, counts["loop-monitor"])
+        self.assertIn("call=3", self.monitor.summary())
@@ -0,0 +1,63 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from model_runner_client.model_actors import ModelActors
+
+
+class TestModelActors(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.actors = ModelActors()
+        self.processed: list[tuple[str, int]] = []
+
+    async def asyncTearDown(self):
+        await self.actors.close()
+
+    def job(self, model_id: str, version: int, gate: asyncio.Event | None = None):
+        async def run():
+            if gate:
+                await gate.wait()
+            self.processed.append((model_id, version))
+
+        return run
+
+    async def test_models_processed_concurrently(self):
+        gate = asyncio.Event()
+        self.actors.submit("slow", self.job("slow", 1, gate))
+        self.actors.submit("fast", self.job("fast", 1))
+
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertEqual([("fast", 1)], self.processed)
+        self.assertTrue(self.actors.is_busy("slow"))
+
+        gate.set()
+        await self.actors.join()
+        self.assertEqual([("fast", 1), ("slow", 1)], self.processed)
+        self.assertEqual(0, len(self.actors))
+
+    async def test_pending_job_superseded(self):
+        gate = asyncio.Event()
+        self.actors.submit("model_1", self.job("model_1", 1, gate))
+        await asyncio.sleep(0)  # version 1 is running
+
+        self.actors.submit("model_1", self.job("model_1", 2))
+        self.actors.submit("model_1", self.job("model_1", 3))
+        gate.set()
+        await self.actors.join()
+
+        self.assertEqual([("model_1", 1), ("model_1", 3)], self.processed)
+        self.assertEqual(1, self.actors.superseded)
+
+    async def test_failing_job_does_not_stop_actor(self):
+        async def failing():
+            raise RuntimeError("boom")
+
+        self.actors.submit("model_1", failing)
+        await asyncio.sleep(0)
+        self.actors.submit("model_1", self.job("model_1", 2))
+        await self.actors.join()
+
+        self.assertEqual([("model_1", 2)], self.processed)
+
+    async def test_join_without_work(self):
+        await asyncio.wait_for(self.actors.join(), timeout=1)
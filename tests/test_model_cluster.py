@@ -0,0 +1,165 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from model_runner_client.model_cluster import ModelCluster
+from model_runner_client.model_runners import ModelRunner
+
+
+def model_update(model_id, ip="127.0.0.1", port=5000, state="RUNNING", deployment_id="deployment_id_1"):
+    return {
+        "deployment_id": deployment_id,
+        "model_id": model_id,
+        "state": state,
+        "ip": ip,
+        "port": port,
+        "infos": {"model_name": f"{model_id}_name"},
+    }
+
+
+class TestModelCluster(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.init_gate = asyncio.Event()
+        self.init_gate.set()
+        self.created_runners: list[ModelRunner] = []
+
+        self.cluster = ModelCluster("crunch_id", "localhost", 9091, self.create_model_runner)
+        self.cluster.ws_client = MagicMock(send_message=AsyncMock())
+
+    def create_model_runner(self, **kwargs) -> ModelRunner:
+        model_runner = ModelRunner(**kwargs)
+
+        async def init(admission=None):
+            await self.init_gate.wait()
+            if model_runner.closed:
+                return False, ModelRunner.ErrorType.ABORTED
+            return True, None
+
+        model_runner.init = AsyncMock(side_effect=init)
+        self.created_runners.append(model_runner)
+        return model_runner
+
+    async def test_ip_change_removes_runner_during_init(self):
+        await self.cluster.update_model_runs([model_update("model_1")])
+        self.init_gate.clear()
+
+        task = asyncio.create_task(self.cluster.update_model_runs([model_update("model_1", ip="127.0.0.2")]))
+        await asyncio.sleep(0.01)
+        self.assertNotIn("model_1", self.cluster.models_run)
+
+        self.init_gate.set()
+        await task
+        self.assertEqual("127.0.0.2", self.cluster.models_run["model_1"].ip)
+
+    async def test_make_before_break_keeps_serving(self):
+        self.cluster.make_before_break = True
+        await self.cluster.update_model_runs([model_update("model_1")])
+        old_runner = self.cluster.models_run["model_1"]
+        self.init_gate.clear()
+
+        task = asyncio.create_task(self.cluster.update_model_runs([model_update("model_1", ip="127.0.0.2")]))
+        await asyncio.sleep(0.01)
+        self.assertIs(old_runner, self.cluster.models_run["model_1"])
+        self.assertIn("model_1", self.cluster.pending_model_runs)
+
+        self.init_gate.set()
+        await task
+        self.assertEqual("127.0.0.2", self.cluster.models_run["model_1"].ip)
+        self.assertTrue(old_runner.closed)
+        self.assertNotIn("model_1", self.cluster.pending_model_runs)
+
+    async def test_make_before_break_stop_during_replacement(self):
+        self.cluster.make_before_break = True
+        await self.cluster.update_model_runs([model_update("model_1")])
+        old_runner = self.cluster.models_run["model_1"]
+        self.init_gate.clear()
+
+        task = asyncio.create_task(self.cluster.update_model_runs([model_update("model_1", ip="127.0.0.2")]))
+        await asyncio.sleep(0.01)
+        await self.cluster.update_model_runs([model_update("model_1", ip="127.0.0.2", state="STOPPED")])
+        self.init_gate.set()
+        await task
+
+        self.assertNotIn("model_1", self.cluster.models_run)
+        self.assertNotIn("model_1", self.cluster.pending_model_runs)
+        self.assertTrue(old_runner.closed)
+        self.assertTrue(self.created_runners[-1].closed)
+
+    async def test_make_before_break_reconnect(self):
+        self.cluster.make_before_break = True
+        await self.cluster.update_model_runs([model_update("model_1")])
+        old_runner = self.cluster.models_run["model_1"]
+        old_runner.healthy = False
+        self.init_gate.clear()
+
+        task = asyncio.create_task(self.cluster.reconnect_model_runner(old_runner))
+        await asyncio.sleep(0.01)
+        # a second reconnect is ignored while the replacement initializes
+        await self.cluster.reconnect_model_runner(old_runner)
+        self.assertIs(old_runner, self.cluster.models_run["model_1"])
+        self.assertEqual(2, len(self.created_runners))
+
+        self.init_gate.set()
+        await task
+        self.assertIsNot(old_runner, self.cluster.models_run["model_1"])
+        self.assertTrue(self.cluster.models_run["model_1"].healthy)
+        self.assertTrue(old_runner.closed)
+
+    async def test_update_burst_coalesced(self):
+        await self.cluster.update_model_runs([model_update("model_1")])
+        running_runner = self.cluster.models_run["model_1"]
+
+        for state in ("RECOVERING", "RUNNING", "STOPPED", "RUNNING"):
+            await self.cluster.handle_update_event([model_update("model_1", state=state)])
+        self.cluster.event_coalescer.flush()
+        await self.cluster.model_actors.join()
+
+        # the model restarted on the same IP/port, it gets a fresh runner (and Setup)
+        self.assertIsNot(running_runner, self.cluster.models_run["model_1"])
+        self.assertTrue(running_runner.closed)
+        self.assertEqual(2, len(self.created_runners))
+        self.assertEqual(2, self.cluster.event_coalescer.stats.coalesced)  # STOPPED is forwarded right away
+
+    async def test_recovery_burst_reconnects(self):
+        await self.cluster.update_model_runs([model_update("model_1")])
+        running_runner = self.cluster.models_run["model_1"]
+
+        await self.cluster.handle_update_event([model_update("model_1", state="RECOVERING")])
+        await self.cluster.handle_update_event([model_update("model_1")])
+        self.cluster.event_coalescer.flush()
+        await self.cluster.model_actors.join()
+
+        self.assertTrue(running_runner.closed)
+        self.assertIs(self.created_runners[-1], self.cluster.models_run["model_1"])
+        self.assertEqual(1, self.cluster.event_coalescer.stats.coalesced)
+
+    async def test_superseded_init_aborted(self):
+        self.init_gate.clear()
+        await self.cluster.handle_update_event([model_update("model_1")])
+        self.cluster.event_coalescer.flush()
+        await asyncio.sleep(0.01)
+        pending_runner = self.cluster.pending_model_runs["model_1"]
+
+        await self.cluster.handle_update_event([model_update("model_1", ip="127.0.0.2")])
+        self.cluster.event_coalescer.flush()
+        await asyncio.sleep(0.01)
+        self.assertTrue(pending_runner.closed)
+        self.assertEqual(1, self.cluster.event_coalescer.stats.cancelled_inits)
+
+        self.init_gate.set()
+        await self.cluster.model_actors.join()
+        self.assertEqual("127.0.0.2", self.cluster.models_run["model_1"].ip)
+        self.cluster.ws_client.send_message.assert_not_called()
+
+    async def test_paged_init_snapshot(self):
+        await self.cluster.update_model_runs([model_update("model_1"), model_update("model_stale")])
+
+        await self.cluster.handle_event("init", [model_update("model_1")], page=0, pages=2)
+        await self.cluster.model_actors.join()
+        self.assertIn("model_stale", self.cluster.models_run)  # not removed before the last page
+
+        await self.cluster.handle_event("init", [model_update("model_2")], page=1, pages=2)
+        await self.cluster.model_actors.join()
+        self.assertEqual({"model_1", "model_2"}, set(self.cluster.models_run))
+        self.assertEqual(2, self.cluster.bootstrap_progress.total)
+        self.assertEqual(1.0, self.cluster.bootstrap_progress.fraction)
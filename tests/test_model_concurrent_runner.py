@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -6,6 +7,7 @@ import grpc
 from grpc_health.v1 import health_pb2
 
 from model_runner_client.model_concurrent_runners import ModelConcurrentRunner, ModelPredictResult
+from model_runner_client.model_registry import ModelRegistry
 from model_runner_client.model_runners import ModelRunner
 
 
@@ -24,10 +26,11 @@ class TestModelConcurrentRunner(IsolatedAsyncioTestCase):
         self.mock_model_cluster_class = self.patcher.start()
 
         self.mock_model_cluster = self.mock_model_cluster_class.return_value
-        self.mock_model_cluster.models_run = {
+        self.mock_model_cluster.models_run = ModelRegistry()
+        self.mock_model_cluster.models_run.update({
             "mock_model_1": self.model_runner_1,
             "mock_model_2": self.model_runner_2,
-        }
+        })
         self.mock_model_cluster.process_failure = AsyncMock()
         self.mock_model_cluster.reconnect_model_runner = AsyncMock()
 
@@ -50,6 +53,43 @@ class TestModelConcurrentRunner(IsolatedAsyncioTestCase):
         self.assertEqual(results[self.model_runner_1].status, ModelPredictResult.Status.SUCCESS)
         self.assertEqual(results[self.model_runner_2].status, ModelPredictResult.Status.SUCCESS)
 
+    async def test_results_carry_snapshot_version(self):
+        models_run = self.mock_model_cluster.models_run
+        snapshot = models_run.snapshot()
+
+        results = await self.concurrent_runner._execute_concurrent_method("test_method")
+        self.assertEqual(snapshot.version, results.snapshot_version)
+        self.assertIs(snapshot, models_run.snapshot())  # reused while nothing changed
+
+        del models_run["mock_model_2"]
+        results = await self.concurrent_runner._execute_concurrent_method("test_method")
+        self.assertEqual(snapshot.version + 1, results.snapshot_version)
+        self.assertEqual([self.model_runner_1], list(results))
+        self.assertEqual(2, len(snapshot))  # previous snapshots are not mutated
+
+    async def test_call_tasks_named_only_when_monitored(self):
+        task_names = []
+        self.model_runner_1.test_method.side_effect = lambda **kwargs: task_names.append(asyncio.current_task().get_name()) or ("mock_result_1", None)
+
+        await self.concurrent_runner._execute_concurrent_method("test_method")
+        self.concurrent_runner.loop_monitor = MagicMock()
+        await self.concurrent_runner._execute_concurrent_method("test_method")
+
+        self.assertFalse(task_names[0].startswith("call:"))
+        self.assertEqual("call:mock_model_1", task_names[1])
+
+    async def test_explicit_models_snapshot_version(self):
+        models_run = self.mock_model_cluster.models_run
+
+        results = await self.concurrent_runner._execute_concurrent_method("test_method", None, [self.model_runner_1])
+        self.assertIsNone(results.snapshot_version)  # the selection may predate the current version
+
+        snapshot = models_run.snapshot()
+        del models_run["mock_model_2"]
+        results = await self.concurrent_runner._execute_concurrent_method("test_method", None, snapshot)
+        self.assertEqual(snapshot.version, results.snapshot_version)
+        self.assertEqual(2, len(results))
+
     
     async def test_execute_concurrent_method_partial_failure(self):
         self.model_runner_2.test_method = AsyncMock(return_value=(None, ModelRunner.ErrorType.FAILED))
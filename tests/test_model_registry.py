@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+from model_runner_client.model_registry import ModelRegistry
+from model_runner_client.model_runners import ModelRunner
+
+
+def model_runner(model_id, ip="127.0.0.1", deployment_id="deployment_id_1", hotkey="hotkey_1"):
+    return ModelRunner(
+        deployment_id=deployment_id,
+        model_id=model_id,
+        model_name=f"{model_id}_name",
+        ip=ip,
+        port=5000,
+        infos={"cruncher_hotkey": hotkey, "tags": ["unhashable"]},
+    )
+
+
+class TestModelRegistry(TestCase):
+    def setUp(self):
+        self.registry = ModelRegistry()
+        for model in (
+            model_runner("model_1"),
+            model_runner("model_2", ip="127.0.0.2"),
+            model_runner("model_3", ip="127.0.0.2", hotkey="hotkey_2"),
+        ):
+            self.registry[model.model_id] = model
+
+    def model_ids(self, selection):
+        return [model.model_id for model in selection]
+
+    def test_select(self):
+        self.assertEqual(["model_1", "model_2", "model_3"], self.model_ids(self.registry.select()))
+        self.assertEqual(["model_2", "model_3"], self.model_ids(self.registry.select(ip="127.0.0.2")))
+        self.assertEqual(["model_2"], self.model_ids(self.registry.select(ip="127.0.0.2", cruncher_hotkey="hotkey_1")))
+        self.assertEqual([], self.model_ids(self.registry.select(deployment_id="deployment_id_2")))
+
+    def test_selection_cached_until_membership_changes(self):
+        selection = self.registry.select(ip="127.0.0.2")
+        self.assertIs(selection, self.registry.select(ip="127.0.0.2"))
+
+        del self.registry["model_2"]
+        self.assertEqual(["model_3"], self.model_ids(self.registry.select(ip="127.0.0.2")))
+
+        self.registry["model_4"] = model_runner("model_4", ip="127.0.0.2")
+        self.assertEqual(["model_3", "model_4"], self.model_ids(self.registry.select(ip="127.0.0.2")))
+
+    def test_update_infos_reindexes(self):
+        self.assertEqual(["model_3"], self.model_ids(self.registry.select(cruncher_hotkey="hotkey_2")))
+
+        self.registry.update_infos("model_1", {"cruncher_hotkey": "hotkey_2"}, "renamed")
+
+        self.assertEqual(["model_1", "model_3"], self.model_ids(self.registry.select(cruncher_hotkey="hotkey_2")))
+        self.assertEqual(["model_1"], self.model_ids(self.registry.select(model_name="renamed")))
+
+    def test_live_state_filters(self):
+        self.registry["model_2"].healthy = False
+
+        self.assertEqual(["model_1", "model_3"], self.model_ids(self.registry.select(healthy=True)))
+        self.assertEqual(["model_3"], self.model_ids(self.registry.select(healthy=True, where=lambda model: model.ip == "127.0.0.2")))
+
+    def test_selection_in_insertion_order(self):
+        self.registry["model_2"] = model_runner("model_2", ip="127.0.0.2")  # replaced, keeps its position
+        self.registry["model_0"] = model_runner("model_0", ip="127.0.0.2")
+
+        self.assertEqual(["model_2", "model_3", "model_0"], self.model_ids(self.registry.select(ip="127.0.0.2")))
+        self.assertEqual(list(self.registry), self.model_ids(self.registry.select(deployment_id="deployment_id_1")))
+
+    def test_latency_tier(self):
+        self.registry["model_2"].register_latency(50_000)
+        self.registry["model_3"].register_latency(2_000_000)
+        self.registry["model_3"].register_latency(1_000)
+
+        self.assertEqual(["model_1"], self.model_ids(self.registry.select(latency_tier=0)))
+        self.assertEqual(["model_2"], self.model_ids(self.registry.select(latency_tier=1)))
+        self.assertEqual(["model_3"], self.model_ids(self.registry.select(ip="127.0.0.2", latency_tier=3)))  # 1.6 s average
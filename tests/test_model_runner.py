@@ -3,7 +3,9 @@ from unittest.mock import ANY
 
 import pytest
 from grpc.aio import AioRpcError
+from model_runner_client.bootstrap_scheduler import BootstrapScheduler
 from model_runner_client.model_runners.model_runner import ModelRunner, InvalidCoordinatorUsageError
+from model_runner_client.model_runners.health_channel_registry import HealthChannelRegistry
 
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -43,6 +45,28 @@ class TestModelRunner(IsolatedAsyncioTestCase):
         self.assertFalse(success)
         self.assertEqual(error, ModelRunner.ErrorType.GRPC_CONNECTION_FAILED)
 
+    @patch('model_runner_client.model_runners.model_runner.grpc.aio.insecure_channel')
+    async def test_init_admission_per_attempt(self, mock_insecure_channel):
+        scheduler = BootstrapScheduler(max_concurrency=1)
+        held = []
+
+        def connect(*args, **kwargs):
+            held.append(scheduler.active)
+            raise asyncio.TimeoutError
+
+        mock_insecure_channel.side_effect = connect
+        self.runner.retry_backoff_factor = 0.01
+        backoff = asyncio.create_task(self.runner.init(admission=lambda: scheduler.slot(self.runner.model_id)))
+        await asyncio.sleep(0.005)  # first attempt failed, backing off
+
+        self.assertEqual(0, scheduler.active)
+        async with scheduler.slot("other_model"):
+            pass
+        await backoff
+
+        self.assertEqual([1] * self.runner.retry_attempts, held)
+        self.assertEqual(0, scheduler.active)
+
     @patch('model_runner_client.model_runners.model_runner.grpc.aio.insecure_channel')
     async def test_init_aborted(self, mock_insecure_channel):
         await self.runner.close()
@@ -78,3 +102,28 @@ class TestModelRunner(IsolatedAsyncioTestCase):
         success, error = await self.runner.init()
         self.assertFalse(success)
         self.assertEqual(error, ModelRunner.ErrorType.BAD_IMPLEMENTATION)
+
+    @patch('model_runner_client.model_runners.model_runner.grpc.aio.insecure_channel')
+    async def test_init_shared_health_channel(self, mock_insecure_channel):
+        mock_insecure_channel.return_value.channel_ready = AsyncMock(return_value=True)
+        mock_insecure_channel.return_value.close = AsyncMock()
+        registry = HealthChannelRegistry()
+
+        runners = [
+            ModelRunner(deployment_id="deployment_id_1", model_id=model_id, model_name="test_name", ip="127.0.0.1", port=5000, infos={}, health_channel_registry=registry)
+            for model_id in ("test_id_1", "test_id_2")
+        ]
+        for runner in runners:
+            runner.setup = AsyncMock(return_value=(True, None))
+            await runner.init()
+
+        # 2 main channels + 1 shared health channel
+        self.assertEqual(3, mock_insecure_channel.call_count)
+        self.assertEqual(1, len(registry))
+        self.assertIs(runners[0].grpc_health_channel, runners[1].grpc_health_channel)
+
+        await runners[0].close()
+        self.assertEqual(1, registry.ref_count(("insecure", "127.0.0.1:5000")))
+
+        await runners[1].close()
+        self.assertEqual(0, len(registry))
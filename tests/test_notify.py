@@ -0,0 +1,84 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from model_runner_client.model_concurrent_runners import DynamicSubclassModelConcurrentRunner, ModelPredictResult
+from model_runner_client.model_registry import ModelRegistry
+from model_runner_client.model_runners import ModelRunner
+
+
+class RecordingModelRunner(ModelRunner):
+    def __init__(self, model_id: str, latency: float = 0.0):
+        super().__init__("deployment_1", model_id, "model", "127.0.0.1", 5000, {})
+        self.latency = latency
+        self.received: list[tuple[str, bool]] = []  # (method name, decode_response) in arrival order
+        self.error = None
+
+    async def call(self, method_name, arguments=([], []), timeout=None, decode_response=True):
+        self.received.append((method_name, decode_response))
+        await asyncio.sleep(self.latency)
+        return (method_name if decode_response else None), self.error
+
+
+class TestNotify(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.patcher = patch("model_runner_client.model_concurrent_runners.model_concurrent_runner.ModelCluster")
+        self.addCleanup(self.patcher.stop)
+        self.mock_model_cluster = self.patcher.start().return_value
+
+        self.fast_model = RecordingModelRunner("fast")
+        self.slow_model = RecordingModelRunner("slow", latency=0.2)
+        self.mock_model_cluster.models_run = ModelRegistry()
+        self.mock_model_cluster.models_run.update({"fast": self.fast_model, "slow": self.slow_model})
+
+        self.concurrent_runner = DynamicSubclassModelConcurrentRunner(
+            10, "crunch", "localhost", 1234, "base.Class", max_pending_notifications=2, report_failure=False
+        )
+
+    async def test_notify_does_not_wait(self):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self.concurrent_runner.notify("tick")
+        self.assertLess(loop.time() - started, 0.05)
+
+        await asyncio.sleep(0.3)
+        self.assertEqual([("tick", False)], self.slow_model.received)
+        self.assertEqual(2, self.concurrent_runner.notification_stats.succeeded)
+        self.assertEqual({}, self.concurrent_runner._notifications)
+
+    async def test_call_is_sent_after_pending_notifications(self):
+        self.concurrent_runner.notify("tick")
+        self.concurrent_runner.notify("tick")
+        results = await self.concurrent_runner.call("predict")
+
+        self.assertEqual(["tick", "tick", "predict"], [method for method, _ in self.slow_model.received])
+        self.assertEqual("predict", results[self.slow_model].result)
+        self.assertLess(results[self.slow_model].exec_time_us, 300_000)  # the wait is not counted as the model's time
+
+    async def test_wait_for_notifications_counts_against_timeout(self):
+        self.concurrent_runner.notify("tick")
+        self.concurrent_runner.notify("tick")
+        results = await self.concurrent_runner.call("predict", timeout=0.3)
+
+        self.assertEqual(ModelPredictResult.Status.TIMEOUT, results[self.slow_model].status)
+        self.assertEqual(ModelPredictResult.Status.SUCCESS, results[self.fast_model].status)
+        self.assertNotIn("predict", [method for method, _ in self.slow_model.received])
+
+    async def test_too_many_pending_notifications_are_dropped(self):
+        for _ in range(3):
+            self.concurrent_runner.notify("tick", model_runs=[self.slow_model])
+
+        await asyncio.sleep(0.5)
+        self.assertEqual(2, len(self.slow_model.received))
+        self.assertEqual(1, self.concurrent_runner.notification_stats.dropped)
+
+    async def test_failures_are_accounted(self):
+        self.fast_model.error = ModelRunner.ErrorType.FAILED
+        self.concurrent_runner.notify("tick", model_runs=[self.fast_model])
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, self.concurrent_runner.notification_stats.failed)
+        self.assertEqual(1, self.fast_model.consecutive_failures)
+
+        results = await self.concurrent_runner.call("predict", model_runs=[self.fast_model])
+        self.assertEqual(ModelPredictResult.Status.FAILED, results[self.fast_model].status)
@@ -0,0 +1,145 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, patch
+
+from model_runner_client.grpc.generated.commons_pb2 import Argument, Variant, VariantType
+from model_runner_client.grpc.generated.dynamic_subclass_pb2 import CallRequest
+from model_runner_client.model_concurrent_runners import CachePolicy, DynamicSubclassModelConcurrentRunner, ModelPredictResult, ResultCache
+from model_runner_client.model_concurrent_runners.result_cache import arguments_key
+from model_runner_client.model_registry import ModelRegistry
+from model_runner_client.model_runners import ModelRunner
+
+
+def string_arguments(value: str):
+    return [Argument(position=1, data=Variant(type=VariantType.STRING, value=value.encode()))], []
+
+
+def make_runner(model_id: str, deployment_id: str = "deployment_1") -> ModelRunner:
+    model_runner = ModelRunner(deployment_id, model_id, "model", "127.0.0.1", 5000, {})
+    model_runner.call = AsyncMock(return_value=(f"result-{model_id}", None))
+    return model_runner
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.key = arguments_key(CallRequest(methodName="describe"))
+
+    def test_hit_and_miss(self):
+        cache = ResultCache()
+        model_runner = make_runner("model_1")
+
+        self.assertEqual((False, None), cache.get(model_runner, self.key))
+        cache.put(model_runner, self.key, "result")
+        self.assertEqual((True, "result"), cache.get(model_runner, self.key))
+        self.assertEqual((1, 1), (cache.stats.hits, cache.stats.misses))
+
+    def test_replaced_runner_is_a_miss(self):
+        cache = ResultCache()
+        cache.put(make_runner("model_1"), self.key, "result")
+
+        self.assertEqual((False, None), cache.get(make_runner("model_1"), self.key))
+        self.assertEqual(0, len(cache))
+        self.assertEqual(1, cache.stats.invalidations)
+
+    def test_lru_eviction(self):
+        cache = ResultCache(CachePolicy(max_entries=2))
+        model_runners = [make_runner(f"model_{index}") for index in range(3)]
+        cache.put(model_runners[0], self.key, 0)
+        cache.put(model_runners[1], self.key, 1)
+        cache.get(model_runners[0], self.key)  # model_1 becomes the least recently used
+        cache.put(model_runners[2], self.key, 2)
+
+        self.assertTrue(cache.get(model_runners[0], self.key)[0])
+        self.assertFalse(cache.get(model_runners[1], self.key)[0])
+        self.assertEqual(1, cache.stats.evictions)
+
+    def test_ttl_expiration(self):
+        cache = ResultCache(CachePolicy(ttl=10))
+        model_runner = make_runner("model_1")
+        with patch("model_runner_client.model_concurrent_runners.result_cache.time.monotonic", return_value=100):
+            cache.put(model_runner, self.key, "result")
+        with patch("model_runner_client.model_concurrent_runners.result_cache.time.monotonic", return_value=109):
+            self.assertTrue(cache.get(model_runner, self.key)[0])
+        with patch("model_runner_client.model_concurrent_runners.result_cache.time.monotonic", return_value=110):
+            self.assertFalse(cache.get(model_runner, self.key)[0])
+
+    def test_key_depends_on_arguments(self):
+        args, kwargs = string_arguments("a")
+        other_args, _ = string_arguments("b")
+        key = arguments_key(CallRequest(methodName="describe", methodArguments=args, methodKwArguments=kwargs))
+
+        self.assertEqual(key, arguments_key(CallRequest(methodName="describe", methodArguments=args)))
+        self.assertNotEqual(key, arguments_key(CallRequest(methodName="describe", methodArguments=other_args)))
+        self.assertNotEqual(key, arguments_key(CallRequest(methodName="predict", methodArguments=args)))
+
+
+class TestCachedCalls(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.patcher = patch("model_runner_client.model_concurrent_runners.model_concurrent_runner.ModelCluster")
+        self.addCleanup(self.patcher.stop)
+        self.mock_model_cluster = self.patcher.start().return_value
+
+        self.model_runner_1 = make_runner("model_1")
+        self.model_runner_2 = make_runner("model_2")
+        self.mock_model_cluster.models_run = ModelRegistry()
+        self.mock_model_cluster.models_run.update({"model_1": self.model_runner_1, "model_2": self.model_runner_2})
+
+        self.concurrent_runner = DynamicSubclassModelConcurrentRunner(
+            10, "crunch", "localhost", 1234, "base.Class", cached_methods={"describe": CachePolicy()}
+        )
+
+    async def test_cached_models_are_not_called(self):
+        results = await self.concurrent_runner.call("describe", string_arguments("a"))
+        self.assertEqual(ModelPredictResult.Status.SUCCESS, results[self.model_runner_1].status)
+
+        results = await self.concurrent_runner.call("describe", string_arguments("a"))
+        self.assertEqual(1, self.model_runner_1.call.await_count)
+        self.assertEqual(ModelPredictResult.Status.CACHED, results[self.model_runner_1].status)
+        self.assertEqual("result-model_1", results[self.model_runner_1].result)
+        self.assertEqual(0, results[self.model_runner_1].exec_time_us)
+        self.assertEqual(self.mock_model_cluster.models_run.version, results.snapshot_version)
+
+        await self.concurrent_runner.call("describe", string_arguments("b"))
+        self.assertEqual(2, self.model_runner_1.call.await_count)
+
+    async def test_uncached_methods_and_failures_are_called(self):
+        await self.concurrent_runner.call("predict", string_arguments("a"))
+        await self.concurrent_runner.call("predict", string_arguments("a"))
+        self.assertEqual(2, self.model_runner_1.call.await_count)
+
+        self.model_runner_2.call.return_value = (None, ModelRunner.ErrorType.FAILED)
+        await self.concurrent_runner.call("describe", string_arguments("a"))
+        results = await self.concurrent_runner.call("describe", string_arguments("a"))
+        self.assertEqual(4, self.model_runner_2.call.await_count)  # 2 predict + 2 describe
+        self.assertEqual(ModelPredictResult.Status.FAILED, results[self.model_runner_2].status)
+
+    async def test_replaced_runner_is_called(self):
+        await self.concurrent_runner.call("describe", string_arguments("a"))
+
+        replacement = make_runner("model_1")
+        self.mock_model_cluster.models_run["model_1"] = replacement
+        results = await self.concurrent_runner.call("describe", string_arguments("a"))
+
+        self.assertEqual(1, replacement.call.await_count)
+        self.assertEqual(ModelPredictResult.Status.SUCCESS, results[replacement].status)
+        self.assertEqual(ModelPredictResult.Status.CACHED, results[self.model_runner_2].status)
+
+    async def test_per_model_arguments(self):
+        arguments = lambda model_runner: string_arguments(model_runner.model_id)
+        await self.concurrent_runner.call("describe", arguments)
+        await self.concurrent_runner.call("describe", arguments)
+        self.assertEqual(1, self.model_runner_1.call.await_count)
+
+        self.concurrent_runner.invalidate_cache("describe", "model_1")
+        results = await self.concurrent_runner.call("describe", arguments)
+        self.assertEqual(ModelPredictResult.Status.SUCCESS, results[self.model_runner_1].status)
+        self.assertEqual(ModelPredictResult.Status.CACHED, results[self.model_runner_2].status)
+
+    async def test_per_model_arguments_built_once(self):
+        built = []
+        arguments = lambda model_runner: built.append(model_runner.model_id) or string_arguments(model_runner.model_id)
+
+        await self.concurrent_runner.call("describe", arguments)
+        sent_arguments = self.model_runner_1.call.await_args.args[1]
+
+        self.assertEqual(string_arguments("model_1"), sent_arguments(self.model_runner_1))
+        self.assertEqual(["model_1", "model_2"], sorted(built))
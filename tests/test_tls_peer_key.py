@@ -0,0 +1,70 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from model_runner_client.security.tls_peer_key import PeerKeyCache, PeerTlsRsaKey, TlsProbeError
+
+PEER_TLS = PeerTlsRsaKey(leaf_cert_pem=b"cert", spki_der=b"spki")
+KEY = ("127.0.0.1", 5000, "model-node-1")
+
+
+class TestPeerKeyCache(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache = PeerKeyCache(ttl=10)
+        self.tls_ctx = MagicMock()
+
+    async def fetch(self):
+        return await self.cache.fetch("127.0.0.1", 5000, tls_ctx=self.tls_ctx, server_hostname="model-node-1")
+
+    @patch("model_runner_client.security.tls_peer_key.fetch_peer_rsa_spki_mtls", new_callable=AsyncMock)
+    async def test_probe_once(self, mock_fetch):
+        mock_fetch.return_value = PEER_TLS
+
+        results = await asyncio.gather(self.fetch(), self.fetch())
+        results.append(await self.fetch())
+
+        self.assertEqual([PEER_TLS] * 3, results)
+        mock_fetch.assert_awaited_once()
+        self.assertEqual(1, self.cache.hits)
+
+    @patch("model_runner_client.security.tls_peer_key.fetch_peer_rsa_spki_mtls", new_callable=AsyncMock)
+    async def test_invalidate(self, mock_fetch):
+        mock_fetch.return_value = PEER_TLS
+
+        await self.fetch()
+        self.cache.invalidate(KEY)
+        await self.fetch()
+
+        self.assertEqual(2, mock_fetch.await_count)
+
+    @patch("model_runner_client.security.tls_peer_key.fetch_peer_rsa_spki_mtls", new_callable=AsyncMock)
+    async def test_expired_entry(self, mock_fetch):
+        mock_fetch.return_value = PEER_TLS
+        self.cache.ttl = 0
+
+        await self.fetch()
+        await self.fetch()
+
+        self.assertEqual(2, mock_fetch.await_count)
+
+    @patch("model_runner_client.security.tls_peer_key.fetch_peer_rsa_spki_mtls", new_callable=AsyncMock)
+    async def test_stale_entry_refreshed_in_background(self, mock_fetch):
+        mock_fetch.return_value = PEER_TLS
+        self.cache.refresh_ratio = 0
+
+        await self.fetch()
+        self.assertEqual(PEER_TLS, await self.fetch())
+        await asyncio.sleep(0)
+
+        self.assertEqual(2, mock_fetch.await_count)
+        self.assertEqual(PEER_TLS, self.cache.get(KEY))
+
+    @patch("model_runner_client.security.tls_peer_key.fetch_peer_rsa_spki_mtls", new_callable=AsyncMock)
+    async def test_probe_error_not_cached(self, mock_fetch):
+        mock_fetch.side_effect = TlsProbeError("bad certificate")
+
+        with self.assertRaises(TlsProbeError):
+            await self.fetch()
+
+        self.assertIsNone(self.cache.get(KEY))
+        self.assertEqual(0, len(self.cache))
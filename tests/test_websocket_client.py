@@ -0,0 +1,92 @@
+import json
+from unittest import IsolatedAsyncioTestCase, skipIf
+from unittest.mock import AsyncMock
+
+from model_runner_client.utils import message_codec
+from model_runner_client.websocket_client import WebsocketClient
+
+
+def init_page(page, pages, model_ids):
+    return json.dumps({"event": "init", "data": [{"model_id": model_id} for model_id in model_ids], "page": page, "pages": pages})
+
+
+class TestWebsocketClient(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.event_handler = AsyncMock()
+        self.client = WebsocketClient("localhost", 9091, "crunch_id", event_handler=self.event_handler)
+        self.client.websocket = AsyncMock()
+
+    async def test_paged_init_read_until_last_page(self):
+        self.client.websocket.recv.side_effect = [
+            init_page(0, 3, ["model_1"]),
+            init_page(1, 3, ["model_2"]),
+            init_page(2, 3, ["model_3"]),
+            json.dumps({"event": "update", "data": []}),
+        ]
+
+        await self.client.init()
+
+        self.assertEqual(3, self.event_handler.await_count)
+        self.event_handler.assert_awaited_with("init", [{"model_id": "model_3"}], page=2, pages=3)
+
+    async def test_bytes_json_message(self):
+        await self.client.handle_event(json.dumps({"event": "update", "data": [{"model_id": "model_1"}]}).encode())
+
+        self.event_handler.assert_awaited_once_with("update", [{"model_id": "model_1"}])
+
+    async def test_undecodable_message_ignored(self):
+        self.assertIsNone(await self.client.handle_event("not json"))
+        self.assertIsNone(await self.client.handle_event(b"\x93\x01\x02\x03"))
+        self.event_handler.assert_not_called()
+
+    @skipIf(message_codec.msgpack is None, "msgpack is not installed")
+    async def test_msgpack_message(self):
+        message = message_codec.msgpack.packb({"event": "update", "data": [{"model_id": "model_1"}]})
+        await self.client.handle_event(message)
+
+        self.event_handler.assert_awaited_once_with("update", [{"model_id": "model_1"}])
+
+
+class TestWebsocketClientQueue(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = WebsocketClient("localhost", 9091, "crunch_id", max_merged_reports=3)
+        self.client.websocket = AsyncMock()
+
+    def sent(self) -> list[dict]:
+        return [json.loads(call.args[0]) for call in self.client.websocket.send.call_args_list]
+
+    async def test_queued_failure_reports_merged(self):
+        for message in (
+            {"event": "report_failure", "data": [{"model_id": "model_1"}]},
+            {"event": "report_failure", "data": [{"model_id": "model_2"}, {"model_id": "model_1"}]},
+            {"event": "other", "data": []},
+            {"event": "report_failure", "data": [{"model_id": "model_3"}, {"model_id": "model_4"}]},
+            {"event": "report_failure", "data": [{"model_id": "model_5"}, {"model_id": "model_6"}]},
+        ):
+            await self.client.send_message(json.dumps(message))
+        self.assertEqual(4, len(self.client.message_queue))  # nothing dropped, the adjacent reports are merged
+
+        await self.client._send_pending_messages()
+
+        sent = self.sent()
+        self.assertEqual(["report_failure", "other", "report_failure", "report_failure"], [message["event"] for message in sent])
+        self.assertEqual(["model_1", "model_2"], [report["model_id"] for report in sent[0]["data"]])
+        self.assertEqual(["model_3", "model_4", "model_5"], [report["model_id"] for report in sent[2]["data"]])
+        self.assertEqual(["model_6"], [report["model_id"] for report in sent[3]["data"]])
+        self.assertEqual(0, len(self.client.message_queue))
+
+    async def test_merged_reports_bounded(self):
+        for index in range(4):
+            await self.client.send_message(json.dumps({"event": "report_failure", "data": [{"model_id": f"model_{index}"}]}))
+        await self.client._send_pending_messages()
+
+        self.assertEqual([3, 1], [len(message["data"]) for message in self.sent()])
+
+    async def test_unsent_messages_kept_in_order(self):
+        for event in ("first", "second"):
+            await self.client.send_message(json.dumps({"event": event}))
+        self.client.websocket.send.side_effect = [None, ConnectionError()]
+
+        with self.assertRaises(ConnectionError):
+            await self.client._send_pending_messages()
+        self.assertEqual([json.dumps({"event": "second"})], list(self.client.message_queue))